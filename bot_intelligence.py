@@ -1,31 +1,191 @@
 """Advanced bot intelligence using Claude API for strategic decision making."""
+import asyncio
+import atexit
 import os
-from typing import List, Tuple, Optional
+import re
+import time
+from typing import Iterator, List, Tuple, Optional
 from dotenv import load_dotenv
+from hand_evaluator import HandEvaluator, HandRank
+from poker_cards import FULL_DECK
 
 # Load environment variables
 load_dotenv()
 
+# Maximum number of cached decisions kept per advisor
+DECISION_CACHE_SIZE = 4096
+
+# Seconds between status checks while a message batch is processing
+BATCH_POLL_INTERVAL = 5.0
+# Seconds to wait for a message batch before cancelling it
+BATCH_TIMEOUT = 3600.0
+
+# Fold trash preflop when the call is more than this many minimum raises
+TRASH_FOLD_MULTIPLIER = {"easy": 2, "medium": 3, "hard": 4}
+
+# Card objects by their display string (e.g. "A♠"), for reading game states
+_CARDS_BY_NAME = {str(card): card for card in FULL_DECK}
+
+# "anthropic" (default) or "bedrock" to route decisions through AWS Bedrock
+CLAUDE_BACKEND = os.getenv("CLAUDE_BACKEND", "anthropic").lower()
+
+# Bedrock model IDs for the models used below
+BEDROCK_MODELS = {
+    "claude-3-5-haiku-20241022": "us.anthropic.claude-3-5-haiku-20241022-v1:0",
+    "claude-sonnet-4-20250514": "us.anthropic.claude-sonnet-4-20250514-v1:0",
+}
+
 # Check if Anthropic API is available
 try:
     import anthropic
-    ANTHROPIC_AVAILABLE = bool(os.getenv("ANTHROPIC_API_KEY"))
+    import httpx
+    if CLAUDE_BACKEND == "bedrock":
+        # Bedrock authenticates with the usual AWS credential chain, through
+        # boto3 (pip install "anthropic[bedrock]")
+        import boto3
+        try:
+            ANTHROPIC_AVAILABLE = boto3.Session().get_credentials() is not None
+        except Exception:  # e.g. AWS_PROFILE names a profile that doesn't exist
+            ANTHROPIC_AVAILABLE = False
+    else:
+        ANTHROPIC_AVAILABLE = bool(os.getenv("ANTHROPIC_API_KEY"))
 except ImportError:
     ANTHROPIC_AVAILABLE = False
 
 
+# Difficulty-specific personality and skill level
+_PERSONALITY = {
+    "easy": """You are a BEGINNER poker player with LIMITED poker knowledge:
+- You play very cautiously and passively
+- You mostly play only premium hands (pairs 9+, AK, AQ)
+- You rarely bluff or make aggressive plays
+- You often fold to any significant bet
+- You don't understand advanced concepts like implied odds or position
+- You call too much with weak hands when pot odds are bad
+- You're risk-averse and prefer to see cheap flops""",
+
+    "medium": """You are an INTERMEDIATE poker player with SOLID fundamentals:
+- You understand and apply pot odds and hand equity
+- You play a balanced range based on position
+- You can semi-bluff with drawing hands
+- You adjust bet sizing based on hand strength and board texture
+- You recognize obvious patterns but miss subtle tells
+- You play ABC poker - straightforward and predictable
+- You understand when to value bet and when to fold""",
+
+    "hard": """You are an ADVANCED poker player with EXPERT-level skills:
+- You expertly calculate pot odds, implied odds, and fold equity
+- You use position aggressively and apply maximum pressure
+- You recognize board textures and adjust strategy accordingly
+- You balance your ranges to remain unpredictable
+- You bluff strategically with blockers and good timing
+- You thin value bet and can make hero calls/folds
+- You exploit opponent tendencies and adjust dynamically
+- You understand ICM, range advantage, and advanced concepts""",
+}
+
+# "ACTION: raise AMOUNT: 50" line in a decision response
+_RE_DECISION = re.compile(r'ACTION:\s*\[?(\w+)\]?(?:\s*AMOUNT:\s*\[?\$?(\d[\d,]*))?', re.IGNORECASE)
+
+# Matches once a streamed reply has a complete amount (digits then something else)
+_RE_DECISION_DONE = re.compile(r'AMOUNT:\s*\[?\$?\d[\d,]*[^\d,]', re.IGNORECASE)
+
+# Safe action when a reply can't be parsed; never cached, so a retry can do better
+_FALLBACK_DECISION = ("check", 0)
+
+# Instructions and examples that follow the situation in every prompt
+_STATIC_TAIL = """
+Analyze this situation and decide your action. Consider:
+1. Hand strength and potential
+2. Pot odds and implied odds
+3. Position and opponent behavior
+4. Your table image and strategy
+
+Respond with ONLY one line in this exact format:
+ACTION: [fold/call/check/raise] AMOUNT: [number]
+
+Examples:
+- "ACTION: fold AMOUNT: 0"
+- "ACTION: call AMOUNT: 0"
+- "ACTION: raise AMOUNT: 50"
+- "ACTION: check AMOUNT: 0"
+"""
+
+
 class ClaudePokerAdvisor:
     """Uses Claude API to provide strategic poker advice."""
 
     def __init__(self):
         self.client = None
+        self.aclient = None  # Made per event loop by _async_client
+        self._http = None
+        self._ahttp = None
+        self._aloop = None  # Event loop that aclient and _ahttp belong to
+        self._api_key = None
+        self._decision_cache = {}
+        self._batches = {}  # batch_id -> (game_states, difficulty)
         if ANTHROPIC_AVAILABLE:
             try:
-                self.client = anthropic.Anthropic(api_key=os.getenv("ANTHROPIC_API_KEY"))
+                self._api_key = os.getenv("ANTHROPIC_API_KEY")
+                # Keep-alive pool so repeated decisions skip the TCP/TLS handshake
+                self._http = httpx.Client(
+                    limits=httpx.Limits(max_keepalive_connections=10, max_connections=20,
+                                        keepalive_expiry=60)
+                )
+                if CLAUDE_BACKEND == "bedrock":
+                    self.client = anthropic.AnthropicBedrock(http_client=self._http)
+                else:
+                    self.client = anthropic.Anthropic(api_key=self._api_key, http_client=self._http)
             except Exception as e:
                 print(f"Warning: Could not initialize Anthropic client: {e}")
                 self.client = None
 
+    def _async_client(self):
+        """
+        Return the async client for the running event loop, or None if the API
+        is unavailable. An httpx.AsyncClient's pool belongs to the loop it first
+        ran on and each asyncio.run() starts a new one, so a client is made per loop.
+        """
+        if not self.client:
+            return None
+        loop = asyncio.get_running_loop()
+        if self._aloop is not loop:
+            # Async client lets several bots wait on the network at once
+            self._ahttp = httpx.AsyncClient(
+                limits=httpx.Limits(max_keepalive_connections=20, max_connections=40)
+            )
+            if CLAUDE_BACKEND == "bedrock":
+                self.aclient = anthropic.AsyncAnthropicBedrock(http_client=self._ahttp)
+            else:
+                self.aclient = anthropic.AsyncAnthropic(api_key=self._api_key, http_client=self._ahttp)
+            self._aloop = loop
+        return self.aclient
+
+    async def aclose(self):
+        """Close the async connection pool. Call it from the loop that used it."""
+        if self._ahttp is not None:
+            await self._ahttp.aclose()
+        self._ahttp = None
+        self.aclient = None
+        self._aloop = None
+
+    def close(self):
+        """Close the pooled HTTP connections."""
+        if self._http is not None:
+            self._http.close()
+            self._http = None
+        self.client = None
+        # The async pool can only be closed from its own loop (see aclose)
+        self._ahttp = None
+        self.aclient = None
+        self._aloop = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
     def get_decision(self, game_state: dict, difficulty: str) -> Optional[Tuple[str, int]]:
         """
         Get a strategic decision from Claude API.
@@ -50,6 +210,219 @@ class ClaudePokerAdvisor:
         if not self.client:
             return None
 
+        # Obvious spots don't need the API
+        trivial = self._trivial_action(game_state, difficulty)
+        if trivial is not None:
+            return trivial
+
+        # Identical situations get the same answer without another API call
+        key = self._state_key(game_state, difficulty)
+        cached = self._decision_cache.get(key)
+        if cached is not None:
+            return cached
+
+        params = self._request_params(game_state, difficulty)
+
+        try:
+            # Stream the reply and stop reading once the amount is complete
+            response_text = ""
+            with self.client.messages.stream(**params) as stream:
+                for text in stream.text_stream:
+                    response_text += text
+                    if _RE_DECISION_DONE.search(response_text):
+                        break
+
+            # Parse the response
+            decision = self._parse_response(response_text.strip(), game_state)
+            if decision is None:
+                return _FALLBACK_DECISION
+            self._cache_decision(key, decision)
+            return decision
+
+        except Exception as e:
+            print(f"Claude API error: {e}")
+            return None
+
+    async def aget_decision(self, game_state: dict, difficulty: str) -> Optional[Tuple[str, int]]:
+        """
+        Async version of get_decision.
+
+        Takes the same arguments and returns the same result, but awaits the
+        API call so decisions for several bots can be in flight together.
+        """
+        aclient = self._async_client()
+        if not aclient:
+            return None
+
+        trivial = self._trivial_action(game_state, difficulty)
+        if trivial is not None:
+            return trivial
+
+        key = self._state_key(game_state, difficulty)
+        cached = self._decision_cache.get(key)
+        if cached is not None:
+            return cached
+
+        params = self._request_params(game_state, difficulty)
+
+        try:
+            response_text = ""
+            async with aclient.messages.stream(**params) as stream:
+                async for text in stream.text_stream:
+                    response_text += text
+                    if _RE_DECISION_DONE.search(response_text):
+                        break
+
+            decision = self._parse_response(response_text.strip(), game_state)
+            if decision is None:
+                return _FALLBACK_DECISION
+            self._cache_decision(key, decision)
+            return decision
+
+        except Exception as e:
+            print(f"Claude API error: {e}")
+            return None
+
+    def submit_batch(self, states: List[dict], difficulty: str) -> Optional[str]:
+        """
+        Submit decisions for many game states as one Message Batch.
+
+        Batches cost about half as much as individual calls but may take a
+        while to finish, so use them for simulations and self-play rather
+        than live hands.
+
+        Args:
+            states: List of game_state dicts (see get_decision)
+            difficulty: "easy", "medium", or "hard"
+
+        Returns:
+            Batch ID to pass to poll_batch, or None if unavailable
+        """
+        # Message Batches are an Anthropic API feature, not a Bedrock one
+        if not self.client or CLAUDE_BACKEND == "bedrock":
+            return None
+
+        requests = []
+        for i, game_state in enumerate(states):
+            params = self._request_params(game_state, difficulty)
+            requests.append({"custom_id": str(i), "params": params})
+
+        try:
+            batch = self.client.messages.batches.create(requests=requests)
+        except Exception as e:
+            print(f"Claude API error: {e}")
+            return None
+
+        self._batches[batch.id] = (states, difficulty)
+        return batch.id
+
+    def poll_batch(self, batch_id: str, interval: float = BATCH_POLL_INTERVAL,
+                   timeout: float = BATCH_TIMEOUT) -> Iterator[Tuple[int, Optional[Tuple[str, int]]]]:
+        """
+        Wait for a batch to finish and yield its decisions.
+
+        Args:
+            batch_id: ID returned by submit_batch
+            interval: Seconds to sleep between status checks
+            timeout: Seconds to wait before cancelling the batch and raising
+                TimeoutError from the iterator
+
+        Yields:
+            (index, decision) pairs, where index is the position of the game
+            state in the submitted list and decision is None if it failed
+
+        Raises:
+            KeyError: batch_id did not come from submit_batch, or was already polled
+        """
+        # Claimed now rather than on the first next(), so a bad ID fails here
+        # and an iterator that is never consumed doesn't leave its entry behind
+        states, difficulty = self._batches.pop(batch_id)
+        return self._batch_decisions(batch_id, states, difficulty, interval, timeout)
+
+    def _batch_decisions(self, batch_id: str, states: List[dict], difficulty: str,
+                         interval: float, timeout: float) -> Iterator[Tuple[int, Optional[Tuple[str, int]]]]:
+        """Generator behind poll_batch."""
+        deadline = time.monotonic() + timeout
+        while self.client.messages.batches.retrieve(batch_id).processing_status != "ended":
+            if time.monotonic() >= deadline:
+                self.client.messages.batches.cancel(batch_id)
+                raise TimeoutError(f"batch {batch_id} not finished after {timeout:g}s")
+            time.sleep(interval)
+
+        for result in self.client.messages.batches.results(batch_id):
+            index = int(result.custom_id)
+            if result.result.type != "succeeded":
+                yield index, None
+                continue
+
+            game_state = states[index]
+            response_text = result.result.message.content[0].text.strip()
+            decision = self._parse_response(response_text, game_state)
+            if decision is None:
+                yield index, _FALLBACK_DECISION
+                continue
+            self._cache_decision(self._state_key(game_state, difficulty), decision)
+            yield index, decision
+
+    @staticmethod
+    def _trivial_action(game_state: dict, difficulty: str) -> Optional[Tuple[str, int]]:
+        """
+        Return an action for clear-cut situations, or None if Claude should decide.
+
+        Covers being out of chips, folding weak offsuit hands to a big preflop
+        raise, and raising a made flush or better when the bet is small.
+        """
+        call_amount = game_state["current_bet"] - game_state["player_bet"]
+        chips = game_state["chips"]
+        min_raise = game_state["min_raise"]
+
+        if chips <= 0:
+            return ("fold", 0) if call_amount > 0 else ("check", 0)
+
+        hand = [_CARDS_BY_NAME[name] for name in game_state["hand"]]
+        community = [_CARDS_BY_NAME[name] for name in game_state["community_cards"]]
+
+        if not community:
+            # Unpaired, offsuit, both cards below nine
+            weak = (len(hand) == 2 and hand[0].rank != hand[1].rank
+                    and hand[0].suit != hand[1].suit
+                    and max(card.rank.value for card in hand) < 9)
+            if weak and call_amount > TRASH_FOLD_MULTIPLIER.get(difficulty, 3) * min_raise:
+                return ("fold", 0)
+            return None
+
+        if len(hand) + len(community) >= 5 and call_amount <= 0.1 * game_state["pot"]:
+            rank, _ = HandEvaluator.evaluate_hand(hand + community)
+            if rank >= HandRank.FLUSH:
+                amount = min(min_raise * 3, chips - call_amount)
+                if amount >= min_raise:
+                    return ("raise", amount)
+
+        return None
+
+    @staticmethod
+    def _state_key(game_state: dict, difficulty: str) -> tuple:
+        """Build a hashable, order-independent key for a game state."""
+        return (
+            tuple(sorted(game_state["hand"])),
+            tuple(sorted(game_state["community_cards"])),
+            game_state["pot"],
+            game_state["current_bet"],
+            game_state["player_bet"],
+            game_state["chips"],
+            game_state["min_raise"],
+            game_state["opponents"],
+            difficulty
+        )
+
+    def _cache_decision(self, key: tuple, decision: Tuple[str, int]):
+        """Store a decision, evicting the oldest entry when the cache is full."""
+        if len(self._decision_cache) >= DECISION_CACHE_SIZE:
+            del self._decision_cache[next(iter(self._decision_cache))]
+        self._decision_cache[key] = decision
+
+    def _request_params(self, game_state: dict, difficulty: str) -> dict:
+        """Build the messages.create/stream keyword arguments for a decision."""
         # Select model based on difficulty
         if difficulty == "easy":
             model = "claude-3-5-haiku-20241022"  # Cheaper, faster model for easy
@@ -64,24 +437,21 @@ class ClaudePokerAdvisor:
         # Build the prompt based on difficulty
         prompt = self._build_prompt(game_state, difficulty)
 
-        try:
-            # Call Claude API
-            message = self.client.messages.create(
-                model=model,
-                max_tokens=200,
-                temperature=temperature,
-                messages=[
-                    {"role": "user", "content": prompt}
-                ]
-            )
+        params = {
+            "model": model,
+            "max_tokens": 64,  # The answer is a single ~20 token line
+            "temperature": temperature,
+            "messages": [
+                {"role": "user", "content": prompt}
+            ]
+        }
 
-            # Parse the response
-            response_text = message.content[0].text.strip()
-            return self._parse_response(response_text, game_state)
+        if CLAUDE_BACKEND == "bedrock":
+            params["model"] = BEDROCK_MODELS.get(model, model)
+            # Ask Bedrock for its latency-optimized inference path
+            params["extra_headers"] = {"X-Amzn-Bedrock-PerformanceConfig-Latency": "optimized"}
 
-        except Exception as e:
-            print(f"Claude API error: {e}")
-            return None
+        return params
 
     def _build_prompt(self, game_state: dict, difficulty: str) -> str:
         """Build a prompt for Claude based on game state and difficulty."""
@@ -99,99 +469,40 @@ class ClaudePokerAdvisor:
         pot_after_call = pot + call_amount if call_amount > 0 else pot
         pot_odds = f"{pot_after_call / call_amount:.1f}:1" if call_amount > 0 else "N/A"
 
-        # Difficulty-specific personality and skill level
-        if difficulty == "easy":
-            personality = """You are a BEGINNER poker player with LIMITED poker knowledge:
-- You play very cautiously and passively
-- You mostly play only premium hands (pairs 9+, AK, AQ)
-- You rarely bluff or make aggressive plays
-- You often fold to any significant bet
-- You don't understand advanced concepts like implied odds or position
-- You call too much with weak hands when pot odds are bad
-- You're risk-averse and prefer to see cheap flops"""
-
-        elif difficulty == "medium":
-            personality = """You are an INTERMEDIATE poker player with SOLID fundamentals:
-- You understand and apply pot odds and hand equity
-- You play a balanced range based on position
-- You can semi-bluff with drawing hands
-- You adjust bet sizing based on hand strength and board texture
-- You recognize obvious patterns but miss subtle tells
-- You play ABC poker - straightforward and predictable
-- You understand when to value bet and when to fold"""
-
-        else:  # hard
-            personality = """You are an ADVANCED poker player with EXPERT-level skills:
-- You expertly calculate pot odds, implied odds, and fold equity
-- You use position aggressively and apply maximum pressure
-- You recognize board textures and adjust strategy accordingly
-- You balance your ranges to remain unpredictable
-- You bluff strategically with blockers and good timing
-- You thin value bet and can make hero calls/folds
-- You exploit opponent tendencies and adjust dynamically
-- You understand ICM, range advantage, and advanced concepts"""
-
-        prompt = f"""{personality}
-
-Current poker situation:
-- Your hand: {hand}
-- Community cards: {community}
-- Pot: ${pot}
-- Current bet: ${current_bet}
-- Your current bet: ${player_bet}
-- Amount to call: ${call_amount}
-- Your chips: ${chips}
-- Pot odds: {pot_odds}
-- Minimum raise: ${min_raise}
-- Active opponents: {opponents}
-
-Analyze this situation and decide your action. Consider:
-1. Hand strength and potential
-2. Pot odds and implied odds
-3. Position and opponent behavior
-4. Your table image and strategy
-
-Respond with ONLY one line in this exact format:
-ACTION: [fold/call/check/raise] AMOUNT: [number]
-
-Examples:
-- "ACTION: fold AMOUNT: 0"
-- "ACTION: call AMOUNT: 0"
-- "ACTION: raise AMOUNT: 50"
-- "ACTION: check AMOUNT: 0"
-"""
-        return prompt
-
-    def _parse_response(self, response: str, game_state: dict) -> Tuple[str, int]:
-        """Parse Claude's response into action and amount."""
+        return "\n".join((
+            _PERSONALITY.get(difficulty, _PERSONALITY["hard"]),
+            "",
+            "Current poker situation:",
+            f"- Your hand: {hand}",
+            f"- Community cards: {community}",
+            f"- Pot: ${pot}",
+            f"- Current bet: ${current_bet}",
+            f"- Your current bet: ${player_bet}",
+            f"- Amount to call: ${call_amount}",
+            f"- Your chips: ${chips}",
+            f"- Pot odds: {pot_odds}",
+            f"- Minimum raise: ${min_raise}",
+            f"- Active opponents: {opponents}",
+            _STATIC_TAIL
+        ))
+
+    def _parse_response(self, response: str, game_state: dict) -> Optional[Tuple[str, int]]:
+        """Parse Claude's response into action and amount, or None if it has no decision."""
         try:
             # Extract action and amount from response
-            lines = response.upper().split('\n')
-            action_line = None
-
-            for line in lines:
-                if 'ACTION:' in line:
-                    action_line = line
-                    break
-
-            if not action_line:
-                return ("check", 0)  # Default safe action
+            match = _RE_DECISION.search(response)
+            if not match:
+                return None
 
             # Parse action
-            action_part = action_line.split('ACTION:')[1].split('AMOUNT:')[0].strip().lower()
+            action_part = match.group(1).lower()
 
             # Validate action
             if action_part not in ["fold", "call", "check", "raise"]:
                 action_part = "check"
 
             # Parse amount
-            amount = 0
-            if 'AMOUNT:' in action_line:
-                amount_str = action_line.split('AMOUNT:')[1].strip()
-                try:
-                    amount = int(''.join(filter(str.isdigit, amount_str)))
-                except:
-                    amount = 0
+            amount = int(match.group(2).replace(",", "")) if match.group(2) else 0
 
             # Validate amount
             chips = game_state["chips"]
@@ -212,19 +523,43 @@ Examples:
 
         except Exception as e:
             print(f"Error parsing Claude response: {e}")
-            return ("check", 0)  # Safe fallback
+            return None
 
 
 # Global instance
 _advisor = None
 
 
-def get_claude_decision(game_state: dict, difficulty: str) -> Optional[Tuple[str, int]]:
-    """Get a decision from Claude API (singleton pattern)."""
+def _get_advisor() -> ClaudePokerAdvisor:
+    """Return the process-wide advisor, creating it on first use."""
     global _advisor
     if _advisor is None:
         _advisor = ClaudePokerAdvisor()
-    return _advisor.get_decision(game_state, difficulty)
+        atexit.register(_advisor.close)
+    return _advisor
+
+
+def get_claude_decision(game_state: dict, difficulty: str) -> Optional[Tuple[str, int]]:
+    """Get a decision from Claude API (singleton pattern)."""
+    return _get_advisor().get_decision(game_state, difficulty)
+
+
+async def aget_claude_decision(game_state: dict, difficulty: str) -> Optional[Tuple[str, int]]:
+    """Async version of get_claude_decision (shares the same advisor)."""
+    return await _get_advisor().aget_decision(game_state, difficulty)
+
+
+async def gather_decisions(states: List[Tuple[dict, str]]) -> List[Optional[Tuple[str, int]]]:
+    """
+    Get decisions for several bots concurrently.
+
+    Args:
+        states: List of (game_state, difficulty) pairs, one per bot
+
+    Returns:
+        Decisions in the same order as states (None where the API failed)
+    """
+    return await asyncio.gather(*[aget_claude_decision(s, d) for s, d in states])
 
 
 def is_claude_available() -> bool:
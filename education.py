@@ -1,10 +1,34 @@
 """Educational component for poker learning."""
+from collections import defaultdict
 from typing import List, Dict, Optional, Tuple
 from poker_cards import Card, Rank, Suit
-from hand_evaluator import HandEvaluator
+from hand_evaluator import HandEvaluator, HandRank
+import ast
+import operator
 import re
 
 
+# Arithmetic allowed in typed answers such as "4+9" or "(47-9)/9"
+_BINARY_OPS = {
+    ast.Add: operator.add,
+    ast.Sub: operator.sub,
+    ast.Mult: operator.mul,
+    ast.Div: operator.truediv,
+}
+_UNARY_OPS = {
+    ast.UAdd: operator.pos,
+    ast.USub: operator.neg,
+}
+
+# Patterns used to read typed answers
+_RE_FILLER = re.compile(r'percent|%|outs')
+_RE_NUMBER = re.compile(r'-?\d+\.?\d*')
+_RE_RATIO = re.compile(r'(\d+\.?\d*)\s*:\s*1')
+
+# Numeric value of each rank's display string, for sorting outs by rank
+_DISPLAY_TO_VALUE = {r.display: r.value for r in Rank}
+
+
 class PokerEducation:
     """Handles educational questions and answer evaluation."""
 
@@ -133,21 +157,27 @@ class PokerEducation:
     def _extract_number(text: str) -> Optional[float]:
         """Extract a number from text, including evaluating equations."""
         # Remove common words
-        text = text.replace("percent", "").replace("%", "").replace("outs", "").strip()
+        text = _RE_FILLER.sub("", text).strip()
 
         # Try to evaluate as a mathematical expression
-        try:
-            # Only allow safe mathematical operations
-            allowed_chars = set('0123456789+-*/(). ')
-            if all(c in allowed_chars for c in text):
-                result = eval(text, {"__builtins__": {}}, {})
-                if isinstance(result, (int, float)):
-                    return float(result)
-        except:
-            pass
+        # Only allow safe mathematical operations
+        allowed_chars = set('0123456789+-*/(). ')
+        if all(c in allowed_chars for c in text):
+            # Plain numbers are by far the most common answer
+            try:
+                return float(text)
+            except ValueError:
+                pass
+
+            try:
+                tree = ast.parse(text, mode="eval")
+                return float(PokerEducation._evaluate_arithmetic(tree.body))
+            except (SyntaxError, ValueError, ZeroDivisionError, RecursionError,
+                    OverflowError, MemoryError):
+                pass
 
         # Try to find a single number
-        match = re.search(r'-?\d+\.?\d*', text)
+        match = _RE_NUMBER.search(text)
         if match:
             try:
                 return float(match.group())
@@ -155,11 +185,24 @@ class PokerEducation:
                 return None
         return None
 
+    @staticmethod
+    def _evaluate_arithmetic(node: ast.AST) -> float:
+        """Evaluate a parsed expression made only of numbers and + - * /."""
+        if isinstance(node, ast.Constant) and type(node.value) in (int, float):
+            return node.value
+        if isinstance(node, ast.BinOp) and type(node.op) in _BINARY_OPS:
+            left = PokerEducation._evaluate_arithmetic(node.left)
+            right = PokerEducation._evaluate_arithmetic(node.right)
+            return _BINARY_OPS[type(node.op)](left, right)
+        if isinstance(node, ast.UnaryOp) and type(node.op) in _UNARY_OPS:
+            return _UNARY_OPS[type(node.op)](PokerEducation._evaluate_arithmetic(node.operand))
+        raise ValueError("Unsupported expression")
+
     @staticmethod
     def _extract_ratio(text: str) -> Optional[float]:
         """Extract a ratio from text (e.g., '3:1' or '3.5:1')."""
         # Look for pattern like "3:1" or "3.5:1"
-        match = re.search(r'(\d+\.?\d*)\s*:\s*1', text)
+        match = _RE_RATIO.search(text)
         if match:
             try:
                 return float(match.group(1))
@@ -180,15 +223,12 @@ class PokerEducation:
             result.append(f"\n[bold]{improvement}[/bold] ({len(cards)} outs):")
 
             # Group cards by rank
-            from collections import defaultdict
             by_rank = defaultdict(list)
             for card in cards:
                 by_rank[card.rank.display].append(card.suit.value)
 
             # Sort ranks by value (descending)
-            sorted_ranks = sorted(by_rank.items(),
-                                key=lambda x: next(r for r in cards if r.rank.display == x[0]).rank.value,
-                                reverse=True)
+            sorted_ranks = sorted(by_rank.items(), key=lambda x: -_DISPLAY_TO_VALUE[x[0]])
 
             for rank, suits in sorted_ranks:
                 suits_str = ", ".join(suits)
@@ -209,8 +249,6 @@ class PokerEducation:
     def get_recommendation(pot_odds_ratio: float, win_odds_ratio: float, pot_odds_str: str,
                           win_odds_str: str, hand_strength: int) -> str:
         """Get a recommendation for the player."""
-        from hand_evaluator import HandRank
-
         if hand_strength >= HandRank.THREE_OF_A_KIND:
             return "You have a strong hand! Consider betting or raising."
 
@@ -1,7 +1,7 @@
 """Poker hand evaluation logic."""
+from functools import lru_cache
 from typing import List, Tuple, Dict
-from collections import Counter
-from poker_cards import Card, Rank
+from poker_cards import Card, FULL_DECK
 
 
 class HandRank:
@@ -31,111 +31,206 @@ class HandRank:
     }
 
 
+# Multiplying a 13-bit rank mask by this copies it into all four suits
+_EVERY_SUIT = 1 | (1 << 13) | (1 << 26) | (1 << 39)
+
+# Number of tiebreakers packed into a hand value, by hand rank
+_TIEBREAKER_COUNTS = {1: 5, 2: 4, 3: 3, 4: 3, 5: 1, 6: 5, 7: 2, 8: 2, 9: 1, 10: 1}
+
+
+def _find_straight_high(rank_mask: int) -> int:
+    """
+    Return the high card of the best straight in a rank mask, or 0 if
+    there is none. A-2-3-4-5 (wheel) is 5-high.
+    """
+    # Shift up one and copy the ace into bit 0 so it can also play low
+    m = (rank_mask << 1) | (rank_mask >> 12)
+    runs = m & (m >> 1) & (m >> 2) & (m >> 3) & (m >> 4)
+    if not runs:
+        return 0
+    # Lowest bit of the top run sits at bit_length - 1; the run ends 4 higher
+    return runs.bit_length() + 4
+
+
+def _pack_top_five(rank_mask: int) -> int:
+    """Pack the top five ranks of a rank mask 4 bits each, zero-padded."""
+    value = 0
+    for _ in range(5):
+        value <<= 4
+        if rank_mask:
+            bit = rank_mask.bit_length() - 1
+            value |= bit + 2
+            rank_mask ^= 1 << bit
+    return value
+
+
+# Per-rank-mask lookup tables for evaluate_masks, 8192 entries each.
+# _TOP_FIVE[m] >> (4 * (5 - n)) gives the top n ranks of m.
+_STRAIGHT_HIGH = [_find_straight_high(m) for m in range(1 << 13)]
+_TOP_FIVE = [_pack_top_five(m) for m in range(1 << 13)]
+
+
+def evaluate_masks(s0: int, s1: int, s2: int, s3: int) -> int:
+    """
+    Evaluate 5 to 8 cards given as one rank mask per suit.
+
+    Returns a single int that orders hands the same way as comparing
+    (hand_rank, tiebreakers) tuples: the hand rank sits above 20 bits of
+    tiebreakers packed 4 bits each, highest priority first.
+    """
+    flush = 0
+    for suit_mask in (s0, s1, s2, s3):
+        if suit_mask.bit_count() >= 5:
+            high = _STRAIGHT_HIGH[suit_mask]
+            if high == 14:
+                return (HandRank.ROYAL_FLUSH << 20) | (14 << 16)
+            if high:
+                return (HandRank.STRAIGHT_FLUSH << 20) | (high << 16)
+            flush = (HandRank.FLUSH << 20) | _TOP_FIVE[suit_mask]
+            # With at most 7 cards, a flush rules out quads and a full house
+            if s0.bit_count() + s1.bit_count() + s2.bit_count() + s3.bit_count() <= 7:
+                return flush
+            break
+
+    # seenN has a bit set for every rank held at least N times
+    seen1 = s0 | s1 | s2 | s3
+    seen2 = (s0 & s1) | (s0 & s2) | (s0 & s3) | (s1 & s2) | (s1 & s3) | (s2 & s3)
+    seen3 = (s0 & s1 & (s2 | s3)) | (s2 & s3 & (s0 | s1))
+    seen4 = s0 & s1 & s2 & s3
+
+    # A single rank is bit_length + 1 (bit 0 is a two)
+    if seen4:
+        kicker = (seen1 & ~seen4).bit_length() + 1
+        return (HandRank.FOUR_OF_A_KIND << 20) | ((seen4.bit_length() + 1) << 16) | (kicker << 12)
+
+    trips = seen3
+    pairs = seen2 & ~seen3
+    singles = seen1 & ~seen2
+
+    if trips:
+        top_trips = trips.bit_length() + 1
+        rest = (trips & ~(1 << (top_trips - 2))) | pairs
+        if rest:
+            return (HandRank.FULL_HOUSE << 20) | (top_trips << 16) | ((rest.bit_length() + 1) << 12)
+
+    if flush:
+        return flush
+
+    high = _STRAIGHT_HIGH[seen1]
+    if high:
+        return (HandRank.STRAIGHT << 20) | (high << 16)
+
+    if trips:
+        return ((HandRank.THREE_OF_A_KIND << 20) | ((trips.bit_length() + 1) << 16)
+                | ((_TOP_FIVE[singles] >> 12) << 8))
+
+    if pairs:
+        if pairs & (pairs - 1):
+            # A third pair can still play as the kicker
+            top_two = _TOP_FIVE[pairs] >> 12
+            played = (1 << ((top_two >> 4) - 2)) | (1 << ((top_two & 0xF) - 2))
+            kicker = (seen1 & ~played).bit_length() + 1
+            return (HandRank.TWO_PAIR << 20) | (top_two << 12) | (kicker << 8)
+        return ((HandRank.PAIR << 20) | ((pairs.bit_length() + 1) << 16)
+                | ((_TOP_FIVE[singles] >> 8) << 4))
+
+    return (HandRank.HIGH_CARD << 20) | _TOP_FIVE[singles]
+
+
+@lru_cache(maxsize=1 << 16)
+def _evaluate_key(key: int) -> int:
+    """
+    Cached evaluate_masks for a hand key (see HandEvaluator._hand_key).
+    The key holds 13 rank bits per suit, so it is the same for any order
+    of the same cards.
+    """
+    return evaluate_masks(key & 0x1FFF, (key >> 13) & 0x1FFF, (key >> 26) & 0x1FFF, key >> 39)
+
+
+@lru_cache(maxsize=4096)
+def _count_outs(key: int) -> int:
+    """
+    Count the unseen cards that would raise the value of a 5 to 7 card hand
+    key, even just by a kicker. Cached because every bot on a street asks
+    about the same board, and again each time the betting reopens.
+    """
+    current = _evaluate_key(key)
+
+    # In a suit holding four or more of the cards the new card may make or
+    # change a flush, so each unseen card of that suit is evaluated. In any
+    # other suit the card plays only by its rank, so each rank is evaluated
+    # once and counts for every such suit it is unseen in.
+    outs = 0
+    rank_counts = [0] * 13
+    plain_bits = [0] * 13  # One unseen card of each rank from a non-flush suit
+    for i in range(4):
+        shift = 13 * i
+        held = (key >> shift) & 0x1FFF
+        unseen = ~held & 0x1FFF
+        if held.bit_count() >= 4:
+            while unseen:
+                rank_bit = unseen & -unseen
+                unseen ^= rank_bit
+                if _evaluate_key(key | (rank_bit << shift)) > current:
+                    outs += 1
+        else:
+            while unseen:
+                rank_bit = unseen & -unseen
+                unseen ^= rank_bit
+                rank = rank_bit.bit_length() - 1
+                rank_counts[rank] += 1
+                plain_bits[rank] = rank_bit << shift
+
+    for rank, count in enumerate(rank_counts):
+        if count and _evaluate_key(key | plain_bits[rank]) > current:
+            outs += count
+    return outs
+
+
+def unpack_hand_value(value: int) -> Tuple[int, List[int]]:
+    """Split a value from evaluate_masks into (hand_rank, tiebreakers)."""
+    hand_rank = value >> 20
+    tiebreakers = [(value >> shift) & 0xF for shift in (16, 12, 8, 4, 0)]
+    return (hand_rank, tiebreakers[:_TIEBREAKER_COUNTS[hand_rank]])
+
+
 class HandEvaluator:
     """Evaluates poker hands."""
 
     @staticmethod
     def evaluate_hand(cards: List[Card]) -> Tuple[int, List[int]]:
         """
-        Evaluate a poker hand.
+        Evaluate a poker hand of 5 to 8 cards, using the best five.
         Returns (hand_rank, tiebreakers) where tiebreakers are in descending priority.
         """
         if len(cards) < 5:
             raise ValueError("Need at least 5 cards to evaluate hand")
 
-        # For hands with more than 5 cards, find the best 5-card combination
-        if len(cards) > 5:
-            return HandEvaluator._best_five_card_hand(cards)
-
-        ranks = sorted([card.rank.value for card in cards], reverse=True)
-        suits = [card.suit for card in cards]
-        rank_counts = Counter(ranks)
-
-        is_flush = len(set(suits)) == 1
-        is_straight = HandEvaluator._is_straight(ranks)
-
-        # Check for Royal Flush
-        if is_flush and is_straight and min(ranks) == 10:
-            return (HandRank.ROYAL_FLUSH, [14])
-
-        # Check for Straight Flush
-        if is_flush and is_straight:
-            return (HandRank.STRAIGHT_FLUSH, [max(ranks)])
-
-        # Check for Four of a Kind
-        if 4 in rank_counts.values():
-            quad = [r for r, c in rank_counts.items() if c == 4][0]
-            kicker = [r for r, c in rank_counts.items() if c == 1][0]
-            return (HandRank.FOUR_OF_A_KIND, [quad, kicker])
-
-        # Check for Full House
-        if 3 in rank_counts.values() and 2 in rank_counts.values():
-            trips = [r for r, c in rank_counts.items() if c == 3][0]
-            pair = [r for r, c in rank_counts.items() if c == 2][0]
-            return (HandRank.FULL_HOUSE, [trips, pair])
-
-        # Check for Flush
-        if is_flush:
-            return (HandRank.FLUSH, ranks)
-
-        # Check for Straight
-        if is_straight:
-            return (HandRank.STRAIGHT, [max(ranks)])
-
-        # Check for Three of a Kind
-        if 3 in rank_counts.values():
-            trips = [r for r, c in rank_counts.items() if c == 3][0]
-            kickers = sorted([r for r, c in rank_counts.items() if c == 1], reverse=True)
-            return (HandRank.THREE_OF_A_KIND, [trips] + kickers)
-
-        # Check for Two Pair
-        pairs = [r for r, c in rank_counts.items() if c == 2]
-        if len(pairs) == 2:
-            pairs.sort(reverse=True)
-            kicker = [r for r, c in rank_counts.items() if c == 1][0]
-            return (HandRank.TWO_PAIR, pairs + [kicker])
-
-        # Check for Pair
-        if 2 in rank_counts.values():
-            pair = [r for r, c in rank_counts.items() if c == 2][0]
-            kickers = sorted([r for r, c in rank_counts.items() if c == 1], reverse=True)
-            return (HandRank.PAIR, [pair] + kickers)
-
-        # High Card
-        return (HandRank.HIGH_CARD, ranks)
+        return unpack_hand_value(_evaluate_key(HandEvaluator._hand_key(cards)))
 
     @staticmethod
-    def _is_straight(ranks: List[int]) -> bool:
-        """Check if ranks form a straight."""
-        sorted_ranks = sorted(set(ranks))
-        if len(sorted_ranks) != 5:
-            return False
-
-        # Check for regular straight
-        if sorted_ranks[-1] - sorted_ranks[0] == 4:
-            return True
-
-        # Check for A-2-3-4-5 (wheel)
-        if sorted_ranks == [2, 3, 4, 5, 14]:
-            return True
-
-        return False
+    def evaluate_packed(key: int) -> Tuple[int, List[int]]:
+        """
+        Like evaluate_hand, for 5 to 8 cards already packed into a hand key
+        (the OR of their Card.bit values).
+        """
+        return unpack_hand_value(_evaluate_key(key))
 
     @staticmethod
-    def _best_five_card_hand(cards: List[Card]) -> Tuple[int, List[int]]:
-        """Find the best 5-card hand from 6 or 7 cards."""
-        from itertools import combinations
-
-        best_rank = 0
-        best_tiebreakers = []
-
-        for combo in combinations(cards, 5):
-            rank, tiebreakers = HandEvaluator.evaluate_hand(list(combo))
-            if rank > best_rank or (rank == best_rank and tiebreakers > best_tiebreakers):
-                best_rank = rank
-                best_tiebreakers = tiebreakers
+    def count_outs(key: int) -> int:
+        """
+        Number of unseen cards that would improve the 5 to 7 cards packed in
+        key (the OR of their Card.bit values), counting kicker upgrades too.
+        """
+        return _count_outs(key)
 
-        return (best_rank, best_tiebreakers)
+    @staticmethod
+    def _hand_key(cards: List[Card]) -> int:
+        """Return a 52-bit int with one bit per card, grouped 13 bits per suit."""
+        key = 0
+        for card in cards:
+            key |= card.bit
+        return key
 
     @staticmethod
     def compare_hands(hand1: List[Card], hand2: List[Card]) -> int:
@@ -171,26 +266,61 @@ class HandEvaluator:
         Calculate outs for improving the hand.
         Returns a dict mapping improvement types to lists of out cards.
         """
-        from poker_cards import Deck, Suit, Rank
-
-        # Get all unknown cards
-        all_known = set(player_cards + community_cards + known_cards)
-        deck_cards = [Card(rank, suit) for suit in Suit for rank in Rank]
-        unknown_cards = [c for c in deck_cards if c not in all_known]
-
         current_hand = player_cards + community_cards
-        current_rank, _ = HandEvaluator.evaluate_hand(current_hand) if len(current_hand) >= 5 else (0, [])
 
         outs = {}
-
-        for card in unknown_cards:
-            test_hand = current_hand + [card]
-            if len(test_hand) >= 5:
-                new_rank, _ = HandEvaluator.evaluate_hand(test_hand)
-                if new_rank > current_rank:
-                    improvement = HandRank.NAMES[new_rank]
-                    if improvement not in outs:
-                        outs[improvement] = []
-                    outs[improvement].append(card)
+        if len(current_hand) < 4:
+            return outs
+
+        # Everything below works on the 52-bit hand key; each candidate is
+        # just one more bit OR-ed in
+        hand_key = HandEvaluator._hand_key(current_hand)
+        known_key = hand_key | HandEvaluator._hand_key(known_cards)
+        current_rank = _evaluate_key(hand_key) >> 20 if len(current_hand) >= 5 else 0
+
+        suit_masks = [(hand_key >> (13 * i)) & 0x1FFF for i in range(4)]
+        flush_draws = [mask.bit_count() >= 4 for mask in suit_masks]
+
+        # With five or more cards already, a new card can only move the hand
+        # up a category by pairing a held rank, completing a straight, or
+        # completing a flush. Anything else just changes a kicker.
+        if len(current_hand) >= 5:
+            rank_mask = suit_masks[0] | suit_masks[1] | suit_masks[2] | suit_masks[3]
+            useful_ranks = rank_mask
+            for bit in range(13):
+                if _STRAIGHT_HIGH[rank_mask | (1 << bit)]:
+                    useful_ranks |= 1 << bit
+        else:
+            useful_ranks = (1 << 13) - 1
+
+        # Only two buckets of cards can be outs: useful ranks in any suit and
+        # any card of a suit we could flush in. Select both with bit masks so
+        # no other card is looked at.
+        candidates = useful_ranks * _EVERY_SUIT
+        for index in range(4):
+            if flush_draws[index]:
+                candidates |= 0x1FFF << (13 * index)
+        candidates &= ~known_key
+
+        # A card's suit only matters if it could complete a flush, so cards of
+        # the same rank in the other suits all score the same. Evaluate each
+        # such class once instead of once per card.
+        class_ranks = {}
+
+        while candidates:
+            card_bit = candidates & -candidates
+            candidates ^= card_bit
+            position = card_bit.bit_length() - 1
+            index, rank = divmod(position, 13)
+            key = (rank, index if flush_draws[index] else None)
+            new_rank = class_ranks.get(key)
+            if new_rank is None:
+                new_rank = _evaluate_key(hand_key | card_bit) >> 20
+                class_ranks[key] = new_rank
+            if new_rank > current_rank:
+                improvement = HandRank.NAMES[new_rank]
+                if improvement not in outs:
+                    outs[improvement] = []
+                outs[improvement].append(FULL_DECK[position])
 
         return outs
@@ -1,7 +1,328 @@
 """LLM-based answer evaluation with reasoning."""
-from typing import Tuple, Dict, List
+from typing import Tuple, Dict, List, Optional
 from poker_cards import Card
+from education import PokerEducation
+from functools import lru_cache
+import asyncio
+import hashlib
 import json
+import os
+import re
+import time
+
+# anthropic is optional; LLM evaluation is skipped without it
+try:
+    import anthropic
+    _HAS_ANTHROPIC = True
+except ImportError:
+    _HAS_ANTHROPIC = False
+
+try:
+    from rich.prompt import Prompt
+except ImportError:
+    Prompt = None
+
+
+# grade_batch sends answers as a Message Batch once at least this many need
+# the LLM, checking for completion every BATCH_POLL_INTERVAL seconds
+BATCH_MIN_SIZE = 4
+BATCH_POLL_INTERVAL = 5.0
+# Seconds grade_batch waits for a batch before cancelling it
+BATCH_TIMEOUT = 3600.0
+
+# Sonnet does the open-ended evaluation; the judge only checks arithmetic and
+# emits a short JSON verdict, so a faster, cheaper model is enough for it.
+# Grading runs at temperature 0 so the same answer always gets the same
+# verdict; the tutor chat keeps the default temperature for some variety.
+EVAL_MODEL = "claude-3-5-sonnet-20241022"
+JUDGE_MODEL = os.environ.get("POKER_JUDGE_MODEL", "claude-3-5-haiku-20241022")
+CHAT_MODEL = os.environ.get("POKER_CHAT_MODEL", "claude-3-5-sonnet-20241022")
+
+
+# Instructions that are the same for every question of a type. They go first
+# in each prompt, marked for prompt caching, so only the per-hand details
+# after them change between calls.
+STATIC_PREAMBLE_OUTS = """You are a poker professor evaluating a student's answer about OUTS.
+
+QUESTION: How many outs do you have?
+
+IMPORTANT CONSIDERATIONS:
+1. The student may have given reasoning (e.g., "I think it's 5 because opponent might have a flush")
+2. An "out" is only valid if it improves YOUR hand more than opponents
+3. If the student suspects opponents have certain hands, some outs might not be real outs
+4. The student should consider what hands opponents might have based on betting patterns
+5. A card that completes your straight but gives opponent a flush is NOT a valid out
+
+TASK:
+1. Extract the number from the student's answer (may include math like "3+4")
+2. Read their reasoning if provided
+3. Evaluate if their reasoning about opponent hands is sound
+4. If they reasoned well about opponents having better hands, they might be MORE correct than the simple count
+5. Provide feedback that teaches proper out counting
+
+Respond with detailed evaluation explaining whether their reasoning is sound."""
+
+STATIC_PREAMBLE_POT_ODDS = """You are a poker professor evaluating a student's answer about POT ODDS.
+
+QUESTION: What are the pot odds? (Format: X:1)
+
+TASK:
+1. Extract the ratio from their answer
+2. Check if the calculation is correct (allow small rounding differences)
+3. If they showed their work, verify it
+4. Provide feedback
+
+Respond with evaluation."""
+
+STATIC_PREAMBLE_WIN_ODDS = """You are a poker professor evaluating a student's answer about WIN ODDS.
+
+QUESTION: What are your odds to win? (Format: X:1)
+
+TASK:
+1. Extract the ratio from their answer
+2. Check if the calculation is correct
+3. If they showed their work, verify it
+4. Provide feedback
+
+Respond with evaluation."""
+
+STATIC_JUDGE_RULES = """You are a poker professor reviewing another AI's evaluation of a student's answer.
+
+Your task:
+1. Verify the mathematical calculations are correct
+2. Check if the reasoning about outs is sound (remember: outs that help opponent more than you should be reconsidered)
+3. Provide final judgment: CORRECT or INCORRECT
+4. Give concise feedback to the student
+
+Respond in JSON format:
+{
+    "is_correct": true/false,
+    "feedback": "Brief feedback to student",
+    "reasoning": "Your detailed reasoning"
+}"""
+
+# Appended to an evaluation prompt when one call does both evaluation and review
+STATIC_SELF_CHECK = """
+
+Before grading, review your own evaluation:
+1. Verify the mathematical calculations are correct
+2. Check if the reasoning about outs is sound (remember: outs that help opponent more than you should be reconsidered)
+3. Decide the final judgment: CORRECT or INCORRECT
+
+Report the result with the grade tool: whether the answer is correct, brief feedback to the student, and your detailed reasoning."""
+
+# Tool that forces the verdict into a fixed JSON shape
+GRADE_TOOL = {
+    "name": "grade",
+    "description": "Record the final grade for the student's answer.",
+    "input_schema": {
+        "type": "object",
+        "properties": {
+            "is_correct": {"type": "boolean"},
+            "feedback": {"type": "string", "description": "Brief feedback to student"},
+            "reasoning": {"type": "string", "description": "Your detailed reasoning"}
+        },
+        "required": ["is_correct", "feedback", "reasoning"]
+    }
+}
+
+STATIC_TUTOR_SYSTEM = """You are a helpful poker professor. The student just answered questions about a poker situation, described below.
+
+Answer the student's questions about poker strategy, outs, odds, and hand evaluation. Be concise but thorough.
+Remember: opponent's possible hands matter when counting outs!"""
+
+
+def _cached_content(static: str, dynamic: str) -> List[Dict]:
+    """Content blocks with the static prefix marked for prompt caching."""
+    return [
+        {"type": "text", "text": static, "cache_control": {"type": "ephemeral"}},
+        {"type": "text", "text": dynamic}
+    ]
+
+
+# Answers with no reasoning attached, which can be graded without the LLM
+_NUM_RE = re.compile(r'^\s*(-?\d+(?:\.\d+)?)\s*$')
+_ARITH_RE = re.compile(r'^\s*(\d+(?:\s*[+\-]\s*\d+)+)\s*$')
+_RATIO_RE = re.compile(r'^\s*(\d+(?:\.\d+)?)\s*[:/]\s*1\s*$')
+
+# Reads one JSON value from a given start index (see _first_json_object)
+_DEC = json.JSONDecoder()
+
+# Allowed difference when grading a bare ratio answer
+RATIO_TOLERANCE = 0.1
+
+
+def _grade_bare_answer(question_type: str, user_answer: str,
+                       correct_value: any) -> Optional[Tuple[bool, str, str]]:
+    """Grade a bare number or ratio locally; None if the answer needs the LLM."""
+    if question_type == "outs":
+        bare = _NUM_RE.match(user_answer) or _ARITH_RE.match(user_answer)
+    elif question_type in ("pot_odds", "win_odds"):
+        bare = _RATIO_RE.match(user_answer)
+    else:
+        bare = None
+
+    if not bare:
+        return None
+
+    is_correct, feedback = PokerEducation.evaluate_answer(
+        question_type, user_answer, correct_value, tolerance=RATIO_TOLERANCE
+    )
+    return (is_correct, feedback, "")
+
+
+def _first_json_object(text: str) -> Optional[Dict]:
+    """Return the first complete {...} object in text, or None if none parses yet."""
+    # One linear parse from each candidate "{" rather than a backtracking regex
+    start = text.find("{")
+    while start != -1:
+        try:
+            result, _ = _DEC.raw_decode(text, start)
+            return result
+        except json.JSONDecodeError:
+            start = text.find("{", start + 1)
+    return None
+
+
+# Replies that end the tutor chat
+_EXIT_WORDS = frozenset({"exit", "quit", "done", "continue"})
+
+# Tutor chat keeps only the last MAX_CHAT_TURNS exchanges verbatim; older
+# ones are folded into a short summary by a cheaper model
+MAX_CHAT_TURNS = 4
+CHAT_SUMMARY_MODEL = "claude-3-5-haiku-20241022"
+
+# Context fields the judge uses, with the short labels used in its prompt
+_JUDGE_CONTEXT_FIELDS = (
+    ("player_hand", "hand"),
+    ("community_cards", "board"),
+    ("stage", "stage"),
+    ("pot", "pot"),
+    ("call_amount", "call"),
+    ("total_outs", "outs"),
+    ("unknown_cards", "unknown"),
+)
+
+
+def _compact_context(context: Dict) -> str:
+    """One-line summary of the context for the judge, e.g. 'hand=A♥,K♦|board=Q♠,J♥,2♣|stage=Flop'."""
+    values = []
+    for key, _ in _JUDGE_CONTEXT_FIELDS:
+        value = context.get(key)
+        if key == "total_outs" and value is None and "outs_dict" in context:
+            value = sum(len(cards) for cards in context["outs_dict"].values())
+        values.append(tuple(value) if isinstance(value, list) else value)
+    return _format_compact_context(tuple(values))
+
+
+@lru_cache(maxsize=256)
+def _format_compact_context(values: tuple) -> str:
+    """Format the values picked by _compact_context (cached per situation)."""
+    parts = []
+    for (_, label), value in zip(_JUDGE_CONTEXT_FIELDS, values):
+        if value is None:
+            continue
+        if isinstance(value, tuple):
+            value = ",".join(str(c) for c in value)
+        parts.append(f"{label}={value}")
+    return "|".join(parts)
+
+
+def _context_strings(context: Dict) -> Tuple[str, str, str]:
+    """Hand, board and outs breakdown text for a context (cached per situation)."""
+    outs = tuple((improvement, tuple(cards))
+                 for improvement, cards in context.get("outs_dict", {}).items())
+    return _format_context_strings(tuple(context.get("player_hand", [])),
+                                   tuple(context.get("community_cards", [])), outs)
+
+
+@lru_cache(maxsize=256)
+def _format_context_strings(player_hand: tuple, community_cards: tuple,
+                            outs: tuple) -> Tuple[str, str, str]:
+    """Format the values picked by _context_strings."""
+    hand_str = ", ".join(str(c) for c in player_hand)
+    comm_str = ", ".join(str(c) for c in community_cards)
+    outs_breakdown = "".join(f"- {improvement}: {', '.join(str(c) for c in cards)}\n"
+                             for improvement, cards in outs)
+    return hand_str, comm_str, outs_breakdown
+
+
+# Evaluations of identical answers are reused (grading runs at temperature 0);
+# set POKER_LLM_CACHE=0 to always ask the LLM again
+LLM_CACHE_ENABLED = os.environ.get("POKER_LLM_CACHE", "1") != "0"
+LLM_CACHE_TTL = 3600  # seconds
+LLM_CACHE_SIZE = 1024
+
+# sha256 key -> (timestamp, (is_correct, feedback, reasoning))
+_evaluation_cache = {}
+
+
+def _evaluation_key(question_type: str, user_answer: str, correct_value: any, context: Dict) -> str:
+    """Hash a question, its context and the normalized answer into a cache key."""
+    canonical = json.dumps([question_type, user_answer.strip().lower(), correct_value, context],
+                           sort_keys=True, default=str)
+    return hashlib.sha256(canonical.encode("utf-8")).hexdigest()
+
+
+def _get_cached_evaluation(key: str) -> Optional[Tuple[bool, str, str]]:
+    """Return a cached evaluation that has not expired, or None."""
+    if not LLM_CACHE_ENABLED:
+        return None
+    entry = _evaluation_cache.get(key)
+    if entry is None:
+        return None
+    stored_at, result = entry
+    if time.time() - stored_at > LLM_CACHE_TTL:
+        del _evaluation_cache[key]
+        return None
+    return result
+
+
+def _cache_evaluation(key: str, result: Tuple[bool, str, str]):
+    """Store an evaluation, dropping expired entries and then the oldest when full."""
+    if not LLM_CACHE_ENABLED:
+        return
+    if len(_evaluation_cache) >= LLM_CACHE_SIZE:
+        now = time.time()
+        for old_key in [k for k, (t, _) in _evaluation_cache.items() if now - t > LLM_CACHE_TTL]:
+            del _evaluation_cache[old_key]
+        if len(_evaluation_cache) >= LLM_CACHE_SIZE:
+            del _evaluation_cache[next(iter(_evaluation_cache))]
+    _evaluation_cache[key] = (time.time(), result)
+
+
+# Shared clients, created on first use once an API key is available. A missing
+# key is not remembered, so one set later in the process is still picked up.
+_client = None
+# (event loop, AsyncAnthropic): the async client's connection pool belongs to the
+# loop it was first used on, and each asyncio.run() starts a new loop
+_async_client = (None, None)
+
+
+def _get_client():
+    """Return the shared Anthropic client, or None if no API key is set."""
+    global _client
+    if _client is None:
+        api_key = os.environ.get("ANTHROPIC_API_KEY")
+        if not api_key:
+            return None
+        _client = anthropic.Anthropic(api_key=api_key, max_retries=2)
+    return _client
+
+
+def _get_async_client():
+    """
+    Return the AsyncAnthropic client for the running event loop, or None if
+    no API key is set. Must be called from a coroutine.
+    """
+    global _async_client
+    loop = asyncio.get_running_loop()
+    if _async_client[0] is not loop:
+        api_key = os.environ.get("ANTHROPIC_API_KEY")
+        if not api_key:
+            return None
+        _async_client = (loop, anthropic.AsyncAnthropic(api_key=api_key, max_retries=2))
+    return _async_client[1]
 
 
 class LLMEvaluator:
@@ -12,259 +333,441 @@ class LLMEvaluator:
         question_type: str,
         user_answer: str,
         correct_value: any,
-        context: Dict
+        context: Dict,
+        strict: bool = False
     ) -> Tuple[bool, str, str]:
         """
         Evaluate answer using LLM with multi-step reasoning.
+        By default one call both evaluates and double-checks the answer; with
+        strict=True a second LLM judges the first one's evaluation.
         Returns (is_correct, feedback, reasoning)
         """
-        # Import anthropic here to avoid dependency if not installed
-        try:
-            import anthropic
-        except ImportError:
+        # Bare numbers and ratios don't need an LLM to grade
+        graded = _grade_bare_answer(question_type, user_answer, correct_value)
+        if graded is not None:
+            return graded
+
+        cache_key = _evaluation_key(question_type, user_answer, correct_value, context)
+        cached = _get_cached_evaluation(cache_key)
+        if cached is not None:
+            return cached
+
+        if not _HAS_ANTHROPIC:
             return (False, "LLM evaluation not available. Install: pip install anthropic", "")
 
-        import os
-        api_key = os.environ.get("ANTHROPIC_API_KEY")
-        if not api_key:
+        client = _get_client()
+        if client is None:
             return (False, "ANTHROPIC_API_KEY not set in environment", "")
 
-        client = anthropic.Anthropic(api_key=api_key)
-
         # Build evaluation prompt
-        if question_type == "outs":
-            prompt = LLMEvaluator._build_outs_prompt(user_answer, correct_value, context)
-        elif question_type == "pot_odds":
-            prompt = LLMEvaluator._build_pot_odds_prompt(user_answer, correct_value, context)
-        elif question_type == "win_odds":
-            prompt = LLMEvaluator._build_win_odds_prompt(user_answer, correct_value, context)
-        else:
+        prompt = LLMEvaluator._build_prompt(question_type, user_answer, correct_value, context)
+        if prompt is None:
             return (False, "Unknown question type", "")
 
-        # First LLM: Evaluate the answer
         try:
+            if not strict:
+                # One call: Claude checks its own work and reports through the grade tool
+                response = client.messages.create(**LLMEvaluator._grade_params(prompt))
+                result = LLMEvaluator._parse_grade_response(response)
+                _cache_evaluation(cache_key, result)
+                return result
+
+            # First LLM: Evaluate the answer
             response1 = client.messages.create(
-                model="claude-3-5-sonnet-20241022",
-                max_tokens=2000,
+                model=EVAL_MODEL,
+                temperature=0,
+                max_tokens=800,  # Only read by the judge
                 messages=[{"role": "user", "content": prompt}]
             )
 
             evaluation = response1.content[0].text
 
             # Second LLM: Judge the first LLM's evaluation
-            judge_prompt = f"""You are a poker professor reviewing an evaluation. The student gave this answer:
-"{user_answer}"
+            judge_prompt = LLMEvaluator._build_judge_prompt(user_answer, evaluation, context)
+
+            # Stop streaming as soon as the verdict JSON is complete
+            judge_text = ""
+            with client.messages.stream(
+                model=JUDGE_MODEL,
+                temperature=0,
+                max_tokens=512,
+                messages=[{"role": "user", "content": judge_prompt}]
+            ) as stream:
+                for text in stream.text_stream:
+                    judge_text += text
+                    if "}" in text and _first_json_object(judge_text) is not None:
+                        break
 
-Another AI evaluated it as:
-{evaluation}
+            result = LLMEvaluator._parse_judge_response(judge_text, evaluation)
+            _cache_evaluation(cache_key, result)
+            return result
 
-Your task:
-1. Verify the mathematical calculations are correct
-2. Check if the reasoning about outs is sound (remember: outs that help opponent more than you should be reconsidered)
-3. Provide final judgment: CORRECT or INCORRECT
-4. Give concise feedback to the student
+        except Exception as e:
+            return (False, f"LLM evaluation error: {str(e)}", "")
 
-Context:
-{json.dumps(context, indent=2)}
+    @staticmethod
+    async def evaluate_answer_with_llm_async(
+        question_type: str,
+        user_answer: str,
+        correct_value: any,
+        context: Dict,
+        strict: bool = False
+    ) -> Tuple[bool, str, str]:
+        """
+        Async version of evaluate_answer_with_llm.
+        Returns (is_correct, feedback, reasoning)
+        """
+        # Bare numbers and ratios don't need an LLM to grade
+        graded = _grade_bare_answer(question_type, user_answer, correct_value)
+        if graded is not None:
+            return graded
 
-Respond in JSON format:
-{{
-    "is_correct": true/false,
-    "feedback": "Brief feedback to student",
-    "reasoning": "Your detailed reasoning"
-}}"""
+        cache_key = _evaluation_key(question_type, user_answer, correct_value, context)
+        cached = _get_cached_evaluation(cache_key)
+        if cached is not None:
+            return cached
 
-            response2 = client.messages.create(
-                model="claude-3-5-sonnet-20241022",
-                max_tokens=2000,
-                messages=[{"role": "user", "content": judge_prompt}]
+        if not _HAS_ANTHROPIC:
+            return (False, "LLM evaluation not available. Install: pip install anthropic", "")
+
+        client = _get_async_client()
+        if client is None:
+            return (False, "ANTHROPIC_API_KEY not set in environment", "")
+
+        prompt = LLMEvaluator._build_prompt(question_type, user_answer, correct_value, context)
+        if prompt is None:
+            return (False, "Unknown question type", "")
+
+        try:
+            if not strict:
+                response = await client.messages.create(**LLMEvaluator._grade_params(prompt))
+                result = LLMEvaluator._parse_grade_response(response)
+                _cache_evaluation(cache_key, result)
+                return result
+
+            response1 = await client.messages.create(
+                model=EVAL_MODEL,
+                temperature=0,
+                max_tokens=800,
+                messages=[{"role": "user", "content": prompt}]
             )
 
-            judge_text = response2.content[0].text
-
-            # Parse JSON response
-            # Extract JSON from response (might be wrapped in markdown)
-            import re
-            json_match = re.search(r'\{.*\}', judge_text, re.DOTALL)
-            if json_match:
-                result = json.loads(json_match.group())
-                return (
-                    result.get("is_correct", False),
-                    result.get("feedback", "Evaluation completed"),
-                    result.get("reasoning", evaluation)
-                )
-            else:
-                return (False, judge_text, evaluation)
+            evaluation = response1.content[0].text
+
+            # The judge needs the first evaluation, so this call stays sequential
+            judge_prompt = LLMEvaluator._build_judge_prompt(user_answer, evaluation, context)
+
+            judge_text = ""
+            async with client.messages.stream(
+                model=JUDGE_MODEL,
+                temperature=0,
+                max_tokens=512,
+                messages=[{"role": "user", "content": judge_prompt}]
+            ) as stream:
+                async for text in stream.text_stream:
+                    judge_text += text
+                    if "}" in text and _first_json_object(judge_text) is not None:
+                        break
+
+            result = LLMEvaluator._parse_judge_response(judge_text, evaluation)
+            _cache_evaluation(cache_key, result)
+            return result
 
         except Exception as e:
             return (False, f"LLM evaluation error: {str(e)}", "")
 
     @staticmethod
-    def _build_outs_prompt(user_answer: str, correct_value: int, context: Dict) -> str:
-        """Build prompt for outs evaluation."""
-        player_hand = context.get("player_hand", [])
-        community_cards = context.get("community_cards", [])
-        outs_dict = context.get("outs_dict", {})
+    async def evaluate_batch(questions: List[Tuple[str, str, any, Dict]]) -> List[Tuple[bool, str, str]]:
+        """
+        Evaluate several answers concurrently (e.g. outs, pot odds and win odds
+        for the same hand).
+
+        Args:
+            questions: List of (question_type, user_answer, correct_value, context)
+
+        Returns:
+            (is_correct, feedback, reasoning) for each question, in order
+        """
+        tasks = [asyncio.create_task(LLMEvaluator.evaluate_answer_with_llm_async(*q))
+                 for q in questions]
+        results = await asyncio.gather(*tasks, return_exceptions=True)
+        return [
+            (False, f"LLM evaluation error: {str(r)}", "") if isinstance(r, BaseException) else r
+            for r in results
+        ]
 
-        hand_str = ", ".join(str(c) for c in player_hand)
-        comm_str = ", ".join(str(c) for c in community_cards)
+    @staticmethod
+    def grade_batch(questions: List[Tuple[str, str, any, Dict]],
+                    interval: float = BATCH_POLL_INTERVAL,
+                    timeout: float = BATCH_TIMEOUT) -> List[Tuple[bool, str, str]]:
+        """
+        Grade many answers as one Message Batch.
 
-        outs_breakdown = ""
-        for improvement, cards in outs_dict.items():
-            cards_str = ", ".join(str(c) for c in cards)
-            outs_breakdown += f"- {improvement}: {cards_str}\n"
+        Batches cost about half as much as individual calls but can take
+        minutes to finish, so use this for replays and bulk grading rather
+        than live play. When fewer than BATCH_MIN_SIZE answers need the LLM
+        they are graded concurrently with evaluate_batch instead.
 
-        return f"""You are a poker professor evaluating a student's answer about OUTS.
+        Args:
+            questions: List of (question_type, user_answer, correct_value, context)
+            interval: Seconds to sleep between batch status checks
+            timeout: Seconds to wait for the batch before cancelling it and
+                reporting the unfinished answers as errors
 
-CONTEXT:
+        Returns:
+            (is_correct, feedback, reasoning) for each question, in order
+        """
+        results = [None] * len(questions)
+        pending = []
+        for i, (question_type, user_answer, correct_value, context) in enumerate(questions):
+            graded = _grade_bare_answer(question_type, user_answer, correct_value)
+            if graded is None:
+                graded = _get_cached_evaluation(
+                    _evaluation_key(question_type, user_answer, correct_value, context))
+            if graded is None:
+                pending.append(i)
+            else:
+                results[i] = graded
+
+        client = _get_client() if _HAS_ANTHROPIC else None
+        if len(pending) < BATCH_MIN_SIZE or client is None:
+            graded = asyncio.run(LLMEvaluator.evaluate_batch([questions[i] for i in pending]))
+            for i, result in zip(pending, graded):
+                results[i] = result
+            return results
+
+        requests = []
+        for i in pending:
+            prompt = LLMEvaluator._build_prompt(*questions[i])
+            if prompt is None:
+                results[i] = (False, "Unknown question type", "")
+            else:
+                requests.append({"custom_id": str(i), "params": LLMEvaluator._grade_params(prompt)})
+
+        try:
+            batch = client.messages.batches.create(requests=requests)
+            deadline = time.monotonic() + timeout
+            while client.messages.batches.retrieve(batch.id).processing_status != "ended":
+                if time.monotonic() >= deadline:
+                    client.messages.batches.cancel(batch.id)
+                    raise TimeoutError(f"batch not finished after {timeout:g}s")
+                time.sleep(interval)
+
+            for entry in client.messages.batches.results(batch.id):
+                i = int(entry.custom_id)
+                if entry.result.type != "succeeded":
+                    results[i] = (False, f"LLM evaluation error: batch request {entry.result.type}", "")
+                    continue
+                results[i] = LLMEvaluator._parse_grade_response(entry.result.message)
+                _cache_evaluation(_evaluation_key(*questions[i]), results[i])
+        except Exception as e:
+            for i in pending:
+                if results[i] is None:
+                    results[i] = (False, f"LLM evaluation error: {str(e)}", "")
+
+        return [r if r is not None else (False, "LLM evaluation error: no batch result", "")
+                for r in results]
+
+    @staticmethod
+    def _grade_params(prompt: List[Dict]) -> Dict:
+        """Request parameters for the single-call, tool-forced grade."""
+        return {
+            "model": EVAL_MODEL,
+            "temperature": 0,
+            "max_tokens": 1000,
+            "tools": [GRADE_TOOL],
+            "tool_choice": {"type": "tool", "name": "grade"},
+            "messages": [{"role": "user", "content": LLMEvaluator._add_self_check(prompt)}]
+        }
+
+    @staticmethod
+    def _build_prompt(question_type: str, user_answer: str, correct_value: any,
+                      context: Dict) -> Optional[List[Dict]]:
+        """Build the first-stage evaluation content blocks, or None for an unknown type."""
+        if question_type == "outs":
+            return _cached_content(STATIC_PREAMBLE_OUTS,
+                                   LLMEvaluator._build_outs_prompt(user_answer, correct_value, context))
+        elif question_type == "pot_odds":
+            return _cached_content(STATIC_PREAMBLE_POT_ODDS,
+                                   LLMEvaluator._build_pot_odds_prompt(user_answer, correct_value, context))
+        elif question_type == "win_odds":
+            return _cached_content(STATIC_PREAMBLE_WIN_ODDS,
+                                   LLMEvaluator._build_win_odds_prompt(user_answer, correct_value, context))
+        return None
+
+    @staticmethod
+    def _build_judge_prompt(user_answer: str, evaluation: str, context: Dict) -> List[Dict]:
+        """Build the content blocks asking the judge to review the first evaluation."""
+        return _cached_content(STATIC_JUDGE_RULES, f"""The student gave this answer:
+"{user_answer}"
+
+Another AI evaluated it as:
+{evaluation}
+
+Context:
+{_compact_context(context)}""")
+
+    @staticmethod
+    def _add_self_check(prompt: List[Dict]) -> List[Dict]:
+        """Append the self-check instructions to an evaluation prompt's cached prefix."""
+        return [dict(prompt[0], text=prompt[0]["text"] + STATIC_SELF_CHECK)] + prompt[1:]
+
+    @staticmethod
+    def _parse_grade_response(response) -> Tuple[bool, str, str]:
+        """Read (is_correct, feedback, reasoning) from a forced grade tool call."""
+        grade = next(block.input for block in response.content if block.type == "tool_use")
+        return (
+            bool(grade.get("is_correct", False)),
+            grade.get("feedback", "Evaluation completed"),
+            grade.get("reasoning", "")
+        )
+
+    @staticmethod
+    def _parse_judge_response(judge_text: str, evaluation: str) -> Tuple[bool, str, str]:
+        """Turn the judge's reply into (is_correct, feedback, reasoning)."""
+        # Parse JSON response
+        # Extract JSON from response (might be wrapped in markdown)
+        result = _first_json_object(judge_text)
+        if result is not None:
+            return (
+                result.get("is_correct", False),
+                result.get("feedback", "Evaluation completed"),
+                result.get("reasoning", evaluation)
+            )
+        else:
+            return (False, judge_text, evaluation)
+
+    @staticmethod
+    def _build_outs_prompt(user_answer: str, correct_value: int, context: Dict) -> str:
+        """Build the per-hand part of the outs evaluation prompt."""
+        hand_str, comm_str, outs_breakdown = _context_strings(context)
+
+        return f"""CONTEXT:
 - Player's hand: {hand_str}
 - Community cards: {comm_str}
 - Stage: {context.get('stage', 'Unknown')}
 
-QUESTION: How many outs do you have?
-
 CALCULATED OUTS (by simple counting): {correct_value}
 Breakdown:
 {outs_breakdown}
 
-STUDENT'S ANSWER: "{user_answer}"
-
-IMPORTANT CONSIDERATIONS:
-1. The student may have given reasoning (e.g., "I think it's 5 because opponent might have a flush")
-2. An "out" is only valid if it improves YOUR hand more than opponents
-3. If the student suspects opponents have certain hands, some outs might not be real outs
-4. The student should consider what hands opponents might have based on betting patterns
-5. A card that completes your straight but gives opponent a flush is NOT a valid out
-
-TASK:
-1. Extract the number from the student's answer (may include math like "3+4")
-2. Read their reasoning if provided
-3. Evaluate if their reasoning about opponent hands is sound
-4. If they reasoned well about opponents having better hands, they might be MORE correct than the simple count
-5. Provide feedback that teaches proper out counting
-
-Respond with detailed evaluation explaining whether their reasoning is sound."""
+STUDENT'S ANSWER: "{user_answer}\""""
 
     @staticmethod
     def _build_pot_odds_prompt(user_answer: str, correct_value: Tuple[float, str], context: Dict) -> str:
-        """Build prompt for pot odds evaluation."""
+        """Build the per-hand part of the pot odds evaluation prompt."""
         pot = context.get("pot", 0)
         call_amount = context.get("call_amount", 0)
         ratio, ratio_str = correct_value
 
-        return f"""You are a poker professor evaluating a student's answer about POT ODDS.
-
-CONTEXT:
+        return f"""CONTEXT:
 - Pot size: ${pot}
 - Amount to call: ${call_amount}
 
-QUESTION: What are the pot odds? (Format: X:1)
-
 CORRECT ANSWER: {ratio_str}
 Calculation: {pot} / {call_amount} = {ratio:.2f}:1
 
-STUDENT'S ANSWER: "{user_answer}"
-
-TASK:
-1. Extract the ratio from their answer
-2. Check if the calculation is correct (allow small rounding differences)
-3. If they showed their work, verify it
-4. Provide feedback
-
-Respond with evaluation."""
+STUDENT'S ANSWER: "{user_answer}\""""
 
     @staticmethod
     def _build_win_odds_prompt(user_answer: str, correct_value: Tuple[float, str], context: Dict) -> str:
-        """Build prompt for win odds evaluation."""
+        """Build the per-hand part of the win odds evaluation prompt."""
         total_outs = context.get("total_outs", 0)
         unknown_cards = context.get("unknown_cards", 0)
         ratio, ratio_str = correct_value
 
-        return f"""You are a poker professor evaluating a student's answer about WIN ODDS.
-
-CONTEXT:
+        return f"""CONTEXT:
 - Total outs: {total_outs}
 - Unknown cards remaining: {unknown_cards}
 
-QUESTION: What are your odds to win? (Format: X:1)
-
 CORRECT ANSWER: {ratio_str}
 Calculation: ({unknown_cards} - {total_outs}) / {total_outs} = {ratio:.2f}:1
 
-STUDENT'S ANSWER: "{user_answer}"
-
-TASK:
-1. Extract the ratio from their answer
-2. Check if the calculation is correct
-3. If they showed their work, verify it
-4. Provide feedback
-
-Respond with evaluation."""
+STUDENT'S ANSWER: "{user_answer}\""""
 
     @staticmethod
     def interactive_chat(context: Dict, ui) -> None:
         """Allow student to ask follow-up questions."""
-        try:
-            import anthropic
-        except ImportError:
+        if not _HAS_ANTHROPIC:
             ui.show_message("LLM chat not available. Install: pip install anthropic", "red")
             return
 
-        import os
-        api_key = os.environ.get("ANTHROPIC_API_KEY")
-        if not api_key:
+        client = _get_client()
+        if client is None:
             ui.show_message("ANTHROPIC_API_KEY not set in environment", "red")
             return
 
-        client = anthropic.Anthropic(api_key=api_key)
-
         # Build context for the conversation
-        player_hand = context.get("player_hand", [])
-        community_cards = context.get("community_cards", [])
-        outs_dict = context.get("outs_dict", {})
-
-        hand_str = ", ".join(str(c) for c in player_hand)
-        comm_str = ", ".join(str(c) for c in community_cards)
-
-        system_prompt = f"""You are a helpful poker professor. The student just answered questions about this poker situation:
+        hand_str, comm_str, outs_breakdown = _context_strings(context)
 
-Player's hand: {hand_str}
+        situation = f"""Player's hand: {hand_str}
 Community cards: {comm_str}
 Stage: {context.get('stage', 'Unknown')}
 
 Available outs:
-{json.dumps({k: [str(c) for c in v] for k, v in outs_dict.items()}, indent=2)}
+{outs_breakdown or "None"}"""
 
-Answer the student's questions about poker strategy, outs, odds, and hand evaluation. Be concise but thorough.
-Remember: opponent's possible hands matter when counting outs!"""
+        system_prompt = _cached_content(STATIC_TUTOR_SYSTEM, situation)
 
         conversation = []
+        summary = ""
 
         ui.show_message("\n[bold cyan]═══ Poker Tutor Chat ═══[/bold cyan]", "")
         ui.show_message("[dim]Ask questions about this hand, or type 'exit' to continue playing[/dim]\n", "")
 
         while True:
-            from rich.prompt import Prompt
             question = Prompt.ask("[cyan]You[/cyan]")
 
-            if question.lower() in ["exit", "quit", "done", "continue"]:
+            if question.lower() in _EXIT_WORDS:
                 break
 
             conversation.append({"role": "user", "content": question})
 
             try:
-                response = client.messages.create(
-                    model="claude-3-5-sonnet-20241022",
+                # Show the answer as it is generated
+                ui.show_message("[green]Tutor:[/green] ", "", end="")
+                chunks = []
+                with client.messages.stream(
+                    model=CHAT_MODEL,
                     max_tokens=1500,
                     system=system_prompt,
                     messages=conversation
-                )
+                ) as stream:
+                    for text in stream.text_stream:
+                        chunks.append(text)
+                        ui.show_text(text)
+                ui.show_message("\n", "")
 
-                answer = response.content[0].text
+                answer = "".join(chunks)
                 conversation.append({"role": "assistant", "content": answer})
 
-                ui.show_message(f"[green]Tutor:[/green] {answer}\n", "")
+                if len(conversation) > MAX_CHAT_TURNS * 2:
+                    dropped = conversation[:-MAX_CHAT_TURNS * 2]
+                    del conversation[:-MAX_CHAT_TURNS * 2]
+                    summary = LLMEvaluator._summarize_chat(client, summary, dropped)
+                    system_prompt = _cached_content(STATIC_TUTOR_SYSTEM, situation)
+                    if summary:
+                        system_prompt.append({"type": "text", "text": f"Earlier in this chat: {summary}"})
 
             except Exception as e:
                 ui.show_message(f"[red]Error: {str(e)}[/red]", "")
                 break
+
+    @staticmethod
+    def _summarize_chat(client, summary: str, dropped: List[Dict]) -> str:
+        """Fold turns dropped from the tutor chat into the running summary."""
+        transcript = "\n".join(f"{m['role']}: {m['content']}" for m in dropped)
+        if summary:
+            transcript = f"Previous summary: {summary}\n{transcript}"
+        try:
+            response = client.messages.create(
+                model=CHAT_SUMMARY_MODEL,
+                max_tokens=150,
+                messages=[{"role": "user", "content": (
+                    "Summarize this poker tutoring chat in at most two sentences, "
+                    "keeping any conclusions the student reached:\n\n" + transcript)}]
+            )
+            return response.content[0].text.strip()
+        except Exception:
+            # Keep the old summary; the chat itself still works without one
+            return summary
@@ -2,14 +2,32 @@
 import pygame
 import sys
 from typing import List, Optional, Tuple, Dict
+from functools import lru_cache
 from player import Player, AIBot
 from poker_game import PokerGame
-from poker_cards import Card, Rank, Suit
-from hand_evaluator import HandEvaluator
+from poker_cards import Card, Rank, Suit, FULL_DECK
+from hand_evaluator import HandEvaluator, HandRank
+from collections import deque
 import json
+import logging
 import os
+import random
 import time
 
+# Debug entries go to a bounded in-memory log (see export_debug_log) and to
+# this logger, which only writes anywhere when POKER_DEBUG is set
+DEBUG_LOG_SIZE = 5000
+
+# Actions kept for the history panel, and how many of the latest are shown
+ACTION_HISTORY_SIZE = 20
+HISTORY_LINES_SHOWN = 5
+logger = logging.getLogger("poker")
+logger.addHandler(logging.NullHandler())
+if os.environ.get("POKER_DEBUG"):
+    from logging.handlers import RotatingFileHandler
+    logger.addHandler(RotatingFileHandler("poker_debug.log", maxBytes=1_000_000, backupCount=3))
+    logger.setLevel(logging.DEBUG)
+
 # Initialize Pygame
 pygame.init()
 
@@ -37,20 +55,120 @@ FONT_MEDIUM = pygame.font.Font(None, 36)
 FONT_SMALL = pygame.font.Font(None, 24)
 FONT_TINY = pygame.font.Font(None, 20)
 
+# Fonts for cards drawn without an image
+FONT_CARD_RANK = pygame.font.Font(None, 28)
+FONT_CARD_SUIT = pygame.font.Font(None, 32)
+FONT_CARD_CENTER = pygame.font.Font(None, 60)
+
+# Top-row and keypad digit keys -> the digit typed. Looked up by name because
+# the keypad codes are not contiguous with K_0..K_9 (and K_KP0 follows K_KP9).
+_DIGIT_KEYS = {getattr(pygame, f"{prefix}{i}"): str(i)
+               for prefix in ("K_", "K_KP") for i in range(10)}
+
+@lru_cache(maxsize=512)
+def render_text(font: pygame.font.Font, text: str, color: Tuple[int, int, int]) -> pygame.Surface:
+    """Render antialiased text, reusing the surface for repeated (font, text, color).
+
+    The returned surface is shared, so blit it but don't draw onto it.
+    """
+    return font.render(text, True, color)
+
+
+@lru_cache(maxsize=None)
+def shade_surface(size: Tuple[int, int], alpha: int) -> pygame.Surface:
+    """A translucent black surface for overlays and shadows, built once per (size, alpha).
+
+    The returned surface is shared, so blit it but don't draw onto it.
+    """
+    surface = pygame.Surface(size).convert()
+    surface.fill(BLACK)
+    surface.set_alpha(alpha)
+    return surface
+
+
+@lru_cache(maxsize=None)
+def evaluation_panel(size: Tuple[int, int], show_outs: bool) -> pygame.Surface:
+    """The pot odds panel's box, title and labels, drawn once; only the values change."""
+    width, height = size
+    panel = pygame.Surface(size, pygame.SRCALPHA).convert_alpha()
+    pygame.draw.rect(panel, DARK_GREEN, (0, 0, width, height), border_radius=8)
+    pygame.draw.rect(panel, GOLD, (0, 0, width, height), 3, border_radius=8)
+
+    panel.blit(render_text(FONT_SMALL, "Pot Odds Analysis", GOLD), (10, 10))
+    panel.blit(render_text(FONT_TINY, "Pot Odds:", WHITE), (10, 45))
+    panel.blit(render_text(FONT_TINY, "Odds Against:", WHITE), (10, 75))
+    if show_outs:
+        panel.blit(render_text(FONT_TINY, "Outs:", WHITE), (10, 105))
+    return panel
+
+
+@lru_cache(maxsize=None)
+def card_back(size: Tuple[int, int]) -> pygame.Surface:
+    """A full-size face-down card, drawn once per size."""
+    width, height = size
+    back = pygame.Surface(size, pygame.SRCALPHA).convert_alpha()
+    pygame.draw.rect(back, WHITE, (0, 0, width, height), border_radius=8)
+    pygame.draw.rect(back, BLACK, (0, 0, width, height), 2, border_radius=8)
+    pygame.draw.rect(back, BLUE, (5, 5, width - 10, height - 10), border_radius=5)
+    # Add pattern
+    for i in range(3):
+        for j in range(4):
+            pygame.draw.circle(back, DARK_GREEN, (15 + i * 25, 15 + j * 30), 8)
+    return back
+
+
+@lru_cache(maxsize=None)
+def mini_card_back(size: Tuple[int, int]) -> pygame.Surface:
+    """A small face-down card for the bot panels, drawn once per size."""
+    width, height = size
+    back = pygame.Surface(size, pygame.SRCALPHA).convert_alpha()
+    pygame.draw.rect(back, BLUE, (0, 0, width, height), border_radius=3)
+    pygame.draw.rect(back, WHITE, (0, 0, width, height), 1, border_radius=3)
+    # Add a pattern to show it's face-down
+    pygame.draw.rect(back, LIGHT_GRAY, (3, 3, width - 6, height - 6), 1, border_radius=2)
+    return back
+
+
 # Card images cache
 CARD_IMAGES: Dict[str, pygame.Surface] = {}
 CARD_BACK_IMAGE: Optional[pygame.Surface] = None
 
-def load_card_images():
-    """Load all card images from PNG folder."""
-    global CARD_IMAGES, CARD_BACK_IMAGE
-
-    cards_path = "Playing Cards/Playing Cards/PNG-cards-1.3"
-
-    if not os.path.exists(cards_path):
-        print(f"Warning: Card images not found at {cards_path}")
-        return
-
+# Turn timer bar, at the top center. Nothing else is drawn in this area
+TIMER_BAR_RECT = pygame.Rect(WINDOW_WIDTH // 2 - 150, 20, 300, 25)
+
+# Sizes cards are drawn at
+COMMUNITY_CARD_SIZE = (80, 110)
+HAND_CARD_SIZE = (100, 140)
+
+# One atlas per drawn size: every card face scaled once and packed 13 ranks
+# wide by 4 suits high, plus each card's source rect within it keyed by
+# Card.bit, so drawing a card needs no string building
+CARD_ATLASES: Dict[Tuple[int, int], Tuple[pygame.Surface, Dict[int, pygame.Rect]]] = {}
+
+
+def card_atlas(size: Tuple[int, int]) -> Tuple[pygame.Surface, Dict[int, pygame.Rect]]:
+    """Return (atlas, rects) for cards drawn at size, building it on first use."""
+    atlas = CARD_ATLASES.get(size)
+    if atlas is None:
+        width, height = size
+        surface = pygame.Surface((13 * width, 4 * height), pygame.SRCALPHA).convert_alpha()
+        rects = {}
+        for i in range(13):
+            for j in range(4):
+                card = FULL_DECK[13 * j + i]  # FULL_DECK runs suit by suit
+                key = str(card)
+                if key in CARD_IMAGES:
+                    rect = pygame.Rect(i * width, j * height, width, height)
+                    # Add onto the transparent atlas to copy alpha as-is
+                    surface.blit(pygame.transform.smoothscale(CARD_IMAGES[key], size), rect,
+                                 special_flags=pygame.BLEND_RGBA_ADD)
+                    rects[card.bit] = rect
+        atlas = CARD_ATLASES[size] = (surface, rects)
+    return atlas
+
+
+def _card_filenames() -> List[Tuple[str, str, Optional[str]]]:
+    """(card key, image filename, preferred alternate filename or None) for every card."""
     # Map rank/suit to filename format
     rank_map = {
         "2": "2", "3": "3", "4": "4", "5": "5", "6": "6", "7": "7", "8": "8",
@@ -61,33 +179,141 @@ def load_card_images():
         "♥": "hearts", "♦": "diamonds", "♣": "clubs", "♠": "spades"
     }
 
-    # Load each card
+    filenames = []
     for rank in Rank:
         for suit in Suit:
             rank_str = rank_map.get(rank.display, rank.display.lower())
             suit_str = suit_map.get(suit.value, "")
+            alternate = f"{rank_str}_of_{suit_str}2.png" if rank.display in ["J", "Q", "K"] else None
+            filenames.append((f"{rank.display}{suit.value}", f"{rank_str}_of_{suit_str}.png", alternate))
+    return filenames
 
-            # Try loading the primary version first
-            filename = f"{rank_str}_of_{suit_str}.png"
-            filepath = os.path.join(cards_path, filename)
 
-            # For face cards (J, Q, K), try the "2" version first as it's often cleaner
-            if rank.display in ["J", "Q", "K"]:
-                filename2 = f"{rank_str}_of_{suit_str}2.png"
-                filepath2 = os.path.join(cards_path, filename2)
-                if os.path.exists(filepath2):
-                    filepath = filepath2
-                    filename = filename2
+CARD_FILENAMES = _card_filenames()
 
-            if os.path.exists(filepath):
-                try:
-                    img = pygame.image.load(filepath)
-                    # Store by card key
-                    key = f"{rank.display}{suit.value}"
-                    CARD_IMAGES[key] = img
-                except Exception as e:
-                    if len(CARD_IMAGES) == 0:  # Only print if no cards loaded at all
-                        print(f"Error loading {filename}: {e}")
+
+def load_card_images():
+    """Load all card images from PNG folder."""
+    global CARD_IMAGES, CARD_BACK_IMAGE
+
+    cards_path = "Playing Cards/Playing Cards/PNG-cards-1.3"
+
+    if not os.path.exists(cards_path):
+        print(f"Warning: Card images not found at {cards_path}")
+        return
+
+    # One directory listing instead of a stat per candidate file
+    available = set(os.listdir(cards_path))
+
+    # Load each card
+    for (key, primary, alternate) in CARD_FILENAMES:
+        # For face cards (J, Q, K), try the "2" version first as it's often cleaner
+        filename = alternate if alternate in available else primary
+
+        if filename in available:
+            try:
+                # Match the display's pixel format so blits don't convert
+                img = pygame.image.load(os.path.join(cards_path, filename)).convert_alpha()
+                # Store by card key
+                CARD_IMAGES[key] = img
+            except Exception as e:
+                if len(CARD_IMAGES) == 0:  # Only print if no cards loaded at all
+                    print(f"Error loading {filename}: {e}")
+
+    CARD_ATLASES.clear()
+    for size in (COMMUNITY_CARD_SIZE, HAND_CARD_SIZE):
+        card_atlas(size)
+
+
+def _preflop_strength(rank1: int, rank2: int, suited: bool) -> Tuple[float, str]:
+    """Rough pre-flop strength (0-1) and recommendation for two hole cards."""
+    # Pair
+    if rank1 == rank2:
+        strength = 0.5 + (rank1 / 28.0)
+        if strength > 0.8:
+            return strength, "Strong - Raise"
+        elif strength > 0.6:
+            return strength, "Good - Bet/Call"
+        else:
+            return strength, "Decent - Call"
+
+    # High cards
+    high = max(rank1, rank2)
+    low = min(rank1, rank2)
+    suited_bonus = 0.1 if suited else 0
+    connected_bonus = 0.05 if abs(rank1 - rank2) <= 2 else 0
+    strength = (high / 28.0) + (low / 56.0) + suited_bonus + connected_bonus
+
+    if strength > 0.7:
+        return strength, "Strong - Raise"
+    elif strength > 0.5:
+        return strength, "Decent - Call"
+    elif strength > 0.35:
+        return strength, "Weak - Check/Fold"
+    else:
+        return strength, "Very Weak - Fold"
+
+
+# Every starting hand has one of 169 classes, so look pre-flop strength up as
+# PREFLOP_STRENGTH[high - 2][low - 2][suited]
+PREFLOP_STRENGTH = [[[_preflop_strength(high, low, suited) for suited in (False, True)]
+                     for low in range(2, 15)]
+                    for high in range(2, 15)]
+
+
+def _postflop_strength(hand_rank: int) -> Tuple[float, str]:
+    """Rough post-flop strength (0-1) and recommendation for a made hand rank."""
+    strength = hand_rank / 10.0
+
+    if strength > 0.8:
+        return strength, "Very Strong - Raise"
+    elif strength > 0.65:
+        return strength, "Strong - Bet/Raise"
+    elif strength > 0.45:
+        return strength, "Decent - Call/Bet"
+    elif strength > 0.3:
+        return strength, "Weak - Check/Call"
+    else:
+        return strength, "Very Weak - Fold"
+
+
+# Post-flop strength depends only on the hand rank: POSTFLOP_STRENGTH[hand_rank]
+POSTFLOP_STRENGTH = [None] + [_postflop_strength(rank) for rank in range(1, 11)]
+
+
+def _math_preflop_strength(high: int, low: int) -> Tuple[float, str]:
+    """Simplified pre-flop equity (0-1) and label for two hole card ranks."""
+    if high == low:
+        # Pocket pair: ~50% to improve
+        strength = 0.5 + (high / 40.0)
+    else:
+        # High card probability
+        strength = high / 28.0
+
+    if strength > 0.7:
+        return strength, "Math: 70%+ equity"
+    elif strength > 0.5:
+        return strength, "Math: 50-70% equity"
+    else:
+        return strength, "Math: <50% equity"
+
+
+# Math pre-flop equity ignores suits: MATH_PREFLOP_STRENGTH[high - 2][low - 2]
+MATH_PREFLOP_STRENGTH = [[_math_preflop_strength(high, low) for low in range(2, 15)]
+                         for high in range(2, 15)]
+
+
+def _math_equity(outs: int, cards_to_come: int) -> Tuple[float, str]:
+    """Equity (5-95%) and label for a number of outs, by the rule of 2 and 4."""
+    # Multiply outs by 2 for one card to come, 4 for two
+    multiplier = 4 if cards_to_come == 2 else 2
+    equity = min(0.95, max(0.05, (outs * multiplier) / 100.0))
+    return equity, f"Math: ~{int(equity*100)}% ({outs} outs)"
+
+
+# At most 47 cards are unseen on the flop: MATH_EQUITY[cards_to_come - 1][outs]
+MATH_EQUITY = [[_math_equity(outs, cards_to_come) for outs in range(48)]
+               for cards_to_come in (1, 2)]
 
 
 class Button:
@@ -97,14 +323,34 @@ class Button:
                  color: Tuple[int, int, int] = BUTTON_COLOR,
                  hover_color: Tuple[int, int, int] = BUTTON_HOVER):
         self.rect = pygame.Rect(x, y, width, height)
-        self.text = text
+        self._text = text
+        self._rebuild_text()
         self.color = color
         self.hover_color = hover_color
         self.is_hovered = False
         self.enabled = True
 
+    @property
+    def text(self) -> str:
+        return self._text
+
+    @text.setter
+    def text(self, value: str):
+        self._text = value
+        self._rebuild_text()
+
+    def _rebuild_text(self):
+        """Render the label once, centered on the button."""
+        self._text_surface = render_text(FONT_MEDIUM, self._text, WHITE)
+        self._text_rect = self._text_surface.get_rect(center=self.rect.center)
+
     def draw(self, screen: pygame.Surface):
         """Draw the button."""
+        self.draw_background(screen)
+        screen.blit(self._text_surface, self._text_rect)
+
+    def draw_background(self, screen: pygame.Surface):
+        """Draw the button's body and border, without the label."""
         if not self.enabled:
             color = GRAY
         elif self.is_hovered:
@@ -115,17 +361,13 @@ class Button:
         pygame.draw.rect(screen, color, self.rect, border_radius=8)
         pygame.draw.rect(screen, WHITE, self.rect, 2, border_radius=8)
 
-        text_surface = FONT_MEDIUM.render(self.text, True, WHITE)
-        text_rect = text_surface.get_rect(center=self.rect.center)
-        screen.blit(text_surface, text_rect)
-
     def update(self, mouse_pos: Tuple[int, int]):
         """Update hover state."""
         self.is_hovered = self.rect.collidepoint(mouse_pos) and self.enabled
 
     def is_clicked(self, mouse_pos: Tuple[int, int]) -> bool:
         """Check if button is clicked."""
-        return self.is_hovered and self.enabled
+        return self.enabled and self.rect.collidepoint(mouse_pos)
 
 
 class PokerGUI:
@@ -134,22 +376,37 @@ class PokerGUI:
     SAVE_FILE = "player_data.json"
 
     def __init__(self):
-        self.screen = pygame.display.set_mode((WINDOW_WIDTH, WINDOW_HEIGHT))
+        try:
+            # GPU-backed scaled renderer, synced to the display refresh
+            self.screen = pygame.display.set_mode((WINDOW_WIDTH, WINDOW_HEIGHT),
+                                                  pygame.SCALED | pygame.DOUBLEBUF, vsync=1)
+        except pygame.error:
+            # vsync isn't available on every driver
+            self.screen = pygame.display.set_mode((WINDOW_WIDTH, WINDOW_HEIGHT))
         pygame.display.set_caption("Texas Hold'em Poker")
+        # fblits is pygame-ce only; blits is available in pygame 2. Pick once, not per frame
+        self._blit_all = getattr(self.screen, "fblits", None) or \
+            (lambda pairs: self.screen.blits(pairs, doreturn=False))
         self.clock = pygame.time.Clock()
 
         # Load card images
         load_card_images()
 
         # Game state
+        self._last_saved = None  # (name, chips) last read from or written to SAVE_FILE
         self.player = self.load_player()
         self.game: Optional[PokerGame] = None
         self.state = "menu"
         self.message = ""
         self.message_timer = 0
+        self._dirty = True  # Screen needs redrawing
+        self._drawn_state = None
+        self._drawn_frame_key = None
+        self._drawn_timer_key = None
 
         # UI elements
         self.buttons: List[Button] = []
+        self.mouse_pos = (0, 0)  # Last position from MOUSEMOTION
         self.selected_difficulty = "medium"
 
         # Game flow
@@ -157,19 +414,30 @@ class PokerGUI:
         self.waiting_for_player = False
         self.bot_action_delay = 0
         self.winners = []
-        self.action_history = []
-        self.players_acted = set()  # Track who has acted in current round
+        self.action_history = deque(maxlen=ACTION_HISTORY_SIZE)
+        self._history_surfaces = deque(maxlen=HISTORY_LINES_SHOWN)  # Rendered tail of action_history
+        self.history_count = 0  # Actions logged this hand; len() stops growing at maxlen
+        self.players_acted_mask = 0  # Bit per seat: who has acted in current round
         self.current_player_index = 0  # Track whose turn it is
         self.blinds_posted = False  # Track if blinds have been posted this hand
         self.current_acting_player = None  # Who is currently making a decision
 
+        self.active_count = 0  # Players who haven't folded this hand
+        self._hand_eval_cache: Dict[int, int] = {}  # Hand rank by packed cards, cleared each street
+        # Single-slot caches for the hand evaluation panel: (state key, result)
+        self._state_cache: Tuple[Optional[int], Tuple[int, int]] = (None, (0, 0))
+        self._pot_odds_cache: Tuple[Optional[tuple], Tuple[str, str, str]] = (None, ("", "", ""))
+
         # Role-based action order system
         self.player_roles = {}  # Maps player -> role ("SB", "BB", "Dealer", None)
+        self.preflop_order: List[Player] = []  # Action orders for the current roles
+        self.postflop_order: List[Player] = []
 
         # Debug logging
-        self.debug_log = []
+        self.debug_log = deque(maxlen=DEBUG_LOG_SIZE)
+        self.debug_count = 0
         self.hand_number = 0
-        self.debug_mode = False  # Set to True to enable debug logging
+        self.debug_mode = bool(os.environ.get("POKER_DEBUG"))  # Set to True to enable debug logging
 
         # Universal turn timer (for all players)
         self.turn_timer = 0
@@ -191,44 +459,98 @@ class PokerGUI:
             try:
                 with open(self.SAVE_FILE, 'r') as f:
                     data = json.load(f)
-                    return Player(data.get("name", "Player"), data.get("chips", 1000))
-            except:
+                    player = Player(data.get("name", "Player"), data.get("chips", 1000))
+                    self._last_saved = (player.name, player.chips)
+                    return player
+            except (ValueError, AttributeError):
+                # Not JSON, or not an object: set it aside so later launches
+                # don't parse it again, and keep it for inspection
+                try:
+                    os.replace(self.SAVE_FILE, self.SAVE_FILE + ".corrupt")
+                except OSError:  # e.g. a read-only directory; just start fresh
+                    pass
+            except OSError:
                 pass
         return Player("Player", 1000)
 
     def save_player(self):
-        """Save player data."""
+        """Save player data, unless it is unchanged since the last save."""
+        snapshot = (self.player.name, self.player.chips)
+        if snapshot == self._last_saved:
+            return
+
         data = {
             "name": self.player.name,
             "chips": self.player.chips
         }
-        with open(self.SAVE_FILE, 'w') as f:
+        # Write a temp file and swap it in so a crash can't leave a half-written save
+        tmp_file = self.SAVE_FILE + ".tmp"
+        with open(tmp_file, 'w') as f:
             json.dump(data, f)
+        os.replace(tmp_file, self.SAVE_FILE)
+        self._last_saved = snapshot
 
     def show_message(self, message: str, duration: int = 120):
         """Show a temporary message."""
         self.message = message
         self.message_timer = duration
+        self._dirty = True
+        # Rendered once here; the overlay is drawn for the whole duration
+        self._message_surface = render_text(FONT_LARGE, message, GOLD)
+        self._message_rect = self._message_surface.get_rect(center=(WINDOW_WIDTH // 2, WINDOW_HEIGHT // 2))
+
+    def _frame_key(self) -> Optional[tuple]:
+        """Everything besides the turn timer that changes what gameplay shows."""
+        if self.state != "playing" or not self.game:
+            return None
+        return (self.game.pot, self.game.current_bet, len(self.game.community_cards),
+                self.history_count, self.current_round, self.hand_number,
+                self.current_acting_player, self.waiting_for_player,
+                self.showing_bet_dialog, self.bet_input, self.posting_blinds_state,
+                self.message if self.message_timer else None)
+
+    def _timer_key(self) -> tuple:
+        """What the turn timer bar currently shows: who, how full, and the seconds label."""
+        if not self.current_acting_player:
+            return (None,)
+        time_left = self.turn_time_limit - self.turn_timer
+        return (self.current_acting_player, TIMER_BAR_RECT.width * time_left // self.turn_time_limit,
+                time_left // 60)
+
+    def _is_idle(self) -> bool:
+        """True when nothing has changed and nothing on screen is animating."""
+        return (not self._dirty and self.state == self._drawn_state
+                and self.state != "playing" and self.message_timer == 0)
 
     def run(self):
         """Main game loop."""
         running = True
         frame_count = 0
         while running:
-            mouse_pos = pygame.mouse.get_pos()
-
-            # Update button hover states
-            for button in self.buttons:
-                button.update(mouse_pos)
+            if self._is_idle():
+                # Nothing is animating, so sleep until there is input
+                event = pygame.event.wait(1000 // FPS)
+                events = [] if event.type == pygame.NOEVENT else [event] + pygame.event.get()
+            else:
+                events = pygame.event.get()
 
             # Handle events
-            for event in pygame.event.get():
+            for event in events:
+                # Any input (including mouse motion for hover) may change the screen
+                self._dirty = True
+
                 if event.type == pygame.QUIT:
                     self.save_player()
                     running = False
 
+                if event.type == pygame.MOUSEMOTION:
+                    # Hover only changes when the mouse moves
+                    self.mouse_pos = event.pos
+                    for button in self.buttons:
+                        button.update(event.pos)
+
                 if event.type == pygame.MOUSEBUTTONDOWN and event.button == 1:
-                    self.handle_mouse_click(mouse_pos)
+                    self.handle_mouse_click(event.pos)
 
                 if event.type == pygame.KEYDOWN:
                     self.handle_keyboard(event)
@@ -236,6 +558,27 @@ class PokerGUI:
             # Update game logic
             self.update()
 
+            if self._is_idle():
+                self.clock.tick(FPS)
+                continue
+            frame_key = self._frame_key()
+            timer_key = self._timer_key()
+            # Only the turn timer moves between frames with the same key
+            if not self._dirty and self.state == self._drawn_state and frame_key == self._drawn_frame_key:
+                # Repaint just the timer bar, and only when it visibly changed.
+                # It doesn't run while the bet dialog is open over it
+                if frame_key is not None and timer_key != self._drawn_timer_key:
+                    self._drawn_timer_key = timer_key
+                    self.screen.fill(GREEN_FELT, TIMER_BAR_RECT)
+                    self.draw_player_timer()
+                    pygame.display.update(TIMER_BAR_RECT)
+                self.clock.tick(FPS)
+                continue
+            self._dirty = False
+            self._drawn_state = self.state
+            self._drawn_frame_key = frame_key
+            self._drawn_timer_key = timer_key
+
             # Draw
             self.screen.fill(GREEN_FELT)
 
@@ -268,6 +611,9 @@ class PokerGUI:
         """Update game state."""
         if self.message_timer > 0:
             self.message_timer -= 1
+            if self.message_timer == 0:
+                # Redraw once more to clear the overlay
+                self._dirty = True
 
         if self.state == "playing":
             # Handle blinds posting animation
@@ -286,10 +632,10 @@ class PokerGUI:
                 # Player timeout
                 if self.current_acting_player == self.player and self.turn_timer >= self.turn_time_limit:
                     self.log_debug(f"{self.current_round.upper()}: {self.player.name} TIMEOUT - AUTO FOLD")
-                    self.player.fold()
-                    self.action_history.append(f"{self.player.name} folds (timeout)")
+                    self._fold(self.player)
+                    self._add_history(f"{self.player.name} folds (timeout)")
                     self.show_message(f"{self.player.name} folds (timeout)", 120)
-                    self.players_acted.add(self.player)
+                    self._mark_acted(self.player)
                     self.waiting_for_player = False
                     self.current_acting_player = None
                     self.turn_timer = 0
@@ -324,8 +670,10 @@ class PokerGUI:
             elif event.key == pygame.K_ESCAPE:
                 self.showing_bet_dialog = False
                 self.bet_input = ""
-            elif event.unicode.isdigit() and len(self.bet_input) < 6:
-                self.bet_input += event.unicode
+            elif len(self.bet_input) < 6:
+                digit = _DIGIT_KEYS.get(event.key)
+                if digit:
+                    self.bet_input += digit
 
     def handle_button_click(self, button_text: str):
         """Handle button clicks."""
@@ -380,20 +728,20 @@ class PokerGUI:
         self.turn_timer = 0
 
         if action == "Check":
-            self.action_history.append(f"{self.player.name} checks")
+            self._add_history(f"{self.player.name} checks")
             self.show_message(f"{self.player.name} checks", 90)
             self.log_debug(f"{self.current_round.upper()}: {self.player.name} (pos {player_pos}) CHECKS (pot: ${self.game.pot})")
-            self.players_acted.add(self.player)
+            self._mark_acted(self.player)
             self.waiting_for_player = False
             self.current_acting_player = None  # Clear current actor
             self.bot_action_delay = 60  # Brief delay before next action
 
         elif action == "Fold":
-            self.player.fold()
-            self.action_history.append(f"{self.player.name} folds")
+            self._fold(self.player)
+            self._add_history(f"{self.player.name} folds")
             self.show_message(f"{self.player.name} folds", 90)
             self.log_debug(f"{self.current_round.upper()}: {self.player.name} (pos {player_pos}) FOLDS (pot: ${self.game.pot})")
-            self.players_acted.add(self.player)
+            self._mark_acted(self.player)
             self.waiting_for_player = False
             self.current_acting_player = None  # Clear current actor
             self.bot_action_delay = 60  # Brief delay before next action
@@ -401,11 +749,11 @@ class PokerGUI:
         elif action.startswith("Call"):
             actual_bet = self.player.bet(call_amount)
             self.game.pot += actual_bet
-            self.game.player_contributions[self.player] = self.game.player_contributions.get(self.player, 0) + actual_bet
-            self.action_history.append(f"{self.player.name} calls ${actual_bet}")
+            self.game.player_contributions[self.player.seat] += actual_bet
+            self._add_history(f"{self.player.name} calls ${actual_bet}")
             self.show_message(f"{self.player.name} calls ${actual_bet}", 90)
             self.log_debug(f"{self.current_round.upper()}: {self.player.name} (pos {player_pos}) CALLS ${actual_bet} (pot: ${self.game.pot}, chips: {self.player.chips})")
-            self.players_acted.add(self.player)
+            self._mark_acted(self.player)
             self.waiting_for_player = False
             self.current_acting_player = None  # Clear current actor
             self.bot_action_delay = 60  # Brief delay before next action
@@ -432,13 +780,13 @@ class PokerGUI:
 
                 actual_bet = self.player.bet(amount)
                 self.game.pot += actual_bet
-                self.game.player_contributions[self.player] = self.game.player_contributions.get(self.player, 0) + actual_bet
+                self.game.player_contributions[self.player.seat] += actual_bet
                 self.game.current_bet = self.player.current_bet
                 self.game.min_raise = amount
-                self.action_history.append(f"{self.player.name} bets ${actual_bet}")
+                self._add_history(f"{self.player.name} bets ${actual_bet}")
                 self.show_message(f"{self.player.name} bets ${actual_bet}", 60)
-                # Reset players_acted when someone raises
-                self.players_acted = {self.player}
+                # Reset who has acted when someone raises
+                self.players_acted_mask = 1 << self.player.seat
 
             elif self.bet_action == "raise":
                 min_raise = self.game.min_raise
@@ -449,13 +797,13 @@ class PokerGUI:
                 total_bet = call_amount + amount
                 actual_bet = self.player.bet(total_bet)
                 self.game.pot += actual_bet
-                self.game.player_contributions[self.player] = self.game.player_contributions.get(self.player, 0) + actual_bet
+                self.game.player_contributions[self.player.seat] += actual_bet
                 self.game.current_bet = self.player.current_bet
                 self.game.min_raise = amount
-                self.action_history.append(f"{self.player.name} raises ${amount}")
+                self._add_history(f"{self.player.name} raises ${amount}")
                 self.show_message(f"{self.player.name} raises ${amount}", 60)
-                # Reset players_acted when someone raises
-                self.players_acted = {self.player}
+                # Reset who has acted when someone raises
+                self.players_acted_mask = 1 << self.player.seat
 
             self.showing_bet_dialog = False
             self.bet_input = ""
@@ -471,7 +819,7 @@ class PokerGUI:
         self.log_debug(f"process_next_action called - round: {self.current_round}, blinds_posted: {self.blinds_posted}")
 
         # Check if only one player remains
-        if len([p for p in self.game.all_players if not p.folded]) <= 1:
+        if self.active_count <= 1:
             self.end_hand()
             return
 
@@ -481,15 +829,17 @@ class PokerGUI:
             self.post_blinds_animated()
             return
 
-        # Build action order based on roles
+        # Action order based on roles, built once per hand
         action_order = self._get_action_order_by_roles()
 
-        self.log_debug(f"{self.current_round.upper()} action order: {[f'{p.name}({self.player_roles.get(p, 'None')})' for p in action_order]}")
+        if self.debug_mode:
+            order_str = [f"{p.name}({self.player_roles.get(p, 'None')})" for p in action_order]
+            self.log_debug(f"{self.current_round.upper()} action order: {order_str}")
 
         # Find next player to act using the action order
         for player in action_order:
             # Skip if player already acted, folded, or all-in
-            if player in self.players_acted or player.folded or player.all_in:
+            if self._has_acted(player) or player.folded or player.all_in:
                 continue
 
             # Player needs to act if:
@@ -518,7 +868,7 @@ class PokerGUI:
                 return
 
         # All players have acted - advance round
-        self.log_debug(f"All players acted. Players_acted: {[p.name for p in self.players_acted]}")
+        self.log_debug(f"All players acted. Players_acted: {[p.name for p in self.game.all_players if self._has_acted(p)]}")
         self.current_acting_player = None
         self.advance_round()
 
@@ -532,13 +882,11 @@ class PokerGUI:
         Returns list of players in action order.
         """
         if self.current_round == "pre-flop":
-            # Pre-flop action order
-            role_order = [None, "Dealer", "SB", "BB"]
-        else:
-            # Post-flop action order (SB acts first)
-            role_order = ["SB", "BB", None, "Dealer"]
+            return self.preflop_order
+        return self.postflop_order
 
-        # Build player list in role order
+    def _order_by_roles(self, role_order: List[Optional[str]]) -> List[Player]:
+        """Build the list of players holding each role, in role_order."""
         action_order = []
         for role in role_order:
             for player, player_role in self.player_roles.items():
@@ -581,6 +929,10 @@ class PokerGUI:
             else:
                 self.player_roles[player] = None  # No special role (UTG in 4-player)
 
+        # Roles are fixed for the hand, so both action orders can be built now
+        self.preflop_order = self._order_by_roles([None, "Dealer", "SB", "BB"])
+        self.postflop_order = self._order_by_roles(["SB", "BB", None, "Dealer"])
+
     def update_blinds_animation(self):
         """Handle the sequential blinds posting animation."""
         num_players = len(self.game.all_players)
@@ -591,7 +943,7 @@ class PokerGUI:
             # Post small blind
             sb_player = self.game.all_players[sb_pos]
             sb_amount = self.game.post_blind(sb_pos, self.game.small_blind)
-            self.action_history.append(f"{sb_player.name} posts SB ${sb_amount}")
+            self._add_history(f"{sb_player.name} posts SB ${sb_amount}")
             self.show_message(f"{sb_player.name} posts SB ${sb_amount}", 90)
             self.log_debug(f"SB: {sb_player.name} posts ${sb_amount} (pos {sb_pos}, chips: {sb_player.chips})")
 
@@ -607,7 +959,7 @@ class PokerGUI:
             # Post big blind
             bb_player = self.game.all_players[bb_pos]
             bb_amount = self.game.post_blind(bb_pos, self.game.big_blind)
-            self.action_history.append(f"{bb_player.name} posts BB ${bb_amount}")
+            self._add_history(f"{bb_player.name} posts BB ${bb_amount}")
             self.show_message(f"{bb_player.name} posts BB ${bb_amount}", 90)
             self.log_debug(f"BB: {bb_player.name} posts ${bb_amount} (pos {bb_pos}, chips: {bb_player.chips})")
             self.log_debug(f"Pot after blinds: ${self.game.pot}, Current bet: ${self.game.current_bet}")
@@ -625,48 +977,49 @@ class PokerGUI:
 
     def process_bot_action(self, bot: Player):
         """Process one bot action."""
-        bot_pos = self.game.all_players.index(bot)
+        bot_pos = bot.seat
 
         action, amount = bot.make_decision(
             self.game.pot,
             self.game.current_bet,
             self.game.community_cards,
-            self.game.min_raise
+            self.game.min_raise,
+            board_key=self.game.community_key
         )
 
         call_amount = self.game.current_bet - bot.current_bet
 
         if action == "fold":
-            bot.fold()
-            self.action_history.append(f"{bot.name} folds")
+            self._fold(bot)
+            self._add_history(f"{bot.name} folds")
             self.show_message(f"{bot.name} folds", 120)
             self.log_debug(f"{self.current_round.upper()}: {bot.name} (pos {bot_pos}) FOLDS (pot: ${self.game.pot})")
-            self.players_acted.add(bot)
+            self._mark_acted(bot)
         elif action == "call":
             actual_bet = bot.bet(call_amount)
             self.game.pot += actual_bet
-            self.game.player_contributions[bot] = self.game.player_contributions.get(bot, 0) + actual_bet
-            self.action_history.append(f"{bot.name} calls ${actual_bet}")
+            self.game.player_contributions[bot.seat] += actual_bet
+            self._add_history(f"{bot.name} calls ${actual_bet}")
             self.show_message(f"{bot.name} calls ${actual_bet}", 120)
             self.log_debug(f"{self.current_round.upper()}: {bot.name} (pos {bot_pos}) CALLS ${actual_bet} (pot: ${self.game.pot}, chips: {bot.chips})")
-            self.players_acted.add(bot)
+            self._mark_acted(bot)
         elif action == "check":
-            self.action_history.append(f"{bot.name} checks")
+            self._add_history(f"{bot.name} checks")
             self.show_message(f"{bot.name} checks", 120)
             self.log_debug(f"{self.current_round.upper()}: {bot.name} (pos {bot_pos}) CHECKS (pot: ${self.game.pot})")
-            self.players_acted.add(bot)
+            self._mark_acted(bot)
         elif action == "raise":
             total_bet = call_amount + amount
             actual_bet = bot.bet(total_bet)
             self.game.pot += actual_bet
-            self.game.player_contributions[bot] = self.game.player_contributions.get(bot, 0) + actual_bet
+            self.game.player_contributions[bot.seat] += actual_bet
             self.game.current_bet = bot.current_bet
             self.game.min_raise = amount
-            self.action_history.append(f"{bot.name} raises ${amount}")
+            self._add_history(f"{bot.name} raises ${amount}")
             self.show_message(f"{bot.name} raises ${amount}", 120)
             self.log_debug(f"{self.current_round.upper()}: {bot.name} (pos {bot_pos}) RAISES ${amount} (pot: ${self.game.pot}, chips: {bot.chips})")
-            # Reset players_acted when someone raises
-            self.players_acted = {bot}
+            # Reset who has acted when someone raises
+            self.players_acted_mask = 1 << bot.seat
 
         # Mark this bot as done acting
         self.current_acting_player = None
@@ -675,7 +1028,8 @@ class PokerGUI:
     def advance_round(self):
         """Advance to next betting round."""
         # Reset who has acted for new round
-        self.players_acted = set()
+        self.players_acted_mask = 0
+        self._hand_eval_cache.clear()
 
         if self.current_round == "pre-flop":
             self.game.deal_flop()
@@ -715,15 +1069,17 @@ class PokerGUI:
         else:
             self.game.move_dealer_button()
             if self.game.start_new_hand():
+                self._index_players()
                 self.hand_number += 1
                 self.current_round = "pre-flop"
                 self.waiting_for_player = False
                 self.bot_action_delay = 120  # 2 second pause to show cards
-                self.action_history = []
+                self._clear_history()
                 self.blinds_posted = False
                 self.posting_blinds_state = None  # Reset blinds posting state
                 self.blinds_animation_timer = 0
-                self.players_acted = set()  # Reset who has acted
+                self.players_acted_mask = 0  # Reset who has acted
+                self._hand_eval_cache.clear()
                 self.current_acting_player = None  # Reset current actor
                 self.turn_timer = 0  # Reset turn timer
                 self.state = "playing"
@@ -737,14 +1093,16 @@ class PokerGUI:
         """Start a new poker game."""
         self.game = PokerGame(self.player, num_bots=3, small_blind=10, bot_difficulty=self.selected_difficulty)
         self.game.start_new_hand()
+        self._index_players()
         self.current_round = "pre-flop"
         self.waiting_for_player = False
         self.bot_action_delay = 0  # Start immediately
-        self.action_history = []
+        self._clear_history()
         self.blinds_posted = False
         self.hand_number = 1
-        self.debug_log = []
-        self.players_acted = set()
+        self.debug_log.clear()
+        self.debug_count = 0
+        self.players_acted_mask = 0
         self.current_acting_player = None
         self.turn_timer = 0
         self.state = "playing"
@@ -753,13 +1111,43 @@ class PokerGUI:
         self.log_debug(f"Dealer position: {self.game.dealer_position}")
         self.show_message("Game started!", 120)
 
+    def _mark_acted(self, player: Player):
+        """Record that player has acted this round."""
+        self.players_acted_mask |= 1 << player.seat
+
+    def _has_acted(self, player: Player) -> bool:
+        """True if player has acted this round."""
+        return bool(self.players_acted_mask >> player.seat & 1)
+
+    def _index_players(self):
+        """
+        Reset the count of players still in the hand. Called after
+        start_new_hand, which drops busted players and renumbers seats.
+        """
+        self.active_count = len(self.game.all_players)
+
+    def _add_history(self, text: str):
+        """Log an action, rendering its history line once."""
+        self.action_history.append(text)
+        self._history_surfaces.append(render_text(FONT_TINY, text, LIGHT_GRAY))
+        self.history_count += 1
+
+    def _clear_history(self):
+        """Forget the previous hand's actions."""
+        self.action_history.clear()
+        self._history_surfaces.clear()
+        self.history_count = 0
+
+    def _fold(self, player: Player):
+        """Fold player and keep active_count in step."""
+        player.fold()
+        self.active_count -= 1
+
     def _get_bot_think_time(self, bot: AIBot) -> int:
         """
         Calculate thinking time for a bot based on difficulty.
         Returns number of frames the bot should "think" before acting.
         """
-        import random
-
         # Base thinking times by difficulty (in frames, 60 FPS)
         if bot.difficulty == "easy":
             base_time = 60  # 1 second
@@ -782,10 +1170,10 @@ class PokerGUI:
         if not self.debug_mode:
             return
 
-        timestamp = len(self.debug_log)
-        log_entry = f"[{timestamp:04d}] {message}"
+        log_entry = f"[{self.debug_count:04d}] {message}"
+        self.debug_count += 1
         self.debug_log.append(log_entry)
-        print(log_entry)  # Also print to console
+        logger.debug(log_entry)
 
     def export_debug_log(self):
         """Export debug log to file."""
@@ -803,77 +1191,47 @@ class PokerGUI:
         # Pre-flop evaluation
         if len(self.game.community_cards) == 0:
             card1, card2 = self.player.hand
-            rank1, rank2 = card1.rank.value, card2.rank.value
-
-            # Pair
-            if rank1 == rank2:
-                strength = 0.5 + (rank1 / 28.0)
-                if strength > 0.8:
-                    return strength, "Strong - Raise"
-                elif strength > 0.6:
-                    return strength, "Good - Bet/Call"
-                else:
-                    return strength, "Decent - Call"
-
-            # High cards
-            high = max(rank1, rank2)
-            low = min(rank1, rank2)
-            suited_bonus = 0.1 if card1.suit == card2.suit else 0
-            connected_bonus = 0.05 if abs(rank1 - rank2) <= 2 else 0
-            strength = (high / 28.0) + (low / 56.0) + suited_bonus + connected_bonus
-
-            if strength > 0.7:
-                return strength, "Strong - Raise"
-            elif strength > 0.5:
-                return strength, "Decent - Call"
-            elif strength > 0.35:
-                return strength, "Weak - Check/Fold"
-            else:
-                return strength, "Very Weak - Fold"
+            rank1, rank2 = card1.rank_value, card2.rank_value
+            high, low = max(rank1, rank2), min(rank1, rank2)
+            return PREFLOP_STRENGTH[high - 2][low - 2][card1.suit_index == card2.suit_index]
 
         # Post-flop evaluation
-        full_hand = self.player.hand + self.game.community_cards
-        hand_rank, _ = HandEvaluator.evaluate_hand(full_hand)
-        strength = hand_rank / 10.0
+        full_hand = self._packed_hand()
+        hand_rank = self._hand_eval_cache.get(full_hand)
+        if hand_rank is None:
+            hand_rank, _ = HandEvaluator.evaluate_packed(full_hand)
+            self._hand_eval_cache[full_hand] = hand_rank
+        return POSTFLOP_STRENGTH[hand_rank]
 
-        if strength > 0.8:
-            return strength, "Very Strong - Raise"
-        elif strength > 0.65:
-            return strength, "Strong - Bet/Raise"
-        elif strength > 0.45:
-            return strength, "Decent - Call/Bet"
-        elif strength > 0.3:
-            return strength, "Weak - Check/Call"
-        else:
-            return strength, "Very Weak - Fold"
+    def _packed_hand(self) -> int:
+        """The player's hole cards and the board packed into one hand key."""
+        return self.player.hand_key | self.game.community_key
 
     def calculate_outs(self) -> int:
         """Calculate the number of outs to improve the hand."""
         if not self.player.hand or len(self.game.community_cards) < 3:
             return 0
 
-        from poker_cards import Deck, Rank, Suit
-
-        full_hand = self.player.hand + self.game.community_cards
-        current_rank, current_tie = HandEvaluator.evaluate_hand(full_hand)
+        return self._evaluate_state()[1]
 
-        # Get all known cards
-        known_cards = set(full_hand)
-
-        # Create all possible cards and filter out known ones
-        all_cards = [Card(rank, suit) for suit in Suit for rank in Rank]
-        unknown_cards = [c for c in all_cards if c not in known_cards]
+    def _evaluate_state(self) -> Tuple[int, int]:
+        """
+        (hand_rank, outs) for the player's hand on a flop or later board.
+        Shared by the pot odds, outs and math strength readouts, and only
+        recomputed when a card is dealt.
+        """
+        hand_key = self._packed_hand()
+        cached_key, cached_state = self._state_cache
+        if cached_key == hand_key:
+            return cached_state
 
-        # Count outs - cards that improve our hand
-        outs = 0
-        for card in unknown_cards:
-            test_hand = full_hand + [card]
-            new_rank, new_tie = HandEvaluator.evaluate_hand(test_hand)
-            # Check if hand improved
-            if new_rank > current_rank or (new_rank == current_rank and new_tie > current_tie):
-                outs += 1
+        hand_rank = HandEvaluator.evaluate_packed(hand_key)[0]
+        # Count outs - cards that improve our hand, even just the kickers
+        outs = HandEvaluator.count_outs(hand_key)
 
-        return outs
+        state = (hand_rank, outs)
+        self._state_cache = (hand_key, state)
+        return state
 
     def calculate_pot_odds_evaluation(self) -> Tuple[str, str, str]:
         """
@@ -883,6 +1241,16 @@ class PokerGUI:
         if not self.player.hand:
             return "N/A", "N/A", "No hand"
 
+        # Reuse the last result until the cards or the betting change
+        state_key = (self._packed_hand(), self.game.current_bet, self.player.current_bet, self.game.pot)
+        cached_key, cached_result = self._pot_odds_cache
+        if cached_key != state_key:
+            cached_result = self._evaluate_pot_odds()
+            self._pot_odds_cache = (state_key, cached_result)
+        return cached_result
+
+    def _evaluate_pot_odds(self) -> Tuple[str, str, str]:
+        """Uncached body of calculate_pot_odds_evaluation."""
         call_amount = self.game.current_bet - self.player.current_bet
 
         # Pre-flop evaluation
@@ -895,7 +1263,7 @@ class PokerGUI:
 
                 # Evaluate pre-flop hand strength
                 card1, card2 = self.player.hand
-                rank1, rank2 = card1.rank.value, card2.rank.value
+                rank1, rank2 = card1.rank_value, card2.rank_value
 
                 if rank1 == rank2:
                     strength = "Pair"
@@ -919,7 +1287,7 @@ class PokerGUI:
             else:
                 # No bet to call pre-flop
                 card1, card2 = self.player.hand
-                rank1, rank2 = card1.rank.value, card2.rank.value
+                rank1, rank2 = card1.rank_value, card2.rank_value
 
                 if rank1 == rank2 and rank1 >= 9:
                     return "No bet", "Strong pair", "BET/RAISE"
@@ -929,10 +1297,9 @@ class PokerGUI:
                     return "No bet", "Speculative", "CHECK"
 
         # Post-flop with no bet to call - evaluate hand strength and recommend action
+        hand_rank, outs = self._evaluate_state()
+
         if call_amount == 0:
-            full_hand = self.player.hand + self.game.community_cards
-            hand_rank, _ = HandEvaluator.evaluate_hand(full_hand)
-            outs = self.calculate_outs()
 
             known_cards_count = len(self.player.hand) + len(self.game.community_cards)
             unknown_cards = 52 - known_cards_count
@@ -943,7 +1310,7 @@ class PokerGUI:
             else:
                 odds_str = "Made hand"
 
-            hand_name = HandEvaluator.get_hand_name(full_hand)
+            hand_name = HandRank.NAMES[hand_rank]
 
             if hand_rank >= 6:  # Flush or better
                 return "No bet", hand_name, "BET/RAISE (strong)"
@@ -961,9 +1328,6 @@ class PokerGUI:
         pot_odds_ratio = pot_after_call / call_amount if call_amount > 0 else 0
         pot_odds_str = f"{pot_odds_ratio:.1f}:1"
 
-        # Calculate outs
-        outs = self.calculate_outs()
-
         # Calculate unknown cards
         known_cards_count = len(self.player.hand) + len(self.game.community_cards)
         unknown_cards = 52 - known_cards_count
@@ -973,10 +1337,7 @@ class PokerGUI:
             odds_against_ratio = (unknown_cards - outs) / outs
             odds_against_str = f"{odds_against_ratio:.1f}:1"
         else:
-            # No outs - evaluate current hand strength
-            full_hand = self.player.hand + self.game.community_cards
-            hand_rank, _ = HandEvaluator.evaluate_hand(full_hand)
-
+            # No outs - fall back on current hand strength
             if hand_rank >= 6:  # Flush or better
                 odds_against_str = "Made hand"
                 odds_against_ratio = 0  # Already have strong hand
@@ -1009,28 +1370,11 @@ class PokerGUI:
         if len(self.game.community_cards) == 0:
             # Pre-flop: Use simplified probability
             card1, card2 = self.player.hand
-            rank1, rank2 = card1.rank.value, card2.rank.value
-
-            if rank1 == rank2:
-                # Pocket pair: ~50% to improve
-                strength = 0.5 + (rank1 / 40.0)
-            else:
-                # High card probability
-                strength = max(rank1, rank2) / 28.0
-
-            if strength > 0.7:
-                return strength, "Math: 70%+ equity"
-            elif strength > 0.5:
-                return strength, "Math: 50-70% equity"
-            else:
-                return strength, "Math: <50% equity"
+            rank1, rank2 = card1.rank_value, card2.rank_value
+            return MATH_PREFLOP_STRENGTH[max(rank1, rank2) - 2][min(rank1, rank2) - 2]
 
         # Post-flop: Calculate actual outs and odds
-        full_hand = self.player.hand + self.game.community_cards
-        hand_rank, _ = HandEvaluator.evaluate_hand(full_hand)
-
-        # Calculate actual outs
-        outs = self.calculate_outs()
+        hand_rank, outs = self._evaluate_state()
 
         # Estimate outs based on current hand if calculation returns 0
         if outs == 0:
@@ -1044,36 +1388,32 @@ class PokerGUI:
             else:  # Very weak
                 outs = 3
 
-        # Calculate equity from outs
-        known_cards = len(self.player.hand) + len(self.game.community_cards)
-        unknown_cards = 52 - known_cards
-
-        if outs > 0:
-            # Rule of 2 and 4: multiply outs by 2 for one card, 4 for two cards
-            cards_to_come = 2 if len(self.game.community_cards) == 3 else 1
-            multiplier = 4 if cards_to_come == 2 else 2
-            equity = min(0.95, (outs * multiplier) / 100.0)
-        else:
+        if outs == 0:
             equity = 0.9 if hand_rank >= 6 else 0.1
-
-        equity = min(0.95, max(0.05, equity))
-
-        if equity > 0.65:
-            return equity, f"Math: ~{int(equity*100)}% ({outs} outs)"
-        elif equity > 0.40:
-            return equity, f"Math: ~{int(equity*100)}% ({outs} outs)"
-        else:
             return equity, f"Math: ~{int(equity*100)}% ({outs} outs)"
 
+        # Calculate equity from outs
+        cards_to_come = 2 if len(self.game.community_cards) == 3 else 1
+        return MATH_EQUITY[cards_to_come - 1][outs]
+
     # ===== Drawing Methods =====
 
+    def _draw_buttons(self):
+        """Draw all buttons, blitting every label in one call."""
+        for button in self.buttons:
+            # Screens rebuild their buttons each draw, so take hover from the last motion
+            button.update(self.mouse_pos)
+            button.draw_background(self.screen)
+
+        self._blit_all([(button._text_surface, button._text_rect) for button in self.buttons])
+
     def draw_menu(self):
         """Draw main menu."""
-        title = FONT_LARGE.render("TEXAS HOLD'EM POKER", True, GOLD)
+        title = render_text(FONT_LARGE, "TEXAS HOLD'EM POKER", GOLD)
         title_rect = title.get_rect(center=(WINDOW_WIDTH // 2, 150))
         self.screen.blit(title, title_rect)
 
-        info = FONT_MEDIUM.render(f"{self.player.name} - ${self.player.chips}", True, WHITE)
+        info = render_text(FONT_MEDIUM, f"{self.player.name} - ${self.player.chips}", WHITE)
         info_rect = info.get_rect(center=(WINDOW_WIDTH // 2, 250))
         self.screen.blit(info, info_rect)
 
@@ -1083,12 +1423,11 @@ class PokerGUI:
             Button(WINDOW_WIDTH // 2 - 150, 510, 300, 60, "Quit")
         ]
 
-        for button in self.buttons:
-            button.draw(self.screen)
+        self._draw_buttons()
 
     def draw_difficulty_select(self):
         """Draw difficulty selection screen."""
-        title = FONT_LARGE.render("SELECT DIFFICULTY", True, GOLD)
+        title = render_text(FONT_LARGE, "SELECT DIFFICULTY", GOLD)
         title_rect = title.get_rect(center=(WINDOW_WIDTH // 2, 150))
         self.screen.blit(title, title_rect)
 
@@ -1099,12 +1438,11 @@ class PokerGUI:
             Button(WINDOW_WIDTH // 2 - 150, 560, 300, 60, "Back")
         ]
 
-        for button in self.buttons:
-            button.draw(self.screen)
+        self._draw_buttons()
 
         y = 700
         for text in ["Easy: Passive bots", "Medium: Balanced play", "Hard: Aggressive bots"]:
-            label = FONT_SMALL.render(text, True, LIGHT_GRAY)
+            label = render_text(FONT_SMALL, text, LIGHT_GRAY)
             label_rect = label.get_rect(center=(WINDOW_WIDTH // 2, y))
             self.screen.blit(label, label_rect)
             y += 30
@@ -1120,12 +1458,12 @@ class PokerGUI:
         pygame.draw.ellipse(self.screen, GOLD, table_rect, 3)
 
         # Draw round indicator at top
-        round_text = FONT_SMALL.render(self.current_round.upper(), True, LIGHT_GRAY)
+        round_text = render_text(FONT_SMALL, self.current_round.upper(), LIGHT_GRAY)
         round_rect = round_text.get_rect(center=(WINDOW_WIDTH // 2, 60))
         self.screen.blit(round_text, round_rect)
 
         # Draw pot ABOVE community cards
-        pot_text = FONT_MEDIUM.render(f"Pot: ${self.game.pot}", True, GOLD)
+        pot_text = render_text(FONT_MEDIUM, f"Pot: ${self.game.pot}", GOLD)
         pot_rect = pot_text.get_rect(center=(WINDOW_WIDTH // 2, 260))
         self.screen.blit(pot_text, pot_rect)
 
@@ -1159,8 +1497,7 @@ class PokerGUI:
         if not self.game.community_cards:
             return
 
-        card_width = 80
-        card_height = 110
+        card_width, card_height = COMMUNITY_CARD_SIZE
         spacing = 10
         total_width = len(self.game.community_cards) * (card_width + spacing) - spacing
         start_x = (WINDOW_WIDTH - total_width) // 2
@@ -1170,10 +1507,7 @@ class PokerGUI:
             x = start_x + i * (card_width + spacing)
 
             # Add subtle shadow and glow effect
-            shadow_surf = pygame.Surface((card_width + 10, card_height + 10))
-            shadow_surf.set_alpha(80)
-            shadow_surf.fill((0, 0, 0))
-            self.screen.blit(shadow_surf, (x - 5, y - 5))
+            self.screen.blit(shade_surface((card_width + 10, card_height + 10), 80), (x - 5, y - 5))
 
             self.draw_card(card, x, y, card_width, card_height)
 
@@ -1187,57 +1521,36 @@ class PokerGUI:
 
         if face_down:
             # Draw card back
-            pygame.draw.rect(self.screen, WHITE, (x, y, width, height), border_radius=8)
-            pygame.draw.rect(self.screen, BLACK, (x, y, width, height), 2, border_radius=8)
-            pygame.draw.rect(self.screen, BLUE, (x + 5, y + 5, width - 10, height - 10), border_radius=5)
-            # Add pattern
-            for i in range(3):
-                for j in range(4):
-                    cx = x + 15 + i * 25
-                    cy = y + 15 + j * 30
-                    pygame.draw.circle(self.screen, DARK_GREEN, (cx, cy), 8)
+            self.screen.blit(card_back((width, height)), (x, y))
         else:
-            # Try to use loaded image
-            card_key = f"{card.rank.display}{card.suit.value}"
+            # Try to use loaded image, pre-scaled to this size in the atlas
+            atlas, rects = card_atlas((width, height))
+            rect = rects.get(card.bit)
 
-            if card_key in CARD_IMAGES:
+            if rect is not None:
                 # Use loaded image
-                img = CARD_IMAGES[card_key]
-                # Scale image to fit
-                scaled_img = pygame.transform.scale(img, (width, height))
-                self.screen.blit(scaled_img, (x, y))
+                self.screen.blit(atlas, (x, y), rect)
             else:
                 # Fallback to programmatic rendering
                 pygame.draw.rect(self.screen, WHITE, (x, y, width, height), border_radius=8)
                 pygame.draw.rect(self.screen, BLACK, (x, y, width, height), 2, border_radius=8)
 
-                suit_name = card.suit.value
-                color = RED if suit_name in ['♥', '♦'] else BLACK
-
-                suit_symbols = {
-                    '♥': '♥', '♦': '♦', '♣': '♣', '♠': '♠'
-                }
-                suit_display = suit_symbols.get(suit_name, suit_name)
+                suit_display = card.suit.value
+                color = RED if card.suit in (Suit.HEARTS, Suit.DIAMONDS) else BLACK
 
-                rank_font = pygame.font.Font(None, 28)
-                suit_font = pygame.font.Font(None, 32)
-
-                rank_text = rank_font.render(card.rank.display, True, color)
-                self.screen.blit(rank_text, (x + 6, y + 5))
-
-                suit_text_small = suit_font.render(suit_display, True, color)
-                self.screen.blit(suit_text_small, (x + 6, y + 25))
-
-                center_suit_font = pygame.font.Font(None, 60)
-                suit_text_large = center_suit_font.render(suit_display, True, color)
+                # Each glyph is rendered once and reused for both corners
+                rank_text = render_text(FONT_CARD_RANK, card.rank.display, color)
+                suit_text = render_text(FONT_CARD_SUIT, suit_display, color)
+                suit_text_large = render_text(FONT_CARD_CENTER, suit_display, color)
                 suit_rect = suit_text_large.get_rect(center=(x + width // 2, y + height // 2))
-                self.screen.blit(suit_text_large, suit_rect)
-
-                rank_text_br = rank_font.render(card.rank.display, True, color)
-                self.screen.blit(rank_text_br, (x + width - 22, y + height - 45))
 
-                suit_text_br = suit_font.render(suit_display, True, color)
-                self.screen.blit(suit_text_br, (x + width - 22, y + height - 22))
+                self._blit_all([
+                    (rank_text, (x + 6, y + 5)),
+                    (suit_text, (x + 6, y + 25)),
+                    (suit_text_large, suit_rect),
+                    (rank_text, (x + width - 22, y + height - 45)),
+                    (suit_text, (x + width - 22, y + height - 22)),
+                ])
 
     def draw_players(self):
         """Draw all players in clockwise order."""
@@ -1253,44 +1566,42 @@ class PokerGUI:
             (WINDOW_WIDTH - 350, WINDOW_HEIGHT // 2 - 50)     # Position 3: Right side
         ]
 
+        # Blind seats are the same for every panel, so work them out once
+        num_players = len(self.game.all_players)
+        dealer_pos = self.game.dealer_position
+        sb_pos = (dealer_pos + 1) % num_players
+        bb_pos = (dealer_pos + 2) % num_players
+
         # Draw all players except the human player (index 0)
         for i, player in enumerate(self.game.all_players):
             if i > 0:  # Skip human player (index 0)
                 x, y = positions[i]
-                is_dealer = i == self.game.dealer_position
-                self.draw_player_info(player, x, y, is_dealer)
+                self.draw_player_info(player, x, y, i == dealer_pos, i == sb_pos, i == bb_pos)
 
-    def draw_player_info(self, player: Player, x: int, y: int, is_dealer: bool):
+    def draw_player_info(self, player: Player, x: int, y: int, is_dealer: bool,
+                         is_sb: bool, is_bb: bool):
         """Draw player info panel."""
-        # Determine position info
-        player_index = self.game.all_players.index(player)
-        num_players = len(self.game.all_players)
-        sb_pos = (self.game.dealer_position + 1) % num_players
-        bb_pos = (self.game.dealer_position + 2) % num_players
-
-        is_sb = player_index == sb_pos
-        is_bb = player_index == bb_pos
 
         panel_rect = pygame.Rect(x, y, 200, 100)
         pygame.draw.rect(self.screen, DARK_GREEN, panel_rect, border_radius=8)
         pygame.draw.rect(self.screen, GOLD if is_dealer else WHITE, panel_rect, 2, border_radius=8)
 
-        name_text = FONT_SMALL.render(player.name, True, WHITE)
+        name_text = render_text(FONT_SMALL, player.name, WHITE)
         self.screen.blit(name_text, (x + 10, y + 10))
 
         # Draw graphical position indicators (circles with text)
         self._draw_position_indicator(x, y, is_dealer, is_sb, is_bb)
 
-        chips_text = FONT_SMALL.render(f"${player.chips}", True, GOLD)
+        chips_text = render_text(FONT_SMALL, f"${player.chips}", GOLD)
         self.screen.blit(chips_text, (x + 10, y + 40))
 
         if player.current_bet > 0:
-            bet_text = FONT_TINY.render(f"Bet: ${player.current_bet}", True, LIGHT_GRAY)
+            bet_text = render_text(FONT_TINY, f"Bet: ${player.current_bet}", LIGHT_GRAY)
             self.screen.blit(bet_text, (x + 10, y + 65))
 
         status = "Folded" if player.folded else "All-In" if player.all_in else "Active"
         status_color = GRAY if player.folded else RED if player.all_in else WHITE
-        status_text = FONT_TINY.render(status, True, status_color)
+        status_text = render_text(FONT_TINY, status, status_color)
         self.screen.blit(status_text, (x + 10, y + 80))
 
         # Show face-down cards for bots (only if not folded and has cards)
@@ -1301,15 +1612,8 @@ class PokerGUI:
             card_y = y + 35
 
             # Draw two small face-down cards
-            for i in range(2):
-                # Draw card back (gray rectangle with pattern)
-                card_rect = pygame.Rect(card_x + (i * 30), card_y, card_width, card_height)
-                pygame.draw.rect(self.screen, BLUE, card_rect, border_radius=3)
-                pygame.draw.rect(self.screen, WHITE, card_rect, 1, border_radius=3)
-
-                # Add a pattern to show it's face-down
-                pattern_rect = pygame.Rect(card_x + (i * 30) + 3, card_y + 3, card_width - 6, card_height - 6)
-                pygame.draw.rect(self.screen, LIGHT_GRAY, pattern_rect, 1, border_radius=2)
+            back = mini_card_back((card_width, card_height))
+            self._blit_all([(back, (card_x, card_y)), (back, (card_x + 30, card_y))])
 
     def _draw_position_indicator(self, x: int, y: int, is_dealer: bool, is_sb: bool, is_bb: bool):
         """Draw circular position indicator (Dealer, SB, or BB)."""
@@ -1341,7 +1645,7 @@ class PokerGUI:
         pygame.draw.circle(self.screen, WHITE, (circle_x, circle_y), circle_radius, 2)
 
         # Draw text centered in circle
-        text_surface = FONT_SMALL.render(text, True, text_color)
+        text_surface = render_text(FONT_SMALL, text, text_color)
         text_rect = text_surface.get_rect(center=(circle_x, circle_y))
         self.screen.blit(text_surface, text_rect)
 
@@ -1372,7 +1676,7 @@ class PokerGUI:
         pygame.draw.circle(self.screen, WHITE, (x, y), circle_radius, 2)
 
         # Draw text centered in circle
-        text_surface = FONT_SMALL.render(text, True, text_color)
+        text_surface = render_text(FONT_SMALL, text, text_color)
         text_rect = text_surface.get_rect(center=(x, y))
         self.screen.blit(text_surface, text_rect)
 
@@ -1381,8 +1685,7 @@ class PokerGUI:
         if not self.player.hand:
             return
 
-        card_width = 100
-        card_height = 140
+        card_width, card_height = HAND_CARD_SIZE
         spacing = 20
         total_width = 2 * card_width + spacing
         start_x = (WINDOW_WIDTH - total_width) // 2
@@ -1409,7 +1712,7 @@ class PokerGUI:
         elif is_bb:
             position_str = " (BB)"
 
-        info_text = FONT_MEDIUM.render(f"{self.player.name}{position_str} - ${self.player.chips}", True, GOLD)
+        info_text = render_text(FONT_MEDIUM, f"{self.player.name}{position_str} - ${self.player.chips}", GOLD)
         info_rect = info_text.get_rect(center=(WINDOW_WIDTH // 2, y - 30))
         self.screen.blit(info_text, info_rect)
 
@@ -1420,14 +1723,15 @@ class PokerGUI:
 
         # Hand rank
         if len(self.game.community_cards) >= 3:
-            hand_name = HandEvaluator.get_hand_name(self.player.hand + self.game.community_cards)
-            hand_text = FONT_SMALL.render(f"Hand: {hand_name}", True, LIGHT_GRAY)
+            # Cached on the packed hand along with the outs count
+            hand_name = HandRank.NAMES[self._evaluate_state()[0]]
+            hand_text = render_text(FONT_SMALL, f"Hand: {hand_name}", LIGHT_GRAY)
             hand_rect = hand_text.get_rect(center=(WINDOW_WIDTH // 2, y + card_height + 15))
             self.screen.blit(hand_text, hand_rect)
 
         # Current bet
         if self.player.current_bet > 0:
-            bet_text = FONT_SMALL.render(f"Current Bet: ${self.player.current_bet}", True, LIGHT_GRAY)
+            bet_text = render_text(FONT_SMALL, f"Current Bet: ${self.player.current_bet}", LIGHT_GRAY)
             bet_rect = bet_text.get_rect(center=(WINDOW_WIDTH // 2, y + card_height + 40))
             self.screen.blit(bet_text, bet_rect)
 
@@ -1481,16 +1785,12 @@ class PokerGUI:
             if self.player.chips > call_amount:
                 self.buttons.append(Button(x, button_y, button_width, button_height, "Raise"))
 
-        for button in self.buttons:
-            button.draw(self.screen)
+        self._draw_buttons()
 
     def draw_action_history(self):
         """Draw recent action history."""
-        y = 150
-        for i in range(max(0, len(self.action_history) - 5), len(self.action_history)):
-            action_text = FONT_TINY.render(self.action_history[i], True, LIGHT_GRAY)
-            self.screen.blit(action_text, (WINDOW_WIDTH - 280, y))
-            y += 25
+        self.screen.blits([(surface, (WINDOW_WIDTH - 280, 150 + i * 25))
+                           for i, surface in enumerate(self._history_surfaces)], doreturn=False)
 
     def draw_player_timer(self):
         """Draw universal turn timer for whoever is currently acting."""
@@ -1501,16 +1801,13 @@ class PokerGUI:
         seconds_left = time_left // 60
 
         # Timer bar - always visible at top center
-        bar_width = 300
-        bar_height = 25
-        bar_x = WINDOW_WIDTH // 2 - bar_width // 2
-        bar_y = 20
+        bar_x, bar_y, bar_width, bar_height = TIMER_BAR_RECT
 
         # Background
         pygame.draw.rect(self.screen, DARK_GREEN, (bar_x, bar_y, bar_width, bar_height), border_radius=5)
 
         # Fill (progress bar)
-        fill_width = int(bar_width * (time_left / self.turn_time_limit))
+        fill_width = bar_width * time_left // self.turn_time_limit
 
         # Color based on time left
         if self.current_acting_player == self.player:
@@ -1527,17 +1824,14 @@ class PokerGUI:
 
         # Text - show who is acting
         player_name = self.current_acting_player.name
-        timer_text = FONT_SMALL.render(f"{player_name}'s turn: {seconds_left}s", True, WHITE)
+        timer_text = render_text(FONT_SMALL, f"{player_name}'s turn: {seconds_left}s", WHITE)
         timer_rect = timer_text.get_rect(center=(bar_x + bar_width // 2, bar_y + bar_height // 2))
         self.screen.blit(timer_text, timer_rect)
 
     def draw_bet_dialog(self):
         """Draw bet/raise input dialog."""
         # Overlay
-        overlay = pygame.Surface((WINDOW_WIDTH, WINDOW_HEIGHT))
-        overlay.set_alpha(180)
-        overlay.fill(BLACK)
-        self.screen.blit(overlay, (0, 0))
+        self.screen.blit(shade_surface((WINDOW_WIDTH, WINDOW_HEIGHT), 180), (0, 0))
 
         # Dialog box
         dialog_width = 400
@@ -1550,7 +1844,7 @@ class PokerGUI:
 
         # Title
         title = self.bet_action.upper()
-        title_text = FONT_LARGE.render(title, True, GOLD)
+        title_text = render_text(FONT_LARGE, title, GOLD)
         title_rect = title_text.get_rect(center=(WINDOW_WIDTH // 2, dialog_y + 40))
         self.screen.blit(title_text, title_rect)
 
@@ -1559,7 +1853,7 @@ class PokerGUI:
         pygame.draw.rect(self.screen, WHITE, input_rect, border_radius=5)
         pygame.draw.rect(self.screen, GOLD, input_rect, 2, border_radius=5)
 
-        input_text = FONT_MEDIUM.render(f"${self.bet_input}", True, BLACK)
+        input_text = render_text(FONT_MEDIUM, f"${self.bet_input}", BLACK)
         input_text_rect = input_text.get_rect(center=input_rect.center)
         self.screen.blit(input_text, input_text_rect)
 
@@ -1572,20 +1866,17 @@ class PokerGUI:
             min_amount = self.game.min_raise
             max_amount = self.player.chips - call_amount
 
-        inst_text = FONT_SMALL.render(f"Min: ${min_amount} | Max: ${max_amount}", True, LIGHT_GRAY)
+        inst_text = render_text(FONT_SMALL, f"Min: ${min_amount} | Max: ${max_amount}", LIGHT_GRAY)
         inst_rect = inst_text.get_rect(center=(WINDOW_WIDTH // 2, dialog_y + 160))
         self.screen.blit(inst_text, inst_rect)
 
-        help_text = FONT_TINY.render("Press ENTER to confirm, ESC to cancel", True, LIGHT_GRAY)
+        help_text = render_text(FONT_TINY, "Press ENTER to confirm, ESC to cancel", LIGHT_GRAY)
         help_rect = help_text.get_rect(center=(WINDOW_WIDTH // 2, dialog_y + 200))
         self.screen.blit(help_text, help_rect)
 
     def draw_results(self):
         """Draw hand results."""
-        overlay = pygame.Surface((WINDOW_WIDTH, WINDOW_HEIGHT))
-        overlay.set_alpha(200)
-        overlay.fill(BLACK)
-        self.screen.blit(overlay, (0, 0))
+        self.screen.blit(shade_surface((WINDOW_WIDTH, WINDOW_HEIGHT), 200), (0, 0))
 
         # Results panel
         panel_width = 600
@@ -1597,18 +1888,18 @@ class PokerGUI:
         pygame.draw.rect(self.screen, GOLD, (panel_x, panel_y, panel_width, panel_height), 3, border_radius=10)
 
         # Title
-        title = FONT_LARGE.render("HAND RESULTS", True, GOLD)
+        title = render_text(FONT_LARGE, "HAND RESULTS", GOLD)
         title_rect = title.get_rect(center=(WINDOW_WIDTH // 2, panel_y + 40))
         self.screen.blit(title, title_rect)
 
         # Winners
         y = panel_y + 100
         for player, amount, hand_name in self.winners:
-            winner_text = FONT_MEDIUM.render(f"{player.name}", True, WHITE)
+            winner_text = render_text(FONT_MEDIUM, f"{player.name}", WHITE)
             winner_rect = winner_text.get_rect(center=(WINDOW_WIDTH // 2, y))
             self.screen.blit(winner_text, winner_rect)
 
-            hand_text = FONT_SMALL.render(f"{hand_name} - Won ${amount}", True, GOLD)
+            hand_text = render_text(FONT_SMALL, f"{hand_name} - Won ${amount}", GOLD)
             hand_rect = hand_text.get_rect(center=(WINDOW_WIDTH // 2, y + 30))
             self.screen.blit(hand_text, hand_rect)
             y += 70
@@ -1619,27 +1910,26 @@ class PokerGUI:
             Button(WINDOW_WIDTH // 2 + 50, panel_y + panel_height - 80, 200, 60, "Main Menu")
         ]
 
-        for button in self.buttons:
-            button.draw(self.screen)
+        self._draw_buttons()
 
     def draw_game_over(self):
         """Draw game over screen."""
-        bots_with_chips = [b for b in self.game.bots if b.chips > 0] if self.game else []
-        player_won = self.player.chips > 0 and len(bots_with_chips) == 0
+        bots_alive = self.game is not None and any(b.chips > 0 for b in self.game.bots)
+        player_won = self.player.chips > 0 and not bots_alive
 
         if player_won:
-            title = FONT_LARGE.render("CONGRATULATIONS!", True, GOLD)
-            subtitle = FONT_MEDIUM.render("You won all the chips!", True, WHITE)
+            title = render_text(FONT_LARGE, "CONGRATULATIONS!", GOLD)
+            subtitle = render_text(FONT_MEDIUM, "You won all the chips!", WHITE)
         else:
-            title = FONT_LARGE.render("GAME OVER", True, RED)
-            subtitle = FONT_MEDIUM.render("You ran out of chips", True, WHITE)
+            title = render_text(FONT_LARGE, "GAME OVER", RED)
+            subtitle = render_text(FONT_MEDIUM, "You ran out of chips", WHITE)
 
         title_rect = title.get_rect(center=(WINDOW_WIDTH // 2, 200))
         subtitle_rect = subtitle.get_rect(center=(WINDOW_WIDTH // 2, 280))
         self.screen.blit(title, title_rect)
         self.screen.blit(subtitle, subtitle_rect)
 
-        chips_text = FONT_MEDIUM.render(f"Final Chips: ${self.player.chips}", True, GOLD)
+        chips_text = render_text(FONT_MEDIUM, f"Final Chips: ${self.player.chips}", GOLD)
         chips_rect = chips_text.get_rect(center=(WINDOW_WIDTH // 2, 360))
         self.screen.blit(chips_text, chips_rect)
 
@@ -1648,8 +1938,7 @@ class PokerGUI:
             Button(WINDOW_WIDTH // 2 - 150, 530, 300, 60, "Quit")
         ]
 
-        for button in self.buttons:
-            button.draw(self.screen)
+        self._draw_buttons()
 
     def draw_hand_evaluation(self):
         """Draw pot odds evaluation panel in top right corner."""
@@ -1661,32 +1950,19 @@ class PokerGUI:
         # Get pot odds evaluation
         pot_odds_str, odds_against_str, recommendation = self.calculate_pot_odds_evaluation()
 
-        # Panel background
-        pygame.draw.rect(self.screen, DARK_GREEN, (panel_x, panel_y, panel_width, panel_height), border_radius=8)
-        pygame.draw.rect(self.screen, GOLD, (panel_x, panel_y, panel_width, panel_height), 3, border_radius=8)
+        # Panel background, title and labels
+        show_outs = len(self.game.community_cards) >= 3
+        self.screen.blit(evaluation_panel((panel_width, panel_height), show_outs), (panel_x, panel_y))
 
-        # Title
-        title_text = FONT_SMALL.render("Pot Odds Analysis", True, GOLD)
-        self.screen.blit(title_text, (panel_x + 10, panel_y + 10))
-
-        # Pot Odds
-        pot_odds_label = FONT_TINY.render("Pot Odds:", True, WHITE)
-        self.screen.blit(pot_odds_label, (panel_x + 10, panel_y + 45))
-        pot_odds_value = FONT_SMALL.render(pot_odds_str, True, LIGHT_GRAY)
+        # Values
+        pot_odds_value = render_text(FONT_SMALL, pot_odds_str, LIGHT_GRAY)
         self.screen.blit(pot_odds_value, (panel_x + 100, panel_y + 42))
-
-        # Odds Against
-        odds_against_label = FONT_TINY.render("Odds Against:", True, WHITE)
-        self.screen.blit(odds_against_label, (panel_x + 10, panel_y + 75))
-        odds_against_value = FONT_SMALL.render(odds_against_str, True, LIGHT_GRAY)
+        odds_against_value = render_text(FONT_SMALL, odds_against_str, LIGHT_GRAY)
         self.screen.blit(odds_against_value, (panel_x + 120, panel_y + 72))
 
         # Outs count
-        if len(self.game.community_cards) >= 3:
-            outs = self.calculate_outs()
-            outs_label = FONT_TINY.render(f"Outs:", True, WHITE)
-            self.screen.blit(outs_label, (panel_x + 10, panel_y + 105))
-            outs_value = FONT_SMALL.render(f"{outs}", True, LIGHT_GRAY)
+        if show_outs:
+            outs_value = render_text(FONT_SMALL, f"{self.calculate_outs()}", LIGHT_GRAY)
             self.screen.blit(outs_value, (panel_x + 100, panel_y + 102))
 
         # Recommendation with colored background
@@ -1704,7 +1980,7 @@ class PokerGUI:
         pygame.draw.rect(self.screen, rec_bg_color, (panel_x + 5, rec_y, panel_width - 10, rec_bg_height), border_radius=5)
 
         # Recommendation text
-        rec_text = FONT_SMALL.render("→ " + recommendation, True, BLACK if rec_bg_color == GOLD else WHITE)
+        rec_text = render_text(FONT_SMALL, "→ " + recommendation, BLACK if rec_bg_color == GOLD else WHITE)
         rec_rect = rec_text.get_rect(center=(panel_x + panel_width // 2, rec_y + rec_bg_height // 2))
         self.screen.blit(rec_text, rec_rect)
 
@@ -1713,14 +1989,9 @@ class PokerGUI:
         if not self.message:
             return
 
-        overlay = pygame.Surface((WINDOW_WIDTH, 100))
-        overlay.set_alpha(200)
-        overlay.fill(BLACK)
-        self.screen.blit(overlay, (0, WINDOW_HEIGHT // 2 - 50))
+        self.screen.blit(shade_surface((WINDOW_WIDTH, 100), 200), (0, WINDOW_HEIGHT // 2 - 50))
 
-        text = FONT_LARGE.render(self.message, True, GOLD)
-        text_rect = text.get_rect(center=(WINDOW_WIDTH // 2, WINDOW_HEIGHT // 2))
-        self.screen.blit(text, text_rect)
+        self.screen.blit(self._message_surface, self._message_rect)
 
 
 if __name__ == "__main__":
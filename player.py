@@ -12,6 +12,46 @@ except ImportError:
     CLAUDE_AVAILABLE = False
     get_claude_decision = None
 
+# Per-difficulty play style: (hand strength multiplier, aggression, bluff rate,
+# pot odds threshold, randomness). A higher threshold needs better odds to call.
+_DIFFICULTY_PARAMS = {
+    "easy": (0.85, 0.35, 0.05, 1.2, 0.12),
+    "medium": (1.0, 0.55, 0.15, 1.0, 0.06),
+    "hard": (1.05, 0.75, 0.25, 0.9, 0.06),
+}
+# Anything else plays the base style
+_DEFAULT_PARAMS = (1.0, 0.5, 0.15, 1.0, 0.06)
+
+# Reciprocals for the strength scales, so the hot paths multiply
+_INV_TEN = 0.1
+_INV_28 = 1 / 28
+_INV_56 = 1 / 56
+
+
+def _preflop_strength(high: int, low: int, suited: bool) -> float:
+    """Bot pre-flop strength (0-1) for two hole card ranks, high >= low."""
+    # Pair
+    if high == low:
+        return 0.5 + (high * _INV_28)  # Higher pairs are better
+
+    # Suited
+    suited_bonus = 0.1 if suited else 0
+
+    # Connected (potential straight)
+    connected_bonus = 0.05 if high - low <= 2 else 0
+
+    # Base strength on high card
+    base_strength = (high * _INV_28) + (low * _INV_56)
+
+    return min(1.0, base_strength + suited_bonus + connected_bonus)
+
+
+# Strength of each of the 169 distinct starting hands, keyed by
+# (high << 5) | (low << 1) | suited
+_PREFLOP_STRENGTH = {(high << 5) | (low << 1) | suited: _preflop_strength(high, low, bool(suited))
+                     for high in range(2, 15) for low in range(2, high + 1)
+                     for suited in ((0,) if high == low else (0, 1))}
+
 
 class Player:
     """Represents a poker player."""
@@ -19,11 +59,24 @@ class Player:
     def __init__(self, name: str, chips: int = 1000):
         self.name = name
         self.chips = chips
+        self.seat = 0  # Index into the game's all_players, set by PokerGame
         self.hand: List[Card] = []
         self.current_bet = 0
         self.folded = False
         self.all_in = False
 
+    @property
+    def hand(self) -> List[Card]:
+        return self._hand
+
+    @hand.setter
+    def hand(self, cards: List[Card]):
+        self._hand = cards
+        # The same cards packed one bit each (see Card.bit), for the evaluator
+        self.hand_key = 0
+        for card in cards:
+            self.hand_key |= card.bit
+
     def receive_cards(self, cards: List[Card]):
         """Receive cards."""
         self.hand = cards
@@ -64,44 +117,36 @@ class Player:
 class AIBot(Player):
     """AI bot player with decision-making logic."""
 
-    def __init__(self, name: str, chips: int = 1000, difficulty: str = "medium"):
+    def __init__(self, name: str, chips: int = 1000, difficulty: str = "medium",
+                 rng: Optional[random.Random] = None):
         super().__init__(name, chips)
         self.difficulty = difficulty
+        self._params = _DIFFICULTY_PARAMS.get(difficulty, _DEFAULT_PARAMS)
+        # Each bot draws from its own generator, so a seeded game replays exactly
+        self._rng = rng if rng is not None else random.Random()
 
-    def _calculate_outs(self, community_cards: List[Card]) -> int:
+    def _calculate_outs(self, community_cards: List[Card], board_key: int) -> int:
         """Calculate the number of outs to improve the hand."""
         if len(self.hand) != 2 or len(community_cards) < 3:
             return 0
 
-        from poker_cards import Rank, Suit, Card as PokerCard
-
-        full_hand = self.hand + community_cards
-        current_rank, current_tie = HandEvaluator.evaluate_hand(full_hand)
-
-        # Get all known cards
-        known_cards = set(full_hand)
-
-        # Create all possible cards and filter out known ones
-        all_cards = [PokerCard(rank, suit) for suit in Suit for rank in Rank]
-        unknown_cards = [c for c in all_cards if c not in known_cards]
-
-        # Count outs - cards that improve our hand
-        outs = 0
-        for card in unknown_cards:
-            test_hand = full_hand + [card]
-            new_rank, new_tie = HandEvaluator.evaluate_hand(test_hand)
-            # Check if hand improved
-            if new_rank > current_rank or (new_rank == current_rank and new_tie > current_tie):
-                outs += 1
-
-        return outs
+        # Count outs - cards that improve our hand. The packed key doesn't
+        # depend on card order, so bots on the same board share cached counts
+        return HandEvaluator.count_outs(self.hand_key | board_key)
 
     def make_decision(self, pot: int, current_bet: int, community_cards: List[Card],
-                      min_raise: int) -> tuple[str, int]:
+                      min_raise: int, board_key: Optional[int] = None) -> tuple[str, int]:
         """
         Make a betting decision using pot odds or Claude API.
+        board_key is community_cards packed one bit per card; games pass the
+        one they keep per street so every bot shares it.
         Returns (action, amount) where action is 'fold', 'call', 'raise', or 'check'
         """
+        if board_key is None:
+            board_key = 0
+            for card in community_cards:
+                board_key |= card.bit
+
         call_amount = current_bet - self.current_bet
 
         # Can't continue if no chips
@@ -114,14 +159,14 @@ class AIBot(Player):
             # Use Claude API with probability based on difficulty
             # Medium: 40%, Hard: 70%
             use_claude_prob = 0.7 if self.difficulty == "hard" else 0.4
-            if random.random() < use_claude_prob:
+            if self._rng.random() < use_claude_prob:
                 claude_decision = self._try_claude_decision(pot, current_bet, community_cards, min_raise)
                 if claude_decision:
                     return claude_decision
                 # If Claude fails, fall through to mathematical decision
 
         # Fall back to mathematical decision-making
-        return self._mathematical_decision(pot, current_bet, community_cards, min_raise)
+        return self._mathematical_decision(pot, current_bet, community_cards, min_raise, board_key)
 
     def _try_claude_decision(self, pot: int, current_bet: int, community_cards: List[Card],
                              min_raise: int) -> Optional[tuple[str, int]]:
@@ -148,9 +193,11 @@ class AIBot(Player):
             return None
 
     def _mathematical_decision(self, pot: int, current_bet: int, community_cards: List[Card],
-                                min_raise: int) -> tuple[str, int]:
+                                min_raise: int, board_key: int) -> tuple[str, int]:
         """Original mathematical decision-making logic."""
         call_amount = current_bet - self.current_bet
+        rand = self._rng.random
+        uniform = self._rng.uniform
 
         # Check if pre-flop or post-flop
         is_preflop = len(community_cards) == 0
@@ -158,38 +205,19 @@ class AIBot(Player):
 
         # Calculate hand strength
         if is_postflop:
-            full_hand = self.hand + community_cards
-            hand_rank, _ = HandEvaluator.evaluate_hand(full_hand)
-            hand_strength = hand_rank / 10.0  # Normalize to 0-1
+            hand_rank, _ = HandEvaluator.evaluate_packed(self.hand_key | board_key)
+            hand_strength = hand_rank * _INV_TEN  # Normalize to 0-1
         else:
             # Pre-flop: evaluate pocket cards
             hand_strength = self._evaluate_preflop_hand()
 
-        # Difficulty-based adjustments
-        aggression = 0.5  # Base aggression
-        bluff_rate = 0.15  # Base bluff rate
-        pot_odds_threshold = 1.0  # How strictly to follow pot odds
-
-        if self.difficulty == "easy":
-            hand_strength *= 0.85
-            aggression = 0.35
-            bluff_rate = 0.05
-            pot_odds_threshold = 1.2  # Requires better odds to call
-        elif self.difficulty == "medium":
-            hand_strength *= 1.0
-            aggression = 0.55
-            bluff_rate = 0.15
-            pot_odds_threshold = 1.0
-        elif self.difficulty == "hard":
-            hand_strength *= 1.05
-            aggression = 0.75
-            bluff_rate = 0.25
-            pot_odds_threshold = 0.9  # More willing to take marginal spots
+        # Difficulty-based adjustments, looked up once when the bot was made
+        hs_mult, aggression, bluff_rate, pot_odds_threshold, randomness = self._params
+        hand_strength *= hs_mult
 
         # Add some randomness (less for harder bots)
-        randomness = 0.12 if self.difficulty == "easy" else 0.06
-        hand_strength += random.uniform(-randomness, randomness)
-        hand_strength = max(0.05, min(0.95, hand_strength))
+        hand_strength += uniform(-randomness, randomness)
+        hand_strength = 0.05 if hand_strength < 0.05 else (0.95 if hand_strength > 0.95 else hand_strength)
 
         # POST-FLOP: Use pot odds calculation
         if is_postflop and call_amount > 0:
@@ -197,22 +225,6 @@ class AIBot(Player):
             pot_after_call = pot + call_amount
             pot_odds_ratio = pot_after_call / call_amount if call_amount > 0 else 0
 
-            # Calculate outs
-            outs = self._calculate_outs(community_cards)
-
-            # Calculate odds against hitting
-            known_cards_count = len(self.hand) + len(community_cards)
-            unknown_cards = 52 - known_cards_count
-
-            if outs > 0:
-                odds_against_ratio = (unknown_cards - outs) / outs
-            else:
-                odds_against_ratio = 999  # Very high
-
-            # Decision based on pot odds vs odds against
-            # If pot odds > odds against (adjusted by threshold), it's profitable to call
-            should_call_by_odds = pot_odds_ratio > (odds_against_ratio * pot_odds_threshold)
-
             # Evaluate bet size relative to stack
             bet_to_stack_ratio = call_amount / self.chips if self.chips > 0 else 1
 
@@ -220,14 +232,14 @@ class AIBot(Player):
             if hand_rank >= 6:  # Flush or better
                 # Almost always call/raise with strong hands, even big bets
                 if bet_to_stack_ratio > 0.8:  # Huge bet - still call with very strong hand
-                    if random.random() < 0.85:  # 85% call even huge bets
+                    if rand() < 0.85:  # 85% call even huge bets
                         return ("call", min(call_amount, self.chips))
                     else:
                         return ("fold", 0)
-                elif random.random() < 0.95:  # 95% of the time with strong hands
-                    if random.random() < aggression * 1.2 and self.chips > call_amount + min_raise:
+                elif rand() < 0.95:  # 95% of the time with strong hands
+                    if rand() < aggression * 1.2 and self.chips > call_amount + min_raise:
                         # Raise more aggressively
-                        raise_size = int(pot * random.uniform(0.8, 2.0))
+                        raise_size = int(pot * uniform(0.8, 2.0))
                         raise_size = max(min_raise, min(raise_size, self.chips - call_amount))
                         return ("raise", raise_size)
                     else:
@@ -239,25 +251,42 @@ class AIBot(Player):
             elif hand_rank >= 4:
                 # More willing to call bigger bets with good hands
                 if bet_to_stack_ratio > 0.7:  # Very large bet
-                    if random.random() < 0.5:  # 50% call large bets with good hands
+                    if rand() < 0.5:  # 50% call large bets with good hands
                         return ("call", min(call_amount, self.chips))
                     else:
                         return ("fold", 0)
                 elif bet_to_stack_ratio > 0.4:  # Large bet
-                    if random.random() < 0.75:  # 75% call
+                    if rand() < 0.75:  # 75% call
                         return ("call", min(call_amount, self.chips))
                     else:
                         return ("fold", 0)
                 else:  # Normal bet
-                    if random.random() < aggression * 0.6:
-                        raise_size = int(pot * random.uniform(0.5, 1.2))
+                    if rand() < aggression * 0.6:
+                        raise_size = int(pot * uniform(0.5, 1.2))
                         raise_size = max(min_raise, min(raise_size, self.chips - call_amount))
                         if raise_size > 0:
                             return ("raise", raise_size)
                     return ("call", min(call_amount, self.chips))
 
+            # Calculate outs. The made hands above never look at them, so
+            # only weaker hands pay for the count
+            outs = self._calculate_outs(community_cards, board_key)
+
+            # Calculate odds against hitting
+            known_cards_count = len(self.hand) + len(community_cards)
+            unknown_cards = 52 - known_cards_count
+
+            if outs > 0:
+                odds_against_ratio = (unknown_cards - outs) / outs
+            else:
+                odds_against_ratio = 999  # Very high
+
+            # Decision based on pot odds vs odds against
+            # If pot odds > odds against (adjusted by threshold), it's profitable to call
+            should_call_by_odds = pot_odds_ratio > (odds_against_ratio * pot_odds_threshold)
+
             # Medium-strong hand with drawing potential
-            elif hand_rank >= 3 or should_call_by_odds:
+            if hand_rank >= 3 or should_call_by_odds:
                 # Call if pot odds are favorable or hand is decent, but fold to huge bets
                 if bet_to_stack_ratio > 0.5:  # Big bet with medium hand
                     if should_call_by_odds:
@@ -274,7 +303,7 @@ class AIBot(Player):
                 # Only call if pot odds are very good or bluffing
                 if should_call_by_odds and bet_to_stack_ratio < 0.3:
                     return ("call", min(call_amount, self.chips))
-                elif random.random() < bluff_rate * 0.4 and bet_to_stack_ratio < 0.25:
+                elif rand() < bluff_rate * 0.4 and bet_to_stack_ratio < 0.25:
                     return ("call", min(call_amount, self.chips))
                 else:
                     return ("fold", 0)
@@ -283,8 +312,8 @@ class AIBot(Player):
         if call_amount == 0:
             # Strong hand: usually bet
             if hand_strength >= 0.65:
-                if random.random() < (0.8 + aggression * 0.2):
-                    bet_size = int(pot * random.uniform(0.5, 1.0))
+                if rand() < (0.8 + aggression * 0.2):
+                    bet_size = int(pot * uniform(0.5, 1.0))
                     bet_size = max(min_raise, min(bet_size, self.chips))
                     return ("raise", bet_size)
                 else:
@@ -293,16 +322,16 @@ class AIBot(Player):
 
             # Medium hand: sometimes bet
             elif hand_strength >= 0.4:
-                if random.random() < (aggression * 0.7):
-                    bet_size = int(pot * random.uniform(0.4, 0.7))
+                if rand() < (aggression * 0.7):
+                    bet_size = int(pot * uniform(0.4, 0.7))
                     bet_size = max(min_raise, min(bet_size, self.chips))
                     return ("raise", bet_size)
                 return ("check", 0)
 
             # Weak hand: mostly check, occasionally bluff
             else:
-                if random.random() < bluff_rate * aggression:
-                    bet_size = int(pot * random.uniform(0.3, 0.6))
+                if rand() < bluff_rate * aggression:
+                    bet_size = int(pot * uniform(0.3, 0.6))
                     bet_size = max(min_raise, min(bet_size, self.chips))
                     return ("raise", bet_size)
                 return ("check", 0)
@@ -313,8 +342,8 @@ class AIBot(Player):
 
             if hand_strength >= 0.7:
                 # Strong pre-flop hand: raise or call
-                if random.random() < aggression and self.chips > call_amount + min_raise:
-                    raise_size = int(pot * random.uniform(0.5, 1.0))
+                if rand() < aggression and self.chips > call_amount + min_raise:
+                    raise_size = int(pot * uniform(0.5, 1.0))
                     raise_size = max(min_raise, min(raise_size, self.chips - call_amount))
                     return ("raise", raise_size)
                 return ("call", min(call_amount, self.chips))
@@ -325,7 +354,7 @@ class AIBot(Player):
                 return ("fold", 0)
             else:
                 # Weak hand: usually fold unless pot odds are amazing
-                if pot_odds < 0.15 or random.random() < bluff_rate:
+                if pot_odds < 0.15 or rand() < bluff_rate:
                     return ("call", min(call_amount, self.chips))
                 return ("fold", 0)
 
@@ -340,23 +369,7 @@ class AIBot(Player):
             return 0.3
 
         card1, card2 = self.hand
-        rank1, rank2 = card1.rank.value, card2.rank.value
-
-        # Pair
-        if rank1 == rank2:
-            return 0.5 + (rank1 / 28.0)  # Higher pairs are better
-
-        # High cards
-        high = max(rank1, rank2)
-        low = min(rank1, rank2)
-
-        # Suited
-        suited_bonus = 0.1 if card1.suit == card2.suit else 0
-
-        # Connected (potential straight)
-        connected_bonus = 0.05 if abs(rank1 - rank2) <= 2 else 0
-
-        # Base strength on high card
-        base_strength = (high / 28.0) + (low / 56.0)
-
-        return min(1.0, base_strength + suited_bonus + connected_bonus)
+        rank1, rank2 = card1.rank_value, card2.rank_value
+        if rank1 < rank2:
+            rank1, rank2 = rank2, rank1
+        return _PREFLOP_STRENGTH[(rank1 << 5) | (rank2 << 1) | (card1.suit_index == card2.suit_index)]
@@ -1,7 +1,7 @@
 """Poker card and deck implementation."""
 import random
 from enum import Enum
-from typing import List, Tuple
+from typing import List, Optional, Tuple
 
 
 class Suit(Enum):
@@ -41,12 +41,25 @@ class Rank(Enum):
         return self._display
 
 
+# Position of each suit in declaration order
+_SUIT_ORDER = {suit: i for i, suit in enumerate(Suit)}
+
+
 class Card:
     """Represents a playing card."""
 
     def __init__(self, rank: Rank, suit: Suit):
         self.rank = rank
         self.suit = suit
+        # Plain ints for hot paths, so they don't go through the Enum properties
+        self.rank_value = rank.value  # 2 (two) to 14 (ace)
+        self.suit_index = _SUIT_ORDER[suit]
+        # One bit per rank: bit 0 is a two, bit 12 is an ace
+        self.mask = 1 << (self.rank_value - 2)
+        # One bit per card: 13 bits per suit, so a hand packs into one int
+        self.bit = self.mask << (13 * self.suit_index)
+        # Small int unique to each of the 52 cards, used for hashing
+        self._key = self.rank_value * 4 + self.suit_index
 
     def __str__(self) -> str:
         return f"{self.rank.display}{self.suit.value}"
@@ -57,35 +70,50 @@ class Card:
     def __eq__(self, other) -> bool:
         if not isinstance(other, Card):
             return False
-        return self.rank == other.rank and self.suit == other.suit
+        return self._key == other._key
 
     def __hash__(self) -> int:
-        return hash((self.rank, self.suit))
+        return self._key
+
+
+# Every card once, suit by suit. Cards are never changed after construction,
+# so every deck shares these objects instead of building 52 new ones per hand.
+# The order matches hand key bits: FULL_DECK[i].bit == 1 << i
+FULL_DECK = tuple(Card(rank, suit) for suit in Suit for rank in Rank)
 
 
 class Deck:
     """Represents a deck of cards."""
 
-    def __init__(self):
+    def __init__(self, rng: Optional[random.Random] = None):
+        self._rng = rng if rng is not None else random.Random()
         self.cards: List[Card] = []
+        self._pos = 0  # Index of the next card to deal
         self.reset()
 
     def reset(self):
         """Reset and shuffle the deck."""
-        self.cards = [Card(rank, suit) for suit in Suit for rank in Rank]
+        self.cards = list(FULL_DECK)
+        self._pos = 0
         self.shuffle()
 
     def shuffle(self):
         """Shuffle the deck."""
-        random.shuffle(self.cards)
+        if self._pos:
+            # Only the undealt cards go back into play
+            del self.cards[:self._pos]
+            self._pos = 0
+        self._rng.shuffle(self.cards)
 
     def deal(self, num_cards: int = 1) -> List[Card]:
         """Deal cards from the deck."""
-        if num_cards > len(self.cards):
+        start = self._pos
+        end = start + num_cards
+        if end > len(self.cards):
             raise ValueError("Not enough cards in deck")
-        dealt = self.cards[:num_cards]
-        self.cards = self.cards[num_cards:]
-        return dealt
+        # Advance past the dealt cards instead of copying the rest of the deck
+        self._pos = end
+        return self.cards[start:end]
 
     def __len__(self) -> int:
-        return len(self.cards)
+        return len(self.cards) - self._pos
@@ -1,21 +1,29 @@
 """Main poker game logic."""
-from typing import List, Optional, Dict
+import random
+from typing import List, Optional
 from poker_cards import Deck, Card
 from player import Player, AIBot
-from hand_evaluator import HandEvaluator
+from hand_evaluator import HandEvaluator, HandRank
 
 
 class PokerGame:
     """Manages a poker game."""
 
-    def __init__(self, player: Player, num_bots: int = 3, small_blind: int = 10, bot_difficulty: str = "medium"):
+    def __init__(self, player: Player, num_bots: int = 3, small_blind: int = 10, bot_difficulty: str = "medium",
+                 seed: Optional[int] = None):
         self.player = player
-        self.bots = [AIBot(f"Bot {i+1}", difficulty=bot_difficulty) for i in range(num_bots)]
+        # A seed fixes the shuffles and every bot's choices, for replays and profiling
+        rng = random.Random(seed)
+        self.bots = [AIBot(f"Bot {i+1}", difficulty=bot_difficulty, rng=random.Random(rng.getrandbits(64)))
+                     for i in range(num_bots)]
         self.all_players = [player] + self.bots
-        self.deck = Deck()
+        self._assign_seats()
+        self.deck = Deck(rng)
         self.community_cards: List[Card] = []
+        self.community_key = 0  # community_cards packed one bit per card (see Card.bit)
         self.pot = 0
-        self.player_contributions: Dict[Player, int] = {}  # Track each player's contribution to pot
+        # Each player's contribution to the pot this hand, indexed by Player.seat
+        self.player_contributions: List[int] = [0] * len(self.all_players)
         self.small_blind = small_blind
         self.big_blind = small_blind * 2
         self.current_bet = 0
@@ -30,6 +38,7 @@ class PokerGame:
 
         # Remove players with no chips
         self.all_players = [p for p in self.all_players if p.chips > 0]
+        self._assign_seats()
 
         if len(self.all_players) < 2:
             return False  # Game over
@@ -37,8 +46,9 @@ class PokerGame:
         # Reset game state
         self.deck.reset()
         self.community_cards = []
+        self.community_key = 0
         self.pot = 0
-        self.player_contributions = {p: 0 for p in self.all_players}  # Reset contributions
+        self.player_contributions = [0] * len(self.all_players)  # Reset contributions
         self.current_bet = 0
         self.min_raise = self.big_blind
 
@@ -50,12 +60,17 @@ class PokerGame:
 
         return True
 
+    def _assign_seats(self):
+        """Number players by their index in all_players."""
+        for seat, p in enumerate(self.all_players):
+            p.seat = seat
+
     def post_blind(self, player_pos: int, amount: int):
         """Post a blind for a specific player position."""
-        player = self.all_players[player_pos]
-        actual_amount = player.bet(amount)
+        # Seats are positions in all_players, so the position indexes contributions directly
+        actual_amount = self.all_players[player_pos].bet(amount)
         self.pot += actual_amount
-        self.player_contributions[player] = self.player_contributions.get(player, 0) + actual_amount
+        self.player_contributions[player_pos] += actual_amount
         if amount == self.big_blind:
             self.current_bet = self.big_blind
         return actual_amount
@@ -67,38 +82,41 @@ class PokerGame:
         big_blind_pos = (self.dealer_position + 2) % num_players
 
         # Small blind
-        sb_player = self.all_players[small_blind_pos]
-        sb_amount = sb_player.bet(self.small_blind)
+        sb_amount = self.all_players[small_blind_pos].bet(self.small_blind)
         self.pot += sb_amount
-        self.player_contributions[sb_player] = self.player_contributions.get(sb_player, 0) + sb_amount
+        self.player_contributions[small_blind_pos] += sb_amount
 
         # Big blind
-        bb_player = self.all_players[big_blind_pos]
-        bb_amount = bb_player.bet(self.big_blind)
+        bb_amount = self.all_players[big_blind_pos].bet(self.big_blind)
         self.pot += bb_amount
-        self.player_contributions[bb_player] = self.player_contributions.get(bb_player, 0) + bb_amount
+        self.player_contributions[big_blind_pos] += bb_amount
         self.current_bet = self.big_blind
 
+    def _deal_community(self, num_cards: int):
+        """Burn a card, then deal num_cards to the board and pack them into community_key."""
+        self.deck.deal(1)  # Burn card
+        cards = self.deck.deal(num_cards)
+        self.community_cards.extend(cards)
+        for card in cards:
+            self.community_key |= card.bit
+
     def deal_flop(self):
         """Deal the flop (3 cards)."""
-        self.deck.deal(1)  # Burn card
-        self.community_cards.extend(self.deck.deal(3))
+        self._deal_community(3)
         self.current_bet = 0
         for p in self.all_players:
             p.current_bet = 0
 
     def deal_turn(self):
         """Deal the turn (1 card)."""
-        self.deck.deal(1)  # Burn card
-        self.community_cards.extend(self.deck.deal(1))
+        self._deal_community(1)
         self.current_bet = 0
         for p in self.all_players:
             p.current_bet = 0
 
     def deal_river(self):
         """Deal the river (1 card)."""
-        self.deck.deal(1)  # Burn card
-        self.community_cards.extend(self.deck.deal(1))
+        self._deal_community(1)
         self.current_bet = 0
         for p in self.all_players:
             p.current_bet = 0
@@ -108,25 +126,35 @@ class PokerGame:
         Conduct a betting round.
         Returns False if all players except one have folded.
         """
-        active_players = [p for p in self.all_players if not p.folded and not p.all_in]
-
-        if len(active_players) <= 1:
+        # Seats still able to act and seats that folded, one bit per index into all_players
+        num_players = len(self.all_players)
+        active_mask = 0
+        folded_mask = 0
+        for i, p in enumerate(self.all_players):
+            if p.folded:
+                folded_mask |= 1 << i
+            elif not p.all_in:
+                active_mask |= 1 << i
+
+        if active_mask & (active_mask - 1) == 0:  # One player or none
             return False
 
-        # Players who need to act
-        players_to_act = active_players.copy()
+        # Seats that need to act
+        to_act = active_mask
         last_raiser = None
 
         # Start from the position after the dealer
-        current_pos = starting_position % len(self.all_players)
-
-        while players_to_act:
+        current_pos = starting_position % num_players
+
+        while to_act:
+            # Jump to the next seat still to act, wrapping past the last one
+            ahead = to_act >> current_pos
+            if ahead:
+                current_pos += (ahead & -ahead).bit_length() - 1
+            else:
+                current_pos = (to_act & -to_act).bit_length() - 1
             player = self.all_players[current_pos]
-
-            # Skip if folded, all-in, or already acted
-            if player.folded or player.all_in or player not in players_to_act:
-                current_pos = (current_pos + 1) % len(self.all_players)
-                continue
+            seat_bit = 1 << current_pos
 
             # Player needs to act
             call_amount = self.current_bet - player.current_bet
@@ -134,18 +162,19 @@ class PokerGame:
             # Get player action (this will be handled by UI for human player)
             if isinstance(player, AIBot):
                 action, amount = player.make_decision(
-                    self.pot, self.current_bet, self.community_cards, self.min_raise
+                    self.pot, self.current_bet, self.community_cards, self.min_raise,
+                    board_key=self.community_key
                 )
 
                 if action == "fold":
                     player.fold()
-                    players_to_act.remove(player)
+                    to_act &= ~seat_bit
                 elif action == "call":
                     actual_bet = player.bet(call_amount)
                     self.pot += actual_bet
-                    players_to_act.remove(player)
+                    to_act &= ~seat_bit
                 elif action == "check":
-                    players_to_act.remove(player)
+                    to_act &= ~seat_bit
                 elif action == "raise":
                     total_bet = call_amount + amount
                     actual_bet = player.bet(total_bet)
@@ -153,14 +182,21 @@ class PokerGame:
                     self.current_bet = player.current_bet
                     self.min_raise = amount
                     last_raiser = player
-                    # Reset players_to_act (everyone needs to respond to raise)
-                    players_to_act = [p for p in active_players if p != player and not p.folded and not p.all_in]
+                    # Everyone else still in needs to respond to the raise
+                    to_act = active_mask & ~seat_bit
+
+                # Folded and all-in players never act again this round
+                if player.folded:
+                    folded_mask |= seat_bit
+                    active_mask &= ~seat_bit
+                elif player.all_in:
+                    active_mask &= ~seat_bit
 
-            current_pos = (current_pos + 1) % len(self.all_players)
+            # No wrap needed: past the last seat the jump above starts over
+            current_pos += 1
 
         # Check if only one player remains
-        remaining = [p for p in self.all_players if not p.folded]
-        return len(remaining) > 1
+        return num_players - folded_mask.bit_count() > 1
 
     def determine_winners(self) -> List[tuple[Player, int, str]]:
         """
@@ -173,8 +209,8 @@ class PokerGame:
             # Only one player left - they win only what they contributed
             winner = active_players[0]
             # Calculate total pot that winner is eligible for
-            winner_contribution = self.player_contributions.get(winner, 0)
-            eligible_pot = min(self.pot, sum(min(self.player_contributions.get(p, 0), winner_contribution)
+            winner_contribution = self.player_contributions[winner.seat]
+            eligible_pot = min(self.pot, sum(min(self.player_contributions[p.seat], winner_contribution)
                                              for p in self.all_players))
             winner.win(eligible_pot)
             return [(winner, eligible_pot, "Opponent(s) folded")]
@@ -182,13 +218,12 @@ class PokerGame:
         # Calculate side pots
         side_pots = self._calculate_side_pots(active_players)
 
-        # Evaluate all hands
+        # Evaluate all hands, once each. Packed keys hit the same evaluator
+        # cache the bots filled while deciding on this board
         hands = {}
         for player in active_players:
-            full_hand = player.hand + self.community_cards
-            rank, tiebreaker = HandEvaluator.evaluate_hand(full_hand)
-            hand_name = HandEvaluator.get_hand_name(full_hand)
-            hands[player] = (rank, tiebreaker, hand_name)
+            rank, tiebreaker = HandEvaluator.evaluate_packed(player.hand_key | self.community_key)
+            hands[player] = (rank, tiebreaker, HandRank.NAMES[rank])
 
         # Award each side pot
         results = []
@@ -196,11 +231,12 @@ class PokerGame:
             # Find best hand among eligible players
             eligible_hands = [(p, hands[p][0], hands[p][1], hands[p][2])
                              for p in eligible_players]
-            eligible_hands.sort(key=lambda x: (x[1], x[2]), reverse=True)
+            # Only the best hand matters, so take the maximum instead of sorting
+            best = max(eligible_hands, key=lambda x: (x[1], x[2]))
 
             # Find all winners of this pot (ties possible)
-            best_rank = eligible_hands[0][1]
-            best_tiebreaker = eligible_hands[0][2]
+            best_rank = best[1]
+            best_tiebreaker = best[2]
             pot_winners = [h for h in eligible_hands
                           if h[1] == best_rank and h[2] == best_tiebreaker]
 
@@ -226,11 +262,15 @@ class PokerGame:
         Returns list of (pot_amount, eligible_players) tuples.
         """
         # Get contributions of active players
-        contributions = [(p, self.player_contributions.get(p, 0)) for p in active_players]
+        contributions = [(p, self.player_contributions[p.seat]) for p in active_players]
 
         # Sort by contribution amount
         contributions.sort(key=lambda x: x[1])
 
+        # Folded players' chips stay in the pots up to what they put in
+        folded = sorted(self.player_contributions[p.seat] for p in self.all_players if p.folded)
+        next_folded = 0  # First folded contribution above previous_level
+
         pots = []
         previous_level = 0
 
@@ -239,13 +279,15 @@ class PokerGame:
                 # Create a pot for this level
                 pot_size = (contribution - previous_level) * (len(contributions) - i)
 
-                # Also add contributions from folded players up to this level
-                for folded_player in [p for p in self.all_players if p.folded]:
-                    folded_contribution = self.player_contributions.get(folded_player, 0)
-                    pot_size += max(0, min(contribution, folded_contribution) - previous_level)
+                # Folded players who stopped inside this level add what they
+                # put in above the previous one; the rest add the full step
+                while next_folded < len(folded) and folded[next_folded] <= contribution:
+                    pot_size += folded[next_folded] - previous_level
+                    next_folded += 1
+                pot_size += (contribution - previous_level) * (len(folded) - next_folded)
 
                 # Players eligible for this pot (all who contributed at least this much)
-                eligible = [p for p, c in contributions if c >= contribution]
+                eligible = [p for p, _ in contributions[i:]]
 
                 pots.append((pot_size, eligible))
                 previous_level = contribution
@@ -262,16 +304,19 @@ class PokerGame:
         if self.player.chips <= 0:
             return True
 
-        # Game over if only one player has chips (including the human player)
-        players_with_chips = [p for p in self.all_players if p.chips > 0]
-        if len(players_with_chips) <= 1:
-            return True
-
-        # Game over if player is not in the game anymore (no chips)
-        if self.player not in self.all_players:
-            return True
+        # Game over if only one player has chips (including the human player),
+        # or if the player is not in the game anymore. One pass settles both
+        with_chips = 0
+        seated = False
+        for p in self.all_players:
+            if p is self.player:
+                seated = True
+            if p.chips > 0:
+                with_chips += 1
+            if seated and with_chips > 1:
+                return False
 
-        return False
+        return True
 
     def move_dealer_button(self):
         """Move dealer button to next player."""
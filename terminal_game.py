@@ -1,11 +1,21 @@
 """Main game controller."""
-from player import Player
+from player import Player, AIBot
 from poker_game import PokerGame
+from hand_evaluator import HandEvaluator
 from ui import PokerUI
 from education import PokerEducation
 from llm_evaluator import LLMEvaluator
+from rich.prompt import Confirm
+import atexit
 import json
 import os
+import signal
+import sys
+
+
+def _exit_on_signal(signum, frame):
+    """Turn a termination signal into a normal exit, so atexit hooks still run."""
+    raise SystemExit(128 + signum)
 
 
 class GameController:
@@ -13,10 +23,48 @@ class GameController:
 
     SAVE_FILE = "player_data.json"
 
+    # Streets after pre-flop, in order, with the deal that starts each one
+    _STREETS = (
+        ("Flop", PokerGame.deal_flop),
+        ("Turn", PokerGame.deal_turn),
+        ("River", PokerGame.deal_river),
+    )
+
+    # Outs question and hint for each street
+    _STAGE_QUESTIONS = {
+        "Flop": (
+            "How many outs do you have for the TURN card?\n(Count cards that would improve your hand on the next card)",
+            "Outs are cards that will improve your hand. We're counting what helps on the TURN only.",
+        ),
+        "Turn": (
+            "How many outs do you have for the RIVER card?\n(Count cards that would improve your hand on the final card)",
+            "Count remaining cards in the deck that would give you a better hand on the RIVER.",
+        ),
+        "River": (
+            "How many outs did you have?\n(This is for learning - the hand is complete)",
+            "Count what cards would have helped you.",
+        ),
+    }
+
     def __init__(self):
         self.ui = PokerUI()
+        self._last_saved = None  # (name, chips) last read from or written to SAVE_FILE
         self.player = self.load_player()
         self.game = None
+        self._render_sig = None  # What the last show_game_state drew (see _render_state)
+        # Single-slot cache for the outs questions: ((hand key, board key), (outs_dict, total))
+        self._outs_cache = (None, ({}, 0))
+        # Only offer the tutor chat when someone is at the keyboard
+        self._interactive = sys.stdin.isatty()
+        if not self._interactive:
+            # Nobody is watching bot actions go by, so don't pause after them
+            self.ui.bot_action_delay = 0
+        # Catch whatever is left unsaved on the way out. Python skips atexit on
+        # SIGTERM/SIGHUP (kill, closing the terminal), so exit cleanly on those.
+        atexit.register(self.save_player)
+        for name in ("SIGTERM", "SIGHUP"):
+            if hasattr(signal, name):  # no SIGHUP on Windows
+                signal.signal(getattr(signal, name), _exit_on_signal)
 
     def load_player(self) -> Player:
         """Load or create player."""
@@ -24,8 +72,17 @@ class GameController:
             try:
                 with open(self.SAVE_FILE, 'r') as f:
                     data = json.load(f)
-                    return Player(data.get("name", "Player"), data.get("chips", 1000))
-            except:
+                    player = Player(data.get("name", "Player"), data.get("chips", 1000))
+                    self._last_saved = (player.name, player.chips)
+                    return player
+            except (ValueError, AttributeError):
+                # Not JSON, or not an object: set it aside so later launches
+                # don't parse it again, and keep it for inspection
+                try:
+                    os.replace(self.SAVE_FILE, self.SAVE_FILE + ".corrupt")
+                except OSError:  # e.g. a read-only directory; just start fresh
+                    pass
+            except OSError:
                 pass
 
         # Create new player
@@ -35,17 +92,40 @@ class GameController:
         return Player(name, 1000)
 
     def save_player(self):
-        """Save player data."""
+        """Save player data, unless it is unchanged since the last save."""
+        snapshot = (self.player.name, self.player.chips)
+        if snapshot == self._last_saved:
+            return
+
         data = {
             "name": self.player.name,
             "chips": self.player.chips
         }
         with open(self.SAVE_FILE, 'w') as f:
             json.dump(data, f)
+        self._last_saved = snapshot
+
+    def _render_state(self, force: bool = False):
+        """Redraw the game state, unless nothing on it changed since the last draw."""
+        game = self.game
+        sig = (game.pot, game.current_bet, len(game.community_cards), game.dealer_position,
+               tuple((p.chips, p.current_bet, p.folded, p.all_in) for p in game.all_players))
+        if not force and sig == self._render_sig:
+            return
+        self._render_sig = sig
+        self.ui.show_game_state(
+            self.player,
+            game.all_players,
+            game.community_cards,
+            game.pot,
+            game.current_bet,
+            game.dealer_position
+        )
 
     def run(self):
         """Main game loop."""
         while True:
+            # Blocks on Prompt.ask until a choice is typed, so the menu idles without polling
             choice = self.ui.show_main_menu()
 
             if choice == "1":
@@ -89,87 +169,30 @@ class GameController:
             if not self.game.start_new_hand():
                 break
 
-            self.ui.show_game_state(
-                self.player,
-                self.game.all_players,
-                self.game.community_cards,
-                self.game.pot,
-                self.game.current_bet,
-                self.game.dealer_position
-            )
+            self._render_state(force=True)
 
             self.ui.show_message("New hand started!", "bold yellow")
             self.ui.ask_continue("Press Enter to continue")
 
-            # Pre-flop betting
-            if not self.run_betting_round("Pre-flop"):
-                continue_playing = self.end_hand()
-                continue
-
-            # Flop
-            self.game.deal_flop()
-            self.ui.show_game_state(
-                self.player,
-                self.game.all_players,
-                self.game.community_cards,
-                self.game.pot,
-                self.game.current_bet,
-                self.game.dealer_position
-            )
+            # Pre-flop betting, then deal and bet each street while two or more players remain
+            if self.run_betting_round("Pre-flop"):
+                for stage, deal in self._STREETS:
+                    deal(self.game)
+                    self._render_state(force=True)
 
-            # Educational questions after flop
-            if not self.player.folded:
-                self.ask_educational_questions("Flop")
-
-            if not self.run_betting_round("Flop"):
-                continue_playing = self.end_hand()
-                continue
-
-            # Turn
-            self.game.deal_turn()
-            self.ui.show_game_state(
-                self.player,
-                self.game.all_players,
-                self.game.community_cards,
-                self.game.pot,
-                self.game.current_bet,
-                self.game.dealer_position
-            )
-
-            # Educational questions after turn
-            if not self.player.folded:
-                self.ask_educational_questions("Turn")
-
-            if not self.run_betting_round("Turn"):
-                continue_playing = self.end_hand()
-                continue
-
-            # River
-            self.game.deal_river()
-            self.ui.show_game_state(
-                self.player,
-                self.game.all_players,
-                self.game.community_cards,
-                self.game.pot,
-                self.game.current_bet,
-                self.game.dealer_position
-            )
+                    # Educational questions after the deal
+                    if not self.player.folded:
+                        self.ask_educational_questions(stage)
 
-            # Educational questions after river
-            if not self.player.folded:
-                self.ask_educational_questions("River")
+                    if not self.run_betting_round(stage):
+                        break
 
-            if not self.run_betting_round("River"):
-                continue_playing = self.end_hand()
-                continue
-
-            # Showdown
+            # Showdown, or the last player left takes the pot
             continue_playing = self.end_hand()
 
         # Game over - check if player won
         # Player wins if they have chips and all bots are out
-        bots_with_chips = [b for b in self.game.bots if b.chips > 0]
-        player_won = self.player.chips > 0 and len(bots_with_chips) == 0
+        player_won = self.player.chips > 0 and not any(b.chips > 0 for b in self.game.bots)
 
         self.ui.show_game_over(player_won)
         self.save_player()
@@ -177,6 +200,8 @@ class GameController:
 
     def ask_educational_questions(self, stage: str):
         """Ask educational questions specific to the stage."""
+        # The questions push the table off screen, so the next state is drawn fresh
+        self._render_sig = None
         self.ui.show_message(f"\n=== Educational Questions ({stage}) ===", "bold magenta")
 
         # Question 1: Pot Odds (Avi Rubin style - as a ratio)
@@ -194,24 +219,11 @@ class GameController:
             self.ui.show_feedback(is_correct, feedback)
 
         # Question 2: Outs (stage-specific)
-        outs_dict = PokerEducation.calculate_outs(
-            self.player.hand,
-            self.game.community_cards,
-            []
-        )
-        total_outs = PokerEducation.count_total_outs(outs_dict)
+        outs_dict, total_outs = self._outs()
 
         if total_outs > 0 or stage in ["Turn", "River"]:
             # Create clearer question based on stage
-            if stage == "Flop":
-                question = f"How many outs do you have for the TURN card?\n(Count cards that would improve your hand on the next card)"
-                hint = "Outs are cards that will improve your hand. We're counting what helps on the TURN only."
-            elif stage == "Turn":
-                question = f"How many outs do you have for the RIVER card?\n(Count cards that would improve your hand on the final card)"
-                hint = "Count remaining cards in the deck that would give you a better hand on the RIVER."
-            else:  # River
-                question = f"How many outs did you have?\n(This is for learning - the hand is complete)"
-                hint = "Count what cards would have helped you."
+            question, hint = self._STAGE_QUESTIONS[stage]
 
             answer = self.ui.ask_educational_question(question, hint)
 
@@ -223,9 +235,15 @@ class GameController:
                 "stage": stage
             }
 
-            is_correct, feedback, reasoning = LLMEvaluator.evaluate_answer_with_llm(
-                "outs", answer, total_outs, context
-            )
+            if total_outs == 0:
+                # Reasoning about opponents can only take outs away, so with
+                # none to begin with the count alone decides; no LLM needed
+                is_correct, feedback = PokerEducation.evaluate_answer("outs", answer, 0)
+                reasoning = ""
+            else:
+                is_correct, feedback, reasoning = LLMEvaluator.evaluate_answer_with_llm(
+                    "outs", answer, total_outs, context
+                )
 
             if not is_correct and total_outs > 0:
                 outs_display = PokerEducation.get_out_cards_display(outs_dict)
@@ -238,8 +256,8 @@ class GameController:
                 self.ui.show_message(f"\n[dim]Detailed reasoning: {reasoning}[/dim]\n", "")
 
             # Offer interactive chat
-            from rich.prompt import Confirm
-            if Confirm.ask("[cyan]Want to discuss this hand with the poker tutor?[/cyan]", default=False):
+            if self._interactive and Confirm.ask("[cyan]Want to discuss this hand with the poker tutor?[/cyan]",
+                                                 default=False):
                 LLMEvaluator.interactive_chat(context, self.ui)
 
             # Question 3: Win Odds (Avi Rubin style - as a ratio)
@@ -262,13 +280,29 @@ class GameController:
                 if call_amount > 0:
                     pot_odds_ratio, pot_odds_str = pot_odds
                     win_odds_ratio, win_odds_str = win_odds
-                    hand_rank, _ = HandEvaluator.evaluate_hand(self.player.hand + self.game.community_cards)
+                    hand_rank, _ = HandEvaluator.evaluate_packed(self.player.hand_key | self.game.community_key)
 
                     recommendation = PokerEducation.get_recommendation(
                         pot_odds_ratio, win_odds_ratio, pot_odds_str, win_odds_str, hand_rank
                     )
                     self.ui.show_message(f"\n[yellow]Analysis:[/yellow] {recommendation}\n", "")
 
+    def _outs(self):
+        """Outs by improvement and their total for the current cards, computed once per street."""
+        state_key = (self.player.hand_key, self.game.community_key)
+        cached_key, cached = self._outs_cache
+        if cached_key == state_key:
+            return cached
+
+        outs_dict = PokerEducation.calculate_outs(
+            self.player.hand,
+            self.game.community_cards,
+            []
+        )
+        result = (outs_dict, PokerEducation.count_total_outs(outs_dict))
+        self._outs_cache = (state_key, result)
+        return result
+
     def run_betting_round(self, round_name: str) -> bool:
         """
         Run a betting round.
@@ -276,38 +310,44 @@ class GameController:
         """
         self.ui.show_message(f"\n--- {round_name} Betting ---", "bold cyan")
 
+        num_players = len(self.game.all_players)
+
         # Determine starting position
         if round_name == "Pre-flop":
             # Pre-flop starts after big blind
-            start_pos = (self.game.dealer_position + 3) % len(self.game.all_players)
+            start_pos = (self.game.dealer_position + 3) % num_players
         else:
             # Post-flop starts after dealer
-            start_pos = (self.game.dealer_position + 1) % len(self.game.all_players)
-
-        active_players = [p for p in self.game.all_players if not p.folded and not p.all_in]
-        players_to_act = active_players.copy()
+            start_pos = (self.game.dealer_position + 1) % num_players
+
+        # Seats still able to act, seats that owe an action and seats that folded,
+        # one bit per index into all_players (same scheme as PokerGame.betting_round)
+        active_mask = 0
+        folded_mask = 0
+        for i, p in enumerate(self.game.all_players):
+            if p.folded:
+                folded_mask |= 1 << i
+            elif not p.all_in:
+                active_mask |= 1 << i
+        to_act = active_mask
 
         current_pos = start_pos
 
-        while players_to_act:
+        while to_act:
+            # Jump to the next seat still to act, wrapping past the last one
+            ahead = to_act >> current_pos
+            if ahead:
+                current_pos += (ahead & -ahead).bit_length() - 1
+            else:
+                current_pos = (to_act & -to_act).bit_length() - 1
             player = self.game.all_players[current_pos]
-
-            if player.folded or player.all_in or player not in players_to_act:
-                current_pos = (current_pos + 1) % len(self.game.all_players)
-                continue
+            seat_bit = 1 << current_pos
 
             call_amount = self.game.current_bet - player.current_bet
 
             # Player's turn
             if player == self.player:
-                self.ui.show_game_state(
-                    self.player,
-                    self.game.all_players,
-                    self.game.community_cards,
-                    self.game.pot,
-                    self.game.current_bet,
-                    self.game.dealer_position
-                )
+                self._render_state()
 
                 action, amount = self.ui.get_player_action(
                     self.game.current_bet,
@@ -318,44 +358,44 @@ class GameController:
 
                 if action == "fold":
                     player.fold()
-                    players_to_act.remove(player)
+                    to_act &= ~seat_bit
                 elif action == "call":
                     actual_bet = player.bet(call_amount)
                     self.game.pot += actual_bet
-                    players_to_act.remove(player)
+                    to_act &= ~seat_bit
                 elif action == "check":
-                    players_to_act.remove(player)
+                    to_act &= ~seat_bit
                 elif action == "bet" or action == "raise":
                     total_bet = call_amount + amount
                     actual_bet = player.bet(total_bet)
                     self.game.pot += actual_bet
                     self.game.current_bet = player.current_bet
                     self.game.min_raise = amount
-                    # Reset players_to_act
-                    players_to_act = [p for p in active_players if p != player and not p.folded and not p.all_in]
+                    # Everyone else still in needs to respond
+                    to_act = active_mask & ~seat_bit
 
             else:
                 # AI bot
-                from player import AIBot
                 if isinstance(player, AIBot):
                     action, amount = player.make_decision(
                         self.game.pot,
                         self.game.current_bet,
                         self.game.community_cards,
-                        self.game.min_raise
+                        self.game.min_raise,
+                        board_key=self.game.community_key
                     )
 
                     if action == "fold":
                         player.fold()
-                        players_to_act.remove(player)
+                        to_act &= ~seat_bit
                         self.ui.show_bot_action(player.name, "fold")
                     elif action == "call":
                         actual_bet = player.bet(call_amount)
                         self.game.pot += actual_bet
-                        players_to_act.remove(player)
+                        to_act &= ~seat_bit
                         self.ui.show_bot_action(player.name, "call", actual_bet)
                     elif action == "check":
-                        players_to_act.remove(player)
+                        to_act &= ~seat_bit
                         self.ui.show_bot_action(player.name, "check")
                     elif action == "raise":
                         total_bet = call_amount + amount
@@ -363,14 +403,21 @@ class GameController:
                         self.game.pot += actual_bet
                         self.game.current_bet = player.current_bet
                         self.game.min_raise = amount
-                        players_to_act = [p for p in active_players if p != player and not p.folded and not p.all_in]
+                        to_act = active_mask & ~seat_bit
                         self.ui.show_bot_action(player.name, "raise", actual_bet)
 
-            current_pos = (current_pos + 1) % len(self.game.all_players)
+            # Folded and all-in players never act again this round
+            if player.folded:
+                folded_mask |= seat_bit
+                active_mask &= ~seat_bit
+            elif player.all_in:
+                active_mask &= ~seat_bit
+
+            # No wrap needed: past the last seat the jump above starts over
+            current_pos += 1
 
         # Check if only one player remains
-        remaining = [p for p in self.game.all_players if not p.folded]
-        return len(remaining) > 1
+        return num_players - folded_mask.bit_count() > 1
 
     def end_hand(self) -> bool:
         """
@@ -378,18 +425,11 @@ class GameController:
         Returns True if player wants to continue, False otherwise.
         """
         winners = self.game.determine_winners()
-        self.ui.show_game_state(
-            self.player,
-            self.game.all_players,
-            self.game.community_cards,
-            self.game.pot,
-            self.game.current_bet,
-            self.game.dealer_position
-        )
+        self._render_state(force=True)
         self.ui.show_winners(winners)
 
         self.game.move_dealer_button()
-        self.save_player()
+        self.save_player()  # No-op when the hand left chips unchanged
 
         if not self.game.is_game_over():
             return self.ui.ask_continue("Continue to next hand?")
@@ -4,6 +4,8 @@ from poker_cards import Card, Deck, Rank, Suit
 from hand_evaluator import HandEvaluator, HandRank
 from player import Player, AIBot
 from poker_game import PokerGame
+from education import PokerEducation
+from llm_evaluator import _first_json_object, _grade_bare_answer
 
 
 class TestPokerCards(unittest.TestCase):
@@ -152,6 +154,60 @@ class TestHandEvaluator(unittest.TestCase):
         rank, _ = HandEvaluator.evaluate_hand(cards)
         self.assertEqual(rank, HandRank.HIGH_CARD)
 
+    def test_seven_card_best_hand(self):
+        """Test best hand is found among seven cards."""
+        cards = [
+            Card(Rank.KING, Suit.HEARTS),
+            Card(Rank.KING, Suit.CLUBS),
+            Card(Rank.NINE, Suit.SPADES),
+            Card(Rank.NINE, Suit.DIAMONDS),
+            Card(Rank.NINE, Suit.HEARTS),
+            Card(Rank.FOUR, Suit.CLUBS),
+            Card(Rank.FOUR, Suit.HEARTS)
+        ]
+        rank, tiebreakers = HandEvaluator.evaluate_hand(cards)
+        self.assertEqual(rank, HandRank.FULL_HOUSE)
+        self.assertEqual(tiebreakers, [9, 13])
+
+    def test_wheel_is_lowest_straight(self):
+        """Test A-2-3-4-5 ranks below a six-high straight."""
+        wheel = [
+            Card(Rank.ACE, Suit.HEARTS),
+            Card(Rank.TWO, Suit.DIAMONDS),
+            Card(Rank.THREE, Suit.CLUBS),
+            Card(Rank.FOUR, Suit.HEARTS),
+            Card(Rank.FIVE, Suit.SPADES)
+        ]
+        six_high = wheel[1:] + [Card(Rank.SIX, Suit.CLUBS)]
+        self.assertEqual(HandEvaluator.evaluate_hand(wheel), (HandRank.STRAIGHT, [5]))
+        self.assertEqual(HandEvaluator.compare_hands(wheel, six_high), -1)
+        self.assertEqual(HandEvaluator.evaluate_hand(wheel + [Card(Rank.KING, Suit.CLUBS)]),
+                         (HandRank.STRAIGHT, [5]))
+
+    def test_count_outs(self):
+        """Test counted outs match trying every unseen card."""
+        hand = [
+            Card(Rank.ACE, Suit.HEARTS),
+            Card(Rank.TEN, Suit.HEARTS),
+            Card(Rank.SEVEN, Suit.HEARTS),
+            Card(Rank.SIX, Suit.CLUBS),
+            Card(Rank.FIVE, Suit.HEARTS),
+            Card(Rank.FIVE, Suit.SPADES)
+        ]
+        current = HandEvaluator.evaluate_hand(hand)
+        expected = sum(1 for card in Deck().cards if card not in hand
+                       and HandEvaluator.evaluate_hand(hand + [card]) > current)
+        self.assertEqual(HandEvaluator.count_outs(HandEvaluator._hand_key(hand)), expected)
+
+        quads = [
+            Card(Rank.KING, Suit.HEARTS),
+            Card(Rank.KING, Suit.DIAMONDS),
+            Card(Rank.KING, Suit.CLUBS),
+            Card(Rank.KING, Suit.SPADES),
+            Card(Rank.ACE, Suit.HEARTS)
+        ]
+        self.assertEqual(HandEvaluator.count_outs(HandEvaluator._hand_key(quads)), 0)
+
 
 class TestPlayer(unittest.TestCase):
     """Test player class."""
@@ -213,16 +269,19 @@ class TestAIBot(unittest.TestCase):
 class TestPokerGame(unittest.TestCase):
     """Test poker game."""
 
+    def setUp(self):
+        # Tests deal from and mutate the game, so each gets a fresh one
+        self.player = Player("Test", 1000)
+        self.game = PokerGame(self.player, num_bots=2)
+
     def test_game_creation(self):
         """Test game creation."""
-        player = Player("Test", 1000)
-        game = PokerGame(player, num_bots=2)
+        game = self.game
         self.assertEqual(len(game.all_players), 3)
 
     def test_start_new_hand(self):
         """Test starting new hand."""
-        player = Player("Test", 1000)
-        game = PokerGame(player, num_bots=2)
+        player, game = self.player, self.game
         success = game.start_new_hand()
         self.assertTrue(success)
         self.assertEqual(len(player.hand), 2)
@@ -230,16 +289,14 @@ class TestPokerGame(unittest.TestCase):
 
     def test_deal_flop(self):
         """Test dealing flop."""
-        player = Player("Test", 1000)
-        game = PokerGame(player, num_bots=2)
+        game = self.game
         game.start_new_hand()
         game.deal_flop()
         self.assertEqual(len(game.community_cards), 3)
 
     def test_deal_turn(self):
         """Test dealing turn."""
-        player = Player("Test", 1000)
-        game = PokerGame(player, num_bots=2)
+        game = self.game
         game.start_new_hand()
         game.deal_flop()
         game.deal_turn()
@@ -247,14 +304,80 @@ class TestPokerGame(unittest.TestCase):
 
     def test_deal_river(self):
         """Test dealing river."""
-        player = Player("Test", 1000)
-        game = PokerGame(player, num_bots=2)
+        game = self.game
         game.start_new_hand()
         game.deal_flop()
         game.deal_turn()
         game.deal_river()
         self.assertEqual(len(game.community_cards), 5)
 
+    def test_community_key(self):
+        """Test the packed board follows the community cards."""
+        game = self.game
+        game.start_new_hand()
+        self.assertEqual(game.community_key, 0)
+        for deal in (game.deal_flop, game.deal_turn, game.deal_river):
+            deal()
+            self.assertEqual(game.community_key, HandEvaluator._hand_key(game.community_cards))
+        game.start_new_hand()
+        self.assertEqual(game.community_key, 0)
+
+
+
+class TestPokerEducation(unittest.TestCase):
+    """Test answer parsing."""
+
+    def test_extract_number(self):
+        """Test plain numbers and + - * / arithmetic."""
+        self.assertEqual(PokerEducation._extract_number("9"), 9.0)
+        self.assertEqual(PokerEducation._extract_number("4+9"), 13.0)
+        self.assertAlmostEqual(PokerEducation._extract_number("(47-9)/9"), 38 / 9)
+
+    def test_extract_number_rejects_unsafe(self):
+        """Test unsupported or failing expressions fall back to the first number."""
+        # ** is not evaluated, so 2**3 is not 8
+        self.assertEqual(PokerEducation._extract_number("2**3"), 2.0)
+        self.assertEqual(PokerEducation._extract_number("1/0"), 1.0)
+
+    def test_extract_number_huge_input(self):
+        """Test oversized answers don't raise."""
+        PokerEducation._extract_number("9" * 400 + "-1")
+        PokerEducation._extract_number("-" * 100000 + "1")
+        is_correct, _ = PokerEducation.evaluate_answer("outs", "9" * 400 + "-1", 5)
+        self.assertFalse(is_correct)
+
+
+
+class TestLLMEvaluatorParsing(unittest.TestCase):
+    """Test the LLM evaluator's local parsing helpers."""
+
+    def test_first_json_object_trailing_brace(self):
+        """Test text after the object that contains a brace."""
+        text = '{"correct": true} Note: see {the formula'
+        self.assertEqual(_first_json_object(text), {"correct": True})
+
+    def test_first_json_object_brace_in_string(self):
+        """Test a closing brace inside a string value."""
+        text = 'Verdict: {"feedback": "use } carefully", "correct": false}'
+        self.assertEqual(_first_json_object(text),
+                         {"feedback": "use } carefully", "correct": False})
+
+    def test_first_json_object_incomplete(self):
+        """Test a half-streamed object."""
+        self.assertIsNone(_first_json_object('{"correct": tr'))
+
+    def test_grade_bare_answer(self):
+        """Test bare numbers and ratios are graded without the LLM."""
+        self.assertTrue(_grade_bare_answer("outs", "9", 9)[0])
+        self.assertTrue(_grade_bare_answer("outs", "4+5", 9)[0])
+        self.assertTrue(_grade_bare_answer("pot_odds", "3:1", (3.0, "3:1"))[0])
+        self.assertTrue(_grade_bare_answer("pot_odds", "3/1", (3.0, "3:1"))[0])
+        self.assertFalse(_grade_bare_answer("outs", "8", 9)[0])
+
+    def test_grade_bare_answer_needs_llm(self):
+        """Test answers with reasoning are left to the LLM."""
+        self.assertIsNone(_grade_bare_answer("outs", "9 because flush", 9))
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -1,63 +1,176 @@
 """Visual UI using rich library."""
-from rich.console import Console
+from rich.console import Console, Group, RenderableType
 from rich.table import Table
 from rich.panel import Panel
 from rich.layout import Layout
 from rich.text import Text
 from rich.prompt import Prompt, IntPrompt, Confirm
 from rich import box
-from typing import List, Optional
-from poker_cards import Card
+from typing import Any, Dict, List, Optional, Tuple
+import time
+from functools import lru_cache
+from poker_cards import Card, FULL_DECK
 from player import Player
-from hand_evaluator import HandEvaluator
+from hand_evaluator import HandEvaluator, HandRank
+
+_TITLE_PANEL = Panel(
+    Text("POKER LEARNING GAME", style="bold magenta", justify="center"),
+    border_style="bright_blue"
+)
+# Display text for every card face, built once instead of per redraw
+_CARD_LABELS = {card: str(card) for card in FULL_DECK}
+# Space between cards in a row. A row of cards is one styled span with the gaps
+# inside it, so the terminal gets one pair of style codes rather than one per card.
+_CARD_GAP = " " * 7
+# Status column and name markup for the player table
+_STATUS_FOLDED = "[bold red on white]FOLDED[/bold red on white]"
+_STATUS_ALL_IN = "[magenta]All In[/magenta]"
+_STATUS_ACTIVE = "[green]Active[/green]"
+_DEALER_TAG = " [bold](D)[/bold]"
+_NAME_FOLDED_SUFFIX = " [bold red]✗ FOLDED[/bold red]"
+# (color, mark) for a right / wrong answer in show_feedback
+_FEEDBACK_STYLES = {True: ("green", "✓"), False: ("red", "✗")}
+# Accepted answers for the fixed-choice prompts
+_MAIN_MENU_CHOICES = ("1", "2", "3", "4")
+_STORE_CHOICES = ("y", "n", "yes", "no", "exit")
+_STORE_YES = frozenset(("y", "yes"))
+_DIFFICULTY_CHOICES = ("easy", "medium", "hard")
+# Seconds to pause after each bot action at normal speed
+_BOT_ACTION_DELAY = 0.8
+
+
+@lru_cache(maxsize=64)
+def _player_name_markup(name: str, is_hero: bool, folded: bool) -> str:
+    """Markup for a name in the player table; the few distinct results are reused."""
+    player_name = f"[bold cyan]{name}[/bold cyan]" if is_hero else name
+    # Add FOLDED label to player name if they folded
+    if folded:
+        player_name += _NAME_FOLDED_SUFFIX
+    return player_name
 
 
 class PokerUI:
     """Handles all UI rendering and input."""
 
-    def __init__(self):
+    def __init__(self, bot_action_delay: float = _BOT_ACTION_DELAY):
         self.console = Console()
+        self.bot_action_delay = bot_action_delay
+        # Renderables for the current frame, written out in one print by _flush()
+        self._line_buffer: List[RenderableType] = []
+        # Last (key, renderable) built for each show_game_state region
+        self._panel_cache: Dict[str, Tuple[Any, RenderableType]] = {}
+
+        # Tables whose contents never change, built once and reprinted as is
+        menu_table = Table(show_header=False, box=box.ROUNDED, border_style="cyan")
+        menu_table.add_column("Option", style="bold yellow")
+        menu_table.add_column("Description")
+        menu_table.add_row("1", "Play Poker")
+        menu_table.add_row("2", "Visit Store")
+        menu_table.add_row("3", "View Stats")
+        menu_table.add_row("4", "Exit")
+        self._main_menu_table = menu_table
+
+        store_table = Table(show_header=True, box=box.ROUNDED, border_style="yellow")
+        store_table.add_column("Item", style="bold")
+        store_table.add_column("Cost", justify="right", style="green")
+        store_table.add_row("Free Chips", "$500 - FREE!")
+        self._store_table = store_table
+
+        difficulty_table = Table(show_header=False, box=box.ROUNDED, border_style="yellow")
+        difficulty_table.add_column("Level", style="bold")
+        difficulty_table.add_column("Description")
+        difficulty_table.add_row("easy", "Passive bots, rarely bluff")
+        difficulty_table.add_row("medium", "Balanced play, moderate bluffing")
+        difficulty_table.add_row("hard", "Aggressive bots, frequent bluffs")
+        self._difficulty_table = difficulty_table
+
+        check_bet_table = self._action_table()
+        check_bet_table.add_row("check", "Pass the action (no bet)")
+        check_bet_table.add_row("bet", "Make the first bet")
+        self._check_bet_table = check_bet_table
+
+    @staticmethod
+    def _action_table() -> Table:
+        """Empty two-column table for the betting options."""
+        action_table = Table(show_header=False, box=box.ROUNDED, border_style="yellow")
+        action_table.add_column("Action", style="bold")
+        action_table.add_column("Description")
+        return action_table
+
+    def set_speed(self, multiplier: float):
+        """Scale how fast bot actions play out, e.g. 2 halves the pause after each."""
+        self.bot_action_delay = _BOT_ACTION_DELAY / multiplier
 
     def clear(self):
         """Clear the console."""
         self.console.clear()
 
+    def _flush(self, clear: bool = False):
+        """Write the buffered frame, after clearing the screen if asked, in one write."""
+        # Inside the console context rich holds all output and writes it on exit
+        with self.console:
+            if clear:
+                self.console.clear()
+            self.console.print(Group(*self._line_buffer))
+        self._line_buffer.clear()
+
+    def _buffer_title(self):
+        """Queue the title panel at the top of the current frame."""
+        self._line_buffer.append(_TITLE_PANEL)
+        self._line_buffer.append(Text(""))
+
     def show_title(self):
         """Show game title."""
-        title = Text("POKER LEARNING GAME", style="bold magenta", justify="center")
-        self.console.print(Panel(title, border_style="bright_blue"))
-        self.console.print()
+        self._buffer_title()
+        self._flush()
 
     def show_main_menu(self) -> str:
         """Show main menu and get user choice."""
-        self.clear()
-        self.show_title()
+        self._buffer_title()
 
-        menu_table = Table(show_header=False, box=box.ROUNDED, border_style="cyan")
-        menu_table.add_column("Option", style="bold yellow")
-        menu_table.add_column("Description")
+        self._line_buffer.append(self._main_menu_table)
+        self._line_buffer.append(Text(""))
 
-        menu_table.add_row("1", "Play Poker")
-        menu_table.add_row("2", "Visit Store")
-        menu_table.add_row("3", "View Stats")
-        menu_table.add_row("4", "Exit")
-
-        self.console.print(menu_table)
-        self.console.print()
+        self._flush(clear=True)
 
-        return Prompt.ask("Choose an option", choices=["1", "2", "3", "4"], default="1")
+        return Prompt.ask("Choose an option", choices=_MAIN_MENU_CHOICES, default="1")
 
     def show_game_state(self, player: Player, all_players: List[Player],
                        community_cards: List[Card], pot: int, current_bet: int,
                        dealer_position: int):
         """Show current game state."""
-        self.clear()
-        self.show_title()
-
+        self._buffer_title()
+
+        buf = self._line_buffer
+        buf.append(self._cached("community", tuple(community_cards),
+                                self._community_panel, community_cards))
+        buf.append(self._cached("pot", (pot, current_bet),
+                                self._pot_panel, pot, current_bet))
+        table_key = (dealer_position,) + tuple(
+            (p is player, p.name, p.chips, p.current_bet, p.folded, p.all_in)
+            for p in all_players)
+        buf.append(self._cached("players", table_key, self._player_table,
+                                player, all_players, dealer_position))
+        buf.append(Text(""))
+        buf.append(self._cached("hand", (tuple(player.hand), tuple(community_cards)),
+                                self._hand_panel, player, community_cards))
+        buf.append(Text(""))
+        self._flush(clear=True)
+
+    def _cached(self, region: str, key, build, *args) -> RenderableType:
+        """Return the renderable last built for region, rebuilding it if key changed."""
+        hit = self._panel_cache.get(region)
+        if hit is None or hit[0] != key:
+            hit = (key, build(*args))
+            self._panel_cache[region] = hit
+        return hit[1]
+
+    def _community_panel(self, community_cards: List[Card]) -> Panel:
         # Community cards - Make them MUCH more visible
         if community_cards:
             # Create large, spaced out card display
-            cards_display = "     ".join(f"[bold white on blue] {card} [/bold white on blue]" for card in community_cards)
+            cards = _CARD_GAP.join([_CARD_LABELS[card] for card in community_cards])
+            cards_display = f"[bold white on blue] {cards} [/bold white on blue]"
             stage = ""
             if len(community_cards) == 3:
                 stage = "FLOP"
@@ -66,25 +179,25 @@ class PokerUI:
             elif len(community_cards) == 5:
                 stage = "RIVER"
 
-            self.console.print(Panel(
+            return Panel(
                 f"[bold yellow]{stage}[/bold yellow]\n\n{cards_display}",
                 title="[bold green]COMMUNITY CARDS[/bold green]",
                 border_style="bright_green",
                 padding=(1, 2)
-            ))
-        else:
-            self.console.print(Panel(
-                "[bold yellow]PRE-FLOP[/bold yellow]\n\n[dim]No community cards yet[/dim]",
-                title="[bold green]COMMUNITY CARDS[/bold green]",
-                border_style="green",
-                padding=(1, 2)
-            ))
+            )
+        return Panel(
+            "[bold yellow]PRE-FLOP[/bold yellow]\n\n[dim]No community cards yet[/dim]",
+            title="[bold green]COMMUNITY CARDS[/bold green]",
+            border_style="green",
+            padding=(1, 2)
+        )
 
-        # Pot info
+    def _pot_panel(self, pot: int, current_bet: int) -> Panel:
         pot_text = f"[bold yellow]Pot:[/bold yellow] ${pot}  [bold yellow]Current Bet:[/bold yellow] ${current_bet}"
-        self.console.print(Panel(pot_text, border_style="yellow"))
+        return Panel(pot_text, border_style="yellow")
 
-        # Players
+    def _player_table(self, player: Player, all_players: List[Player],
+                      dealer_position: int) -> Table:
         player_table = Table(show_header=True, box=box.ROUNDED, border_style="blue")
         player_table.add_column("Player", style="bold")
         player_table.add_column("Chips", justify="right", style="green")
@@ -92,49 +205,45 @@ class PokerUI:
         player_table.add_column("Status", style="cyan")
 
         for i, p in enumerate(all_players):
-            status = ""
             if p.folded:
-                status = "[bold red on white]FOLDED[/bold red on white]"
+                status = _STATUS_FOLDED
             elif p.all_in:
-                status = "[magenta]All In[/magenta]"
+                status = _STATUS_ALL_IN
             else:
-                status = "[green]Active[/green]"
+                status = _STATUS_ACTIVE
 
             if i == dealer_position:
-                status += " [bold](D)[/bold]"
-
-            name_style = "bold cyan" if p == player else ""
-            player_name = f"[{name_style}]{p.name}[/{name_style}]" if name_style else p.name
-
-            # Add FOLDED label to player name if they folded
-            if p.folded:
-                player_name = f"{player_name} [bold red]✗ FOLDED[/bold red]"
+                status += _DEALER_TAG
 
             player_table.add_row(
-                player_name,
+                _player_name_markup(p.name, p is player, p.folded),
                 f"${p.chips}",
                 f"${p.current_bet}",
                 status
             )
+        return player_table
 
-        self.console.print(player_table)
-        self.console.print()
-
+    def _hand_panel(self, player: Player, community_cards: List[Card]) -> Panel:
         # Player's hand - Make it more visible
-        hand_cards = "     ".join(f"[bold black on white] {card} [/bold black on white]" for card in player.hand)
+        cards = _CARD_GAP.join([_CARD_LABELS[card] for card in player.hand])
+        hand_cards = f"[bold black on white] {cards} [/bold black on white]" if cards else ""
         if len(player.hand) == 2 and len(community_cards) >= 3:
-            hand_name = HandEvaluator.get_hand_name(player.hand + community_cards)
+            # Evaluate from packed keys rather than a concatenated card list
+            board_key = 0
+            for card in community_cards:
+                board_key |= card.bit
+            hand_rank, _ = HandEvaluator.evaluate_packed(player.hand_key | board_key)
+            hand_name = HandRank.NAMES[hand_rank]
             hand_info = f"{hand_cards}\n\n[dim]Current Hand: {hand_name}[/dim]"
         else:
             hand_info = hand_cards
 
-        self.console.print(Panel(
+        return Panel(
             hand_info,
             title="[bold cyan]YOUR HAND[/bold cyan]",
             border_style="bright_cyan",
             padding=(1, 2)
-        ))
-        self.console.print()
+        )
 
     def ask_educational_question(self, question: str, hint: str = "") -> str:
         """Ask an educational question."""
@@ -150,24 +259,20 @@ class PokerUI:
 
     def show_feedback(self, is_correct: bool, feedback: str, show_outs: Optional[str] = None):
         """Show feedback on answer."""
-        if is_correct:
-            self.console.print(Panel(
-                f"[bold green]✓ {feedback}[/bold green]",
-                border_style="green"
-            ))
-        else:
-            self.console.print(Panel(
-                f"[bold red]✗ {feedback}[/bold red]",
-                border_style="red"
-            ))
+        color, mark = _FEEDBACK_STYLES[bool(is_correct)]
+        self._line_buffer.append(Panel(
+            f"[bold {color}]{mark} {feedback}[/bold {color}]",
+            border_style=color
+        ))
 
         if show_outs:
-            self.console.print(Panel(
+            self._line_buffer.append(Panel(
                 f"[yellow]Out Cards:[/yellow]\n{show_outs}",
                 border_style="yellow"
             ))
 
-        self.console.print()
+        self._line_buffer.append(Text(""))
+        self._flush()
         Prompt.ask("[dim]Press Enter to continue[/dim]", default="")
 
     def get_player_action(self, current_bet: int, player_bet: int, player_chips: int,
@@ -186,21 +291,16 @@ class PokerUI:
             if player_chips > call_amount:
                 options.append("raise")
 
-        # Show options
-        action_table = Table(show_header=False, box=box.ROUNDED, border_style="yellow")
-        action_table.add_column("Action", style="bold")
-        action_table.add_column("Description")
-
-        if "fold" in options:
+        # Show options. Check/bet never varies; facing a bet shows live amounts.
+        if call_amount == 0:
+            action_table = self._check_bet_table
+        else:
+            action_table = self._action_table()
             action_table.add_row("fold", "Give up your hand")
-        if "check" in options:
-            action_table.add_row("check", "Pass the action (no bet)")
-        if "call" in options:
-            action_table.add_row("call", f"Match the current bet (${call_amount})")
-        if "bet" in options:
-            action_table.add_row("bet", "Make the first bet")
-        if "raise" in options:
-            action_table.add_row("raise", f"Increase the bet (min ${min_raise})")
+            if "call" in options:
+                action_table.add_row("call", f"Match the current bet (${call_amount})")
+            if "raise" in options:
+                action_table.add_row("raise", f"Increase the bet (min ${min_raise})")
 
         self.console.print(action_table)
 
@@ -231,25 +331,28 @@ class PokerUI:
         for player, amount, hand_name in winners:
             winner_table.add_row(player.name, hand_name, f"${amount}")
 
-        self.console.print()
-        self.console.print(Panel(
+        self._line_buffer.append(Text(""))
+        self._line_buffer.append(Panel(
             winner_table,
             title="[bold]Hand Results[/bold]",
             border_style="gold1"
         ))
-        self.console.print()
+        self._line_buffer.append(Text(""))
+        self._flush()
 
-    def show_message(self, message: str, style: str = ""):
+    def show_message(self, message: str, style: str = "", end: str = "\n"):
         """Show a message."""
         if style:
-            self.console.print(f"[{style}]{message}[/{style}]")
+            self.console.print(f"[{style}]{message}[/{style}]", end=end)
         else:
-            self.console.print(message)
+            self.console.print(message, end=end)
+
+    def show_text(self, text: str):
+        """Show raw text (no markup) without a trailing newline, e.g. a streamed chunk."""
+        self.console.print(text, end="", markup=False, highlight=False)
 
     def show_bot_action(self, bot_name: str, action: str, amount: int = 0):
         """Show bot's action with a pause for visibility."""
-        import time
-
         if action == "fold":
             msg = f"  {bot_name} folds"
             style = "red"
@@ -267,42 +370,37 @@ class PokerUI:
             style = ""
 
         self.console.print(f"[{style}]► {msg}[/{style}]")
-        time.sleep(0.8)  # Pause to make bot actions visible
+        if self.bot_action_delay > 0:
+            time.sleep(self.bot_action_delay)  # Pause to make bot actions visible
 
     def show_store(self, current_chips: int) -> Optional[int]:
         """Show store menu. Returns chips to add or None."""
-        self.clear()
-        self.show_title()
+        self._buffer_title()
 
-        self.console.print(Panel(
+        self._line_buffer.append(Panel(
             f"[bold cyan]Your Chips:[/bold cyan] ${current_chips}",
             border_style="green"
         ))
-        self.console.print()
-
-        store_table = Table(show_header=True, box=box.ROUNDED, border_style="yellow")
-        store_table.add_column("Item", style="bold")
-        store_table.add_column("Cost", justify="right", style="green")
+        self._line_buffer.append(Text(""))
 
-        store_table.add_row("Free Chips", "$500 - FREE!")
+        self._line_buffer.append(self._store_table)
+        self._line_buffer.append(Text(""))
 
-        self.console.print(store_table)
-        self.console.print()
+        self._flush(clear=True)
 
         choice = Prompt.ask(
             "[cyan]Get free chips? (y/n/exit)[/cyan]",
-            choices=["y", "n", "yes", "no", "exit"],
+            choices=_STORE_CHOICES,
             default="y"
         ).lower()
 
-        if choice in ["y", "yes"]:
+        if choice in _STORE_YES:
             return 500
         return None
 
     def show_stats(self, player: Player):
         """Show player stats."""
-        self.clear()
-        self.show_title()
+        self._buffer_title()
 
         stats_table = Table(show_header=False, box=box.ROUNDED, border_style="cyan")
         stats_table.add_column("Stat", style="bold yellow")
@@ -311,8 +409,10 @@ class PokerUI:
         stats_table.add_row("Player Name", player.name)
         stats_table.add_row("Current Chips", f"${player.chips}")
 
-        self.console.print(Panel(stats_table, title="[bold]Player Statistics[/bold]"))
-        self.console.print()
+        self._line_buffer.append(Panel(stats_table, title="[bold]Player Statistics[/bold]"))
+        self._line_buffer.append(Text(""))
+
+        self._flush(clear=True)
 
         Prompt.ask("[dim]Press Enter to continue[/dim]", default="")
 
@@ -323,31 +423,22 @@ class PokerUI:
     def ask_bot_difficulty(self) -> str:
         """Ask for bot difficulty level."""
         self.console.print()
-        difficulty_table = Table(show_header=False, box=box.ROUNDED, border_style="yellow")
-        difficulty_table.add_column("Level", style="bold")
-        difficulty_table.add_column("Description")
-
-        difficulty_table.add_row("easy", "Passive bots, rarely bluff")
-        difficulty_table.add_row("medium", "Balanced play, moderate bluffing")
-        difficulty_table.add_row("hard", "Aggressive bots, frequent bluffs")
-
-        self.console.print(difficulty_table)
+        self.console.print(self._difficulty_table)
         self.console.print()
 
         return Prompt.ask(
             "[cyan]Select bot difficulty[/cyan]",
-            choices=["easy", "medium", "hard"],
+            choices=_DIFFICULTY_CHOICES,
             default="medium"
         )
 
     def show_game_over(self, won: bool):
         """Show game over screen."""
-        self.clear()
-
         if won:
             msg = "[bold green]Congratulations! You won all the chips![/bold green]"
         else:
             msg = "[bold red]Game Over! You ran out of chips.[/bold red]"
 
-        self.console.print(Panel(msg, border_style="yellow"))
-        self.console.print()
+        self._line_buffer.append(Panel(msg, border_style="yellow"))
+        self._line_buffer.append(Text(""))
+        self._flush(clear=True)